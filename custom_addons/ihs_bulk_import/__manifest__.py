@@ -0,0 +1,24 @@
+{
+    "name": "IHS Bulk Import",
+    "version": "18.0.1.0.0",
+    "summary": "Streaming, resumable CSV/XLSX imports for millions of rows.",
+    "description": """
+Imports large CSV and XLSX files in fixed-size chunks: rows are coerced and
+validated per chunk, external IDs are resolved with one query per chunk and
+target model, and records are written with one batched call per chunk. The
+progress is committed together with each chunk, so an interrupted import
+resumes where it stopped and memory stays flat as the file grows.
+""",
+    "author": "ihs-odoo",
+    "category": "Tools",
+    "license": "LGPL-3",
+    "depends": ["base"],
+    "external_dependencies": {"python": ["openpyxl"]},
+    "data": [
+        "security/ir.model.access.csv",
+        "data/ir_cron.xml",
+        "views/bulk_import_job_views.xml",
+    ],
+    "installable": True,
+    "application": False,
+}
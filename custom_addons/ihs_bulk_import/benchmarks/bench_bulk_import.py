@@ -0,0 +1,142 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Measure the streaming import pipeline on synthetic product files.
+
+Usage::
+
+    python custom_addons/ihs_bulk_import/benchmarks/bench_bulk_import.py
+    python custom_addons/ihs_bulk_import/benchmarks/bench_bulk_import.py --sizes 10000,100000,1000000,5000000
+
+Every size runs in a fresh process so its max RSS is its own. Rows go
+through reading, coercion, batched external ID resolution and a checkpoint
+per chunk; the sink only counts them, so the numbers are those of the
+pipeline itself, without the ORM writes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tools import DictResolver, FieldSpec, ImportPipeline, JsonCheckpoint, open_reader
+
+HEADER = ["id", "name", "default_code", "list_price", "active", "categ_id/id", "create_date"]
+FIELDS = {
+    "name": FieldSpec("char", required=True),
+    "default_code": FieldSpec("char"),
+    "list_price": FieldSpec("float"),
+    "active": FieldSpec("boolean"),
+    "categ_id": FieldSpec("many2one", relation="product.category"),
+    "create_date": FieldSpec("datetime"),
+}
+CATEGORIES = 100
+
+
+class CountingSink:
+    """Sink that only counts the rows it is given."""
+
+    def __init__(self) -> None:
+        """Start at zero."""
+        self.rows = 0
+
+    def write(self, model: str, chunk: object) -> list:  # noqa: ARG002
+        """Count the valid rows of ``chunk``."""
+        self.rows += len(chunk.values)
+        return []
+
+
+def synthetic_row(index: int) -> list[str]:
+    """Return row ``index`` of the synthetic product file."""
+    return [
+        f"bench_product_{index}",
+        f'Product {index}, "quoted" name',
+        f"REF-{index:08d}",
+        f"{index % 1000 + 0.99:.2f}",
+        "1" if index % 10 else "0",
+        f"bench_categ_{index % CATEGORIES}",
+        f"2026-01-{index % 28 + 1:02d} 12:00:00",
+    ]
+
+
+def write_file(path: Path, rows: int, file_type: str) -> None:
+    """Write a synthetic import file of ``rows`` rows without holding it in memory."""
+    if file_type == "csv":
+        with path.open("w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(HEADER)
+            writer.writerows(synthetic_row(index) for index in range(rows))
+        return
+    import openpyxl  # noqa: PLC0415
+
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(HEADER)
+    for index in range(rows):
+        sheet.append(synthetic_row(index))
+    workbook.save(path)
+
+
+def run_import(path: str, chunk_size: int) -> dict[str, float]:
+    """Import ``path`` in the current process; return throughput and max RSS."""
+    resolver = DictResolver(
+        {"product.category": {f"__import__.bench_categ_{i}": i + 1 for i in range(CATEGORIES)}},
+    )
+    sink = CountingSink()
+    checkpoint = JsonCheckpoint(f"{path}.checkpoint.json")
+    pipeline = ImportPipeline(
+        open_reader(path), "product.template", FIELDS, resolver, sink, chunk_size=chunk_size,
+    )
+    start = time.perf_counter()
+    progress = None
+    for progress in pipeline.run():
+        checkpoint.save(progress)
+    elapsed = time.perf_counter() - start
+    checkpoint.clear()
+    return {
+        "rows": progress.rows_read,
+        "imported": sink.rows,
+        "failed": progress.rows_failed,
+        "lookups": resolver.lookups,
+        "seconds": elapsed,
+        "max_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Streaming import benchmark")
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="comma separated row counts")
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--format", choices=("csv", "xlsx"), default="csv")
+    args = parser.parse_args(argv)
+
+    out = sys.stdout
+    out.write(f"format={args.format} chunk_size={args.chunk_size}\n")
+    out.write(f"{'rows':>9} {'file MiB':>9} {'seconds':>9} {'rows/s':>9} {'lookups':>8} {'max RSS MiB':>12}\n")
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory(prefix="bench_bulk_import_") as tmp:
+        for size in (int(value) for value in args.sizes.split(",")):
+            path = Path(tmp, f"products_{size}.{args.format}")
+            write_file(path, size, args.format)
+            with context.Pool(1) as pool:
+                result = pool.apply(run_import, (str(path), args.chunk_size))
+            out.write(
+                f"{result['rows']:>9} {path.stat().st_size / 2**20:>9.1f} {result['seconds']:>9.2f} "
+                f"{result['rows'] / result['seconds']:>9.0f} {result['lookups']:>8} "
+                f"{result['max_rss_kib'] / 1024:>12.1f}\n",
+            )
+            out.flush()
+            path.unlink()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+from . import bulk_import_job
@@ -0,0 +1,228 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from odoo import _, api, fields, models
+from odoo.addons.ihs_bulk_import.tools import (
+    FieldSpec,
+    ImportPipeline,
+    ImportProgress,
+    ReaderError,
+    RowError,
+    SchemaError,
+    open_reader,
+)
+from odoo.exceptions import UserError, ValidationError
+from odoo.tools import SQL
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from odoo.addons.ihs_bulk_import.tools import CoercedChunk, CsvReader, XlsxReader
+    from odoo.api import Environment
+
+_logger = logging.getLogger(__name__)
+
+
+class IrModelDataResolver:
+    """Resolve the external IDs of a chunk with one ``ir_model_data`` query per model."""
+
+    def __init__(self, env: Environment) -> None:
+        """Query through ``env``'s cursor."""
+        self.env = env
+
+    def resolve(self, model: str, xmlids: Iterable[str]) -> dict[str, int]:
+        """Return ``{xmlid: res_id}`` of the existing ``xmlids`` of ``model``."""
+        pairs = tuple(tuple(xmlid.split(".", 1)) for xmlid in xmlids)
+        if not pairs:
+            return {}
+        self.env.cr.execute(SQL(
+            "SELECT module, name, res_id FROM ir_model_data WHERE model = %s AND (module, name) IN %s",
+            model, pairs,
+        ))
+        return {f"{module}.{name}": res_id for module, name, res_id in self.env.cr.fetchall()}
+
+
+class OrmSink:
+    """Create or update a chunk of records in one ``_load_records`` call.
+
+    When the batch fails, rows are retried one by one under savepoints to
+    isolate the faulty ones; the rest of the chunk is still imported.
+    """
+
+    def __init__(self, env: Environment) -> None:
+        """Write through ``env``."""
+        self.env = env
+
+    def write(self, model: str, chunk: CoercedChunk) -> list[RowError]:
+        """Import ``chunk`` into ``model``; return the rows that failed."""
+        records = self.env[model].with_context(
+            tracking_disable=True, mail_create_nolog=True, mail_notrack=True, import_file=True,
+        )
+        data_list = [
+            {"xml_id": xmlid, "values": values, "noupdate": False}
+            for xmlid, values in zip(chunk.xmlids, chunk.values, strict=True)
+        ]
+        try:
+            with self.env.cr.savepoint():
+                records._load_records(data_list)  # noqa: SLF001
+        except Exception:  # noqa: BLE001
+            _logger.info("Batch of %d rows failed, retrying row by row", len(data_list))
+        else:
+            return []
+        errors = []
+        for number, data in zip(chunk.rows, data_list, strict=True):
+            try:
+                with self.env.cr.savepoint():
+                    records._load_records([data])  # noqa: SLF001
+            except Exception as exc:  # noqa: BLE001
+                errors.append(RowError(number, None, str(exc).splitlines()[0] if str(exc) else repr(exc)))
+        return errors
+
+
+class BulkImportJob(models.Model):
+    _name = "ihs.bulk.import.job"
+    _description = "Bulk Import Job"
+    _order = "id desc"
+
+    name = fields.Char(required=True)
+    model_name = fields.Char(string="Model", required=True, help="Technical name of the target model")
+    attachment_id = fields.Many2one("ir.attachment", string="File", required=True, ondelete="restrict")
+    file_type = fields.Selection([("csv", "CSV"), ("xlsx", "XLSX")], required=True, default="csv")
+    encoding = fields.Char(default="utf-8")
+    delimiter = fields.Char(default=",", size=1)
+    chunk_size = fields.Integer(default=5000, required=True)
+    state = fields.Selection(
+        [
+            ("draft", "Draft"),
+            ("queued", "Queued"),
+            ("running", "Running"),
+            ("done", "Done"),
+            ("failed", "Failed"),
+        ],
+        default="draft",
+        required=True,
+        copy=False,
+    )
+    position = fields.Char(readonly=True, copy=False, help="Where the next chunk starts in the file")
+    rows_read = fields.Integer(readonly=True, copy=False)
+    rows_imported = fields.Integer(readonly=True, copy=False)
+    rows_failed = fields.Integer(readonly=True, copy=False)
+    chunks_done = fields.Integer(readonly=True, copy=False)
+    duration = fields.Float(readonly=True, copy=False, help="Processing time in seconds")
+    error_log = fields.Text(readonly=True, copy=False)
+
+    @api.constrains("chunk_size")
+    def _check_chunk_size(self) -> None:
+        if any(job.chunk_size < 1 for job in self):
+            raise ValidationError(_("The chunk size must be positive."))
+
+    def action_start(self):
+        """Queue the jobs; the cron processes them in the background."""
+        if self.filtered(lambda job: job.state not in ("draft", "failed")):
+            raise UserError(_("Only draft or failed imports can be started."))
+        self.write({"state": "queued"})
+        self.env.ref("ihs_bulk_import.ir_cron_bulk_import")._trigger()  # noqa: SLF001
+
+    def action_reset(self):
+        """Forget the progress so the file is imported again from the start."""
+        self.write({
+            "state": "draft",
+            "position": False,
+            "rows_read": 0,
+            "rows_imported": 0,
+            "rows_failed": 0,
+            "chunks_done": 0,
+            "duration": 0.0,
+            "error_log": False,
+        })
+
+    @api.model
+    def _cron_process_jobs(self) -> None:
+        # running jobs were interrupted by a crash or a timeout, resume them first
+        jobs = self.search([("state", "in", ("running", "queued"))], order="state desc, id")
+        for job in jobs:
+            job._run()  # noqa: SLF001
+
+    def _import_fields(self) -> dict[str, FieldSpec]:
+        """Return the :class:`FieldSpec` of every importable field of the target model."""
+        model = self.env[self.model_name]
+        specs = {}
+        for name, field in model._fields.items():
+            if not field.store or (field.compute and not field.inverse) or name in models.MAGIC_COLUMNS:
+                continue
+            relation = field.comodel_name if field.type == "many2one" else None
+            specs[name] = FieldSpec(field.type, field.required and field.default is None, relation)
+        return specs
+
+    def _progress(self) -> ImportProgress:
+        return ImportProgress(
+            position=int(self.position) if self.position else None,
+            rows_read=self.rows_read,
+            rows_imported=self.rows_imported,
+            rows_failed=self.rows_failed,
+            chunks=self.chunks_done,
+            elapsed=self.duration,
+            errors=self.error_log.splitlines() if self.error_log else [],
+        )
+
+    def _save_progress(self, progress: ImportProgress) -> None:
+        self.write({
+            "position": str(progress.position) if progress.position is not None else False,
+            "rows_read": progress.rows_read,
+            "rows_imported": progress.rows_imported,
+            "rows_failed": progress.rows_failed,
+            "chunks_done": progress.chunks,
+            "duration": progress.elapsed,
+            "error_log": "\n".join(progress.errors) or False,
+        })
+
+    def _open_reader(self) -> CsvReader | XlsxReader:
+        attachment = self.attachment_id
+        if not attachment.store_fname:
+            raise UserError(_("The import file must be stored in the filestore."))
+        options = {}
+        if self.file_type == "csv":
+            options = {"encoding": self.encoding or "utf-8", "delimiter": self.delimiter or ","}
+        path = attachment._full_path(attachment.store_fname)  # noqa: SLF001
+        return open_reader(path, self.file_type, **options)
+
+    def _run(self) -> None:
+        """Import the remaining chunks, committing data and checkpoint together."""
+        self.ensure_one()
+        if self.model_name not in self.env:
+            self.write({"state": "failed", "error_log": _("Unknown model %s", self.model_name)})
+            self.env.cr.commit()
+            return
+        self.state = "running"
+        self.env.cr.commit()
+        try:
+            pipeline = ImportPipeline(
+                self._open_reader(),
+                self.model_name,
+                self._import_fields(),
+                IrModelDataResolver(self.env),
+                OrmSink(self.env),
+                chunk_size=self.chunk_size,
+            )
+            for progress in pipeline.run(self._progress()):
+                self._save_progress(progress)
+                self.env.cr.commit()
+                # drop the records of the chunk from the cache, memory stays flat
+                self.env.invalidate_all()
+                _logger.info(
+                    "Import %s: %d rows read, %d imported, %d failed",
+                    self.name, progress.rows_read, progress.rows_imported, progress.rows_failed,
+                )
+        except Exception as exc:
+            # a job left running would fail again on every cron run, ahead of the queue
+            self.env.cr.rollback()
+            if not isinstance(exc, (ReaderError, SchemaError, UnicodeDecodeError, OSError, UserError)):
+                _logger.exception("Import %s failed", self.name)
+            self.write({"state": "failed", "error_log": "\n".join(filter(None, [str(exc), self.error_log]))})
+        else:
+            self.state = "done"
+        self.env.cr.commit()
@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+from .pipeline import (
+    DictResolver,
+    ImportPipeline,
+    ImportProgress,
+    JsonCheckpoint,
+    Resolver,
+    Sink,
+)
+from .readers import Chunk, CsvReader, ReaderError, XlsxReader, open_reader
+from .schema import CoercedChunk, FieldSpec, ImportSchema, RowError, SchemaError, qualify_xmlid
@@ -0,0 +1,193 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Chunked import pipeline: read, coerce, resolve references, write, checkpoint.
+
+Only one chunk of rows is alive at a time, so memory stays flat whatever the
+size of the file. External IDs referenced by a chunk are resolved with one
+lookup per target model and chunk.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+from .schema import CoercedChunk, FieldSpec, ImportSchema, RowError, SchemaError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
+    from .readers import Chunk, CsvReader, XlsxReader
+
+DEFAULT_CHUNK_SIZE = 5000
+MAX_LOGGED_ERRORS = 200
+
+
+class Resolver(Protocol):
+    """Resolve external IDs of one model to database IDs."""
+
+    def resolve(self, model: str, xmlids: Iterable[str]) -> dict[str, int]:
+        """Return ``{xmlid: id}`` for the known ``xmlids``, with one lookup."""
+
+
+class Sink(Protocol):
+    """Write the valid rows of a chunk."""
+
+    def write(self, model: str, chunk: CoercedChunk) -> list[RowError]:
+        """Create or update ``chunk``'s records; return the rows that failed."""
+
+
+class DictResolver:
+    """Resolver over an in-memory ``{model: {xmlid: id}}`` mapping."""
+
+    def __init__(self, data: Mapping[str, Mapping[str, int]]) -> None:
+        """Resolve from ``data``."""
+        self.data = data
+        self.lookups = 0
+
+    def resolve(self, model: str, xmlids: Iterable[str]) -> dict[str, int]:
+        """Return the known ``xmlids`` of ``model``."""
+        self.lookups += 1
+        known = self.data.get(model, {})
+        return {xmlid: known[xmlid] for xmlid in xmlids if xmlid in known}
+
+
+@dataclass
+class ImportProgress:
+    """Where an import stands; persisted after every chunk to resume it."""
+
+    position: int | None = None
+    rows_read: int = 0
+    rows_imported: int = 0
+    rows_failed: int = 0
+    chunks: int = 0
+    elapsed: float = 0.0
+    errors: list[str] = field(default_factory=list)
+
+    def record(self, chunk: Chunk, imported: int, errors: list[RowError], elapsed: float) -> None:
+        """Account for a processed chunk."""
+        self.position = chunk.position
+        self.rows_read += len(chunk.rows)
+        self.rows_imported += imported
+        self.rows_failed += len(errors)
+        self.chunks += 1
+        self.elapsed += elapsed
+        room = MAX_LOGGED_ERRORS - len(self.errors)
+        self.errors.extend(str(error) for error in errors[: max(room, 0)])
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable copy."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> ImportProgress:
+        """Rebuild progress saved with :meth:`to_dict`."""
+        return cls(**data)
+
+
+class JsonCheckpoint:
+    """Progress of one import kept in a JSON file, for imports run outside Odoo."""
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Persist progress at ``path``."""
+        self.path = Path(path)
+
+    def load(self) -> ImportProgress | None:
+        """Return the saved progress, if any."""
+        try:
+            return ImportProgress.from_dict(json.loads(self.path.read_text()))
+        except FileNotFoundError:
+            return None
+
+    def save(self, progress: ImportProgress) -> None:
+        """Atomically replace the saved progress."""
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+        with os.fdopen(fd, "w") as tmp:
+            json.dump(progress.to_dict(), tmp)
+        Path(tmp_name).replace(self.path)
+
+    def clear(self) -> None:
+        """Forget the saved progress."""
+        self.path.unlink(missing_ok=True)
+
+
+class ImportPipeline:
+    """Import a file into ``model`` chunk by chunk."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        reader: CsvReader | XlsxReader,
+        model: str,
+        fields: Mapping[str, FieldSpec],
+        resolver: Resolver,
+        sink: Sink,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """Wire the pipeline stages; nothing is read before :meth:`run`."""
+        self.reader = reader
+        self.model = model
+        self.fields = fields
+        self.resolver = resolver
+        self.sink = sink
+        self.chunk_size = chunk_size
+
+    def schema(self) -> ImportSchema:
+        """Bind the file header to the model fields."""
+        schema = ImportSchema(self.reader.header, self.fields)
+        if schema.missing_required:
+            msg = f"Missing required columns: {', '.join(schema.missing_required)}"
+            raise SchemaError(msg)
+        return schema
+
+    def run(self, progress: ImportProgress | None = None) -> Iterator[ImportProgress]:
+        """Process the remaining chunks, yielding the progress after each one.
+
+        The caller persists the yielded progress (and commits) before asking for
+        the next chunk; a later run with that progress resumes after it.
+        """
+        progress = progress or ImportProgress()
+        schema = self.schema()
+        relations = schema.relations()
+        chunks = self.reader.chunks(self.chunk_size, progress.position, progress.rows_read + 1)
+        for chunk in chunks:
+            start = time.perf_counter()
+            coerced = schema.coerce(chunk.rows, chunk.start_row)
+            if relations:
+                coerced = self._resolve(coerced, relations)
+            errors = coerced.errors
+            if coerced.values:
+                errors = errors + self.sink.write(self.model, coerced)
+            imported = len(chunk.rows) - len(errors)
+            progress.record(chunk, imported, errors, time.perf_counter() - start)
+            yield progress
+
+    def _resolve(self, coerced: CoercedChunk, relations: Mapping[str, str]) -> CoercedChunk:
+        """Replace external ID references by IDs, one lookup per comodel."""
+        by_model: dict[str, set[str]] = {}
+        for references in coerced.references:
+            for field_name, xmlid in references.items():
+                by_model.setdefault(relations[field_name], set()).add(xmlid)
+        ids = {model: self.resolver.resolve(model, xmlids) for model, xmlids in by_model.items()}
+
+        result = CoercedChunk(errors=coerced.errors)
+        for number, xmlid, values, references in zip(
+            coerced.rows, coerced.xmlids, coerced.values, coerced.references, strict=True,
+        ):
+            for field_name, ref in references.items():
+                record_id = ids[relations[field_name]].get(ref)
+                if record_id is None:
+                    result.errors.append(RowError(number, f"{field_name}/id", f"no record {ref}"))
+                    break
+                values[field_name] = record_id
+            else:
+                result.rows.append(number)
+                result.xmlids.append(xmlid)
+                result.values.append(values)
+                result.references.append(references)
+        return result
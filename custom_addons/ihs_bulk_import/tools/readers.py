@@ -0,0 +1,157 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Incremental CSV and XLSX readers yielding fixed-size chunks of rows.
+
+Both readers expose a resume ``position`` after every chunk: the file offset
+of the next row for CSV, the next row number for XLSX. Feeding it back to
+:meth:`chunks` continues right after the last chunk that was processed.
+"""
+
+from __future__ import annotations
+
+import csv
+import itertools
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterator
+
+
+class ReaderError(ValueError):
+    """Raised when a file cannot be read as an import source."""
+
+
+@dataclass
+class Chunk:
+    """Rows ``start_row`` to ``start_row + len(rows) - 1`` of a file (1 = first data row)."""
+
+    index: int
+    start_row: int
+    rows: list[list[str]]
+    position: int
+
+
+class CsvReader:
+    """Read a CSV file with a header line, one chunk of rows at a time."""
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        encoding: str = "utf-8",
+        delimiter: str = ",",
+        quotechar: str = '"',
+    ) -> None:
+        """Open nothing yet; the header is read on first access."""
+        self.path = Path(path)
+        self.encoding = encoding
+        self.dialect = {"delimiter": delimiter, "quotechar": quotechar}
+        self._header: list[str] | None = None
+        self._data_start: int | None = None
+
+    @property
+    def header(self) -> list[str]:
+        """Column names from the first line."""
+        if self._header is None:
+            with self.path.open(encoding=self.encoding, newline="") as handle:
+                reader = csv.reader(iter(handle.readline, ""), **self.dialect)
+                try:
+                    self._header = [name.strip() for name in next(reader)]
+                except StopIteration:
+                    msg = f"{self.path.name} is empty"
+                    raise ReaderError(msg) from None
+                self._data_start = handle.tell()
+        return self._header
+
+    def chunks(
+        self, chunk_size: int, position: int | None = None, start_row: int = 1,
+    ) -> Iterator[Chunk]:
+        """Yield chunks of at most ``chunk_size`` rows from ``position`` on."""
+        width = len(self.header)
+        with self.path.open(encoding=self.encoding, newline="") as handle:
+            handle.seek(self._data_start if position is None else position)
+            # reading through readline() keeps tell() usable between rows
+            reader = csv.reader(iter(handle.readline, ""), **self.dialect)
+            for index in itertools.count():
+                rows = list(itertools.islice(reader, chunk_size))
+                if not rows:
+                    return
+                for row in rows:
+                    if len(row) < width:
+                        row.extend([""] * (width - len(row)))
+                yield Chunk(index, start_row, rows, handle.tell())
+                start_row += len(rows)
+
+
+class XlsxReader:
+    """Read the first sheet of an XLSX file in read-only (streaming) mode."""
+
+    def __init__(self, path: str | os.PathLike[str], sheet: str | None = None) -> None:
+        """Open nothing yet; the header is read on first access."""
+        if openpyxl is None:
+            msg = "Reading XLSX files requires the openpyxl library"
+            raise ReaderError(msg)
+        self.path = Path(path)
+        self.sheet = sheet
+        self._header: list[str] | None = None
+
+    def _rows(self, min_row: int) -> Iterator[list[str]]:
+        workbook = openpyxl.load_workbook(self.path, read_only=True, data_only=True)
+        try:
+            sheet = workbook[self.sheet] if self.sheet else workbook.worksheets[0]
+            for values in sheet.iter_rows(min_row=min_row, values_only=True):
+                yield ["" if value is None else str(value) for value in values]
+        finally:
+            workbook.close()
+
+    @property
+    def header(self) -> list[str]:
+        """Column names from the first row."""
+        if self._header is None:
+            rows = self._rows(1)
+            try:
+                self._header = [name.strip() for name in next(rows)]
+            except StopIteration:
+                msg = f"{self.path.name} is empty"
+                raise ReaderError(msg) from None
+            finally:
+                rows.close()
+        return self._header
+
+    def chunks(
+        self, chunk_size: int, position: int | None = None, start_row: int = 1,
+    ) -> Iterator[Chunk]:
+        """Yield chunks of at most ``chunk_size`` rows from sheet row ``position`` on."""
+        width = len(self.header)
+        next_row = position or 2
+        rows_iter = self._rows(next_row)
+        try:
+            for index in itertools.count():
+                rows = [row[:width] + [""] * (width - len(row)) for row in itertools.islice(rows_iter, chunk_size)]
+                if not rows:
+                    return
+                next_row += len(rows)
+                yield Chunk(index, start_row, rows, next_row)
+                start_row += len(rows)
+        finally:
+            rows_iter.close()
+
+
+def open_reader(
+    path: str | os.PathLike[str], file_type: str | None = None, **options: str,
+) -> CsvReader | XlsxReader:
+    """Return the reader for ``path``, guessing the type from its extension."""
+    file_type = file_type or Path(path).suffix.lstrip(".").lower()
+    if file_type == "csv":
+        return CsvReader(path, **options)
+    if file_type == "xlsx":
+        return XlsxReader(path, **options)
+    msg = f"Unsupported import file type {file_type!r}"
+    raise ReaderError(msg)
@@ -0,0 +1,195 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Column types and per-chunk coercion of raw import rows.
+
+Header conventions follow Odoo's import: ``id`` is the external ID of the
+record, ``<field>/id`` an external ID reference and ``<field>/.id`` a
+database ID reference for relational fields.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+
+IMPORT_MODULE = "__import__"
+
+TRUE_VALUES = frozenset({"1", "true", "yes", "y", "t"})
+FALSE_VALUES = frozenset({"0", "false", "no", "n", "f"})
+
+
+class SchemaError(ValueError):
+    """Raised when the header does not match the target fields."""
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """What the importer needs to know about a target field."""
+
+    type: str
+    required: bool = False
+    relation: str | None = None
+
+
+@dataclass
+class RowError:
+    """Why one row of the file was rejected."""
+
+    row: int
+    column: str | None
+    message: str
+
+    def __str__(self) -> str:
+        """Format as ``row N, column: message``."""
+        where = f"row {self.row}" + (f", {self.column}" if self.column else "")
+        return f"{where}: {self.message}"
+
+
+def qualify_xmlid(xmlid: str) -> str:
+    """Prefix external IDs without a module the way Odoo's import does."""
+    return xmlid if "." in xmlid else f"{IMPORT_MODULE}.{xmlid}"
+
+
+def _to_bool(value: str) -> bool:
+    lowered = value.lower()
+    if lowered in TRUE_VALUES:
+        return True
+    if lowered in FALSE_VALUES:
+        return False
+    msg = f"{value!r} is not a boolean"
+    raise ValueError(msg)
+
+
+def _to_date(value: str) -> dt.date:
+    return dt.date.fromisoformat(value)
+
+
+def _to_datetime(value: str) -> dt.datetime:
+    return dt.datetime.fromisoformat(value)
+
+
+COERCERS: dict[str, Callable[[str], Any]] = {
+    "char": str,
+    "text": str,
+    "html": str,
+    "selection": str,
+    "integer": int,
+    "float": float,
+    "monetary": float,
+    "boolean": _to_bool,
+    "date": _to_date,
+    "datetime": _to_datetime,
+}
+
+RELATIONAL_TYPES = frozenset({"many2one"})
+
+
+@dataclass
+class Column:
+    """One header column bound to a target field."""
+
+    index: int
+    header: str
+    field: str
+    kind: str
+    required: bool
+    relation: str | None = None
+    coerce: Callable[[str], Any] | None = None
+
+
+@dataclass
+class CoercedChunk:
+    """Values of the valid rows of a chunk, and the errors of the others."""
+
+    rows: list[int] = field(default_factory=list)
+    xmlids: list[str | None] = field(default_factory=list)
+    values: list[dict[str, Any]] = field(default_factory=list)
+    references: list[dict[str, str]] = field(default_factory=list)
+    errors: list[RowError] = field(default_factory=list)
+
+
+class ImportSchema:
+    """Map header columns to fields and coerce raw rows chunk by chunk."""
+
+    def __init__(self, header: Sequence[str], fields: Mapping[str, FieldSpec]) -> None:
+        """Bind every column of ``header`` to one of ``fields``."""
+        self.xmlid_index: int | None = None
+        self.columns: list[Column] = []
+        seen = set()
+        for index, name in enumerate(header):
+            if not name:
+                continue
+            if name == "id":
+                self.xmlid_index = index
+                continue
+            self.columns.append(self._column(index, name, fields))
+            if name.split("/")[0] in seen:
+                msg = f"Field {name.split('/')[0]!r} appears in several columns"
+                raise SchemaError(msg)
+            seen.add(name.split("/")[0])
+        self.missing_required = sorted(
+            name for name, spec in fields.items() if spec.required and name not in seen
+        )
+
+    @staticmethod
+    def _column(index: int, name: str, fields: Mapping[str, FieldSpec]) -> Column:
+        field_name, _, suffix = name.partition("/")
+        spec = fields.get(field_name)
+        if spec is None:
+            msg = f"Unknown field {field_name!r} in column {name!r}"
+            raise SchemaError(msg)
+        if spec.type in RELATIONAL_TYPES:
+            if suffix == "id":
+                return Column(index, name, field_name, "xmlid", spec.required, spec.relation)
+            if suffix == ".id":
+                return Column(index, name, field_name, "dbid", spec.required, spec.relation, int)
+            msg = f"Column {name!r} must reference records as '{field_name}/id' or '{field_name}/.id'"
+            raise SchemaError(msg)
+        coerce = COERCERS.get(spec.type)
+        if suffix or coerce is None:
+            msg = f"Column {name!r}: fields of type {spec.type} cannot be imported"
+            raise SchemaError(msg)
+        return Column(index, name, field_name, "value", spec.required, coerce=coerce)
+
+    def coerce(self, rows: Sequence[Sequence[str]], start_row: int) -> CoercedChunk:
+        """Convert ``rows`` to field values; invalid rows become errors."""
+        result = CoercedChunk()
+        columns = self.columns
+        xmlid_index = self.xmlid_index
+        for offset, row in enumerate(rows):
+            number = start_row + offset
+            values: dict[str, Any] = {}
+            references: dict[str, str] = {}
+            error = None
+            for column in columns:
+                raw = row[column.index].strip() if column.index < len(row) else ""
+                if not raw:
+                    if column.required:
+                        error = RowError(number, column.header, "value is required")
+                        break
+                    values[column.field] = False
+                elif column.kind == "xmlid":
+                    references[column.field] = qualify_xmlid(raw)
+                else:
+                    try:
+                        values[column.field] = column.coerce(raw)
+                    except ValueError as exc:
+                        error = RowError(number, column.header, str(exc))
+                        break
+            if error is not None:
+                result.errors.append(error)
+                continue
+            xmlid = row[xmlid_index].strip() if xmlid_index is not None else ""
+            result.rows.append(number)
+            result.xmlids.append(qualify_xmlid(xmlid) if xmlid else None)
+            result.values.append(values)
+            result.references.append(references)
+        return result
+
+    def relations(self) -> dict[str, str]:
+        """Return ``{field: comodel}`` of the external ID columns."""
+        return {column.field: column.relation for column in self.columns if column.kind == "xmlid"}
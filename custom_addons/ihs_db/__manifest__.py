@@ -0,0 +1,21 @@
+{
+    "name": "IHS Database Helpers",
+    "version": "18.0.1.0.0",
+    "summary": "Pooled PostgreSQL access with batched writes, COPY and chunked reads.",
+    "description": """
+Shared database helpers for custom addons:
+
+* a bounded, thread-safe connection pool configured from ``odoo.conf``
+  (``ihs_db_pool_size``, ``ihs_db_pool_timeout``);
+* batched writes through ``execute_values`` and ``COPY FROM STDIN`` streaming;
+* server-side named cursors yielding rows in chunks;
+* counters for pool wait time and round trips.
+""",
+    "author": "ihs-odoo",
+    "category": "Tools",
+    "license": "LGPL-3",
+    "depends": ["base"],
+    "data": [],
+    "installable": True,
+    "application": False,
+}
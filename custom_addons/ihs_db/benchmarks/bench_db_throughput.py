@@ -0,0 +1,124 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Compare write strategies of the pooled database helpers.
+
+Usage::
+
+    python custom_addons/ihs_db/benchmarks/bench_db_throughput.py -c odoo.conf --rows 200000
+    python custom_addons/ihs_db/benchmarks/bench_db_throughput.py --backend sqlite
+
+Strategies: one ``INSERT`` per row, ``execute_values`` pages and ``COPY FROM
+STDIN``; then a chunked read of the table through a server-side cursor. The
+PostgreSQL run uses the database of the config file and drops its table after.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tools import ConnectionPool, Database, DbSettings, PsycopgBackend, SqliteBackend
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+TABLE = "ihs_db_bench"
+COLUMNS = ("id", "name", "amount", "created_at")
+
+
+def synthetic_rows(count: int) -> Iterator[tuple]:
+    """Yield ``count`` rows of mixed types, generated on the fly."""
+    start = dt.datetime(2026, 1, 1)  # noqa: DTZ001
+    for index in range(count):
+        yield (index, f"record {index}\twith tab", index * 0.25, start + dt.timedelta(seconds=index))
+
+
+def row_by_row(db: Database, count: int) -> None:
+    """Insert with one statement, and one round trip, per row."""
+    with db.transaction() as tx:
+        for row in synthetic_rows(count):
+            tx.execute(f"INSERT INTO {TABLE} ({', '.join(COLUMNS)}) VALUES (%s, %s, %s, %s)", row)  # noqa: S608
+
+
+def execute_values(db: Database, count: int, page_size: int) -> None:
+    """Insert with one multi-row statement per page."""
+    with db.transaction() as tx:
+        tx.insert_values(TABLE, COLUMNS, synthetic_rows(count), page_size=page_size)
+
+
+def copy(db: Database, count: int) -> None:
+    """Stream every row through a single ``COPY``."""
+    with db.transaction() as tx:
+        tx.copy_rows(TABLE, COLUMNS, synthetic_rows(count))
+
+
+def read_chunks(db: Database, chunk_size: int) -> None:
+    """Read the whole table back in chunks."""
+    for _chunk in db.iter_chunks(f"SELECT {', '.join(COLUMNS)} FROM {TABLE}", chunk_size=chunk_size):  # noqa: S608
+        pass
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Pooled database write/read throughput")
+    parser.add_argument("-c", "--config", default=str(REPO_ROOT / "odoo.conf"))
+    parser.add_argument("--backend", choices=("postgres", "sqlite"), default="postgres")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--row-by-row-rows", type=int, default=None, help="defaults to --rows / 10")
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    args = parser.parse_args(argv)
+
+    settings = DbSettings.from_config_file(args.config)
+    if args.backend == "postgres":
+        backend = PsycopgBackend(settings)
+        create = f"CREATE UNLOGGED TABLE {TABLE} (id integer, name text, amount numeric, created_at timestamp)"
+    else:
+        backend = SqliteBackend()
+        create = f"CREATE TABLE {TABLE} (id integer, name text, amount numeric, created_at timestamp)"
+    db = Database(ConnectionPool.from_settings(backend, settings))
+    slow_rows = args.row_by_row_rows or max(1, args.rows // 10)
+
+    scenarios = [
+        ("row by row", slow_rows, lambda: row_by_row(db, slow_rows)),
+        ("execute_values", args.rows, lambda: execute_values(db, args.rows, args.page_size)),
+        ("copy", args.rows, lambda: copy(db, args.rows)),
+    ]
+    out = sys.stdout
+    out.write(f"backend={args.backend} rows={args.rows} page_size={args.page_size}\n")
+    out.write(f"{'strategy':>16} {'rows':>9} {'seconds':>9} {'rows/s':>11} {'round trips':>12}\n")
+    try:
+        with db.transaction() as tx:
+            tx.execute(f"DROP TABLE IF EXISTS {TABLE}")
+            tx.execute(create)
+        for label, count, run in [*scenarios, ("chunked read", None, lambda: read_chunks(db, args.chunk_size))]:
+            with db.transaction() as tx:
+                tx.execute(f"SELECT count(*) FROM {TABLE}")  # noqa: S608
+                rows = count if count is not None else tx.fetchall()[0][0]
+            before = db.stats.snapshot()["round_trips"]
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+            trips = db.stats.snapshot()["round_trips"] - before
+            out.write(f"{label:>16} {rows:>9} {elapsed:>9.3f} {rows / elapsed:>11.0f} {trips:>12}\n")
+    finally:
+        with db.transaction() as tx:
+            tx.execute(f"DROP TABLE IF EXISTS {TABLE}")
+        stats = db.stats.snapshot()
+        out.write(
+            f"pool: {stats['acquisitions']} acquisitions, {stats['opened']} opened, "
+            f"wait {stats['wait_time'] * 1000:.2f} ms total / {stats['max_wait'] * 1000:.2f} ms max\n",
+        )
+        db.pool.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,34 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+from __future__ import annotations
+
+import os
+import threading
+
+from odoo.tools import config
+
+from .tools import ConnectionPool, Database, DbSettings, PsycopgBackend
+
+_lock = threading.Lock()
+_databases = {}
+_pid = None
+
+
+def shared_database(dbname: str | None = None) -> Database:
+    """Return the process-wide pooled :class:`Database` of ``dbname``.
+
+    Settings come from ``odoo.conf``; ``dbname`` defaults to its ``db_name``.
+    Pools are dropped in forked workers, connections must not cross processes.
+    """
+    global _pid  # noqa: PLW0603
+    settings = DbSettings.from_options(config)
+    dbname = dbname or settings.dbname
+    with _lock:
+        if _pid != os.getpid():
+            _databases.clear()
+            _pid = os.getpid()
+        database = _databases.get(dbname)
+        if database is None:
+            backend = PsycopgBackend(settings, dbname=dbname)
+            database = _databases[dbname] = Database(ConnectionPool.from_settings(backend, settings))
+        return database
@@ -0,0 +1,112 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+import datetime as dt
+import threading
+
+from odoo.addons.ihs_db.tools import (
+    ConnectionPool,
+    CopyStream,
+    Database,
+    PoolError,
+    PoolTimeoutError,
+    SqliteBackend,
+    copy_format,
+)
+from odoo.tests.common import BaseCase
+
+
+class TestDatabase(BaseCase):
+    def setUp(self):
+        super().setUp()
+        self.pool = ConnectionPool(SqliteBackend(), size=2, timeout=1)
+        self.addCleanup(self.pool.close)
+        self.db = Database(self.pool)
+        with self.db.transaction() as tx:
+            tx.execute("CREATE TABLE item (id INTEGER PRIMARY KEY, name TEXT)")
+
+    def names(self):
+        with self.db.transaction() as tx:
+            tx.execute("SELECT name FROM item ORDER BY id")
+            return [name for (name,) in tx.fetchall()]
+
+    def test_transaction_commits(self):
+        with self.db.transaction() as tx:
+            tx.execute("INSERT INTO item (name) VALUES (%s)", ["a"])
+            tx.execute("INSERT INTO item (name) VALUES (%(name)s)", {"name": "b"})
+        self.assertEqual(self.names(), ["a", "b"])
+
+    def test_transaction_rolls_back(self):
+        with self.assertRaises(ValueError), self.db.transaction() as tx:
+            tx.execute("INSERT INTO item (name) VALUES (%s)", ["a"])
+            raise ValueError
+        self.assertEqual(self.names(), [])
+
+    def test_insert_values_pages(self):
+        round_trips = self.db.stats.round_trips
+        with self.db.transaction() as tx:
+            count = tx.insert_values("item", ["name"], ((f"n{index}",) for index in range(5)), page_size=2)
+        self.assertEqual(count, 5)
+        # three pages and the commit
+        self.assertEqual(self.db.stats.round_trips - round_trips, 4)
+        self.assertEqual(self.names(), [f"n{index}" for index in range(5)])
+
+    def test_copy_rows(self):
+        with self.db.transaction() as tx:
+            self.assertEqual(tx.copy_rows("item", ["name"], ((f"n{index}",) for index in range(3))), 3)
+        self.assertEqual(self.db.stats.rows_written, 3)
+        self.assertEqual(self.names(), ["n0", "n1", "n2"])
+
+    def test_iter_chunks(self):
+        with self.db.transaction() as tx:
+            tx.insert_values("item", ["name"], [(f"n{index}",) for index in range(5)])
+        chunks = list(self.db.iter_chunks("SELECT name FROM item WHERE id > %s ORDER BY id", [0], chunk_size=2))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        self.assertEqual(self.db.stats.rows_read, 5)
+        # the connection went back to the pool
+        self.assertEqual(len(self.pool._idle), self.pool._open)
+
+
+class TestConnectionPool(BaseCase):
+    def setUp(self):
+        super().setUp()
+        self.pool = ConnectionPool(SqliteBackend(), size=1, timeout=0.05)
+        self.addCleanup(self.pool.close)
+
+    def test_timeout(self):
+        with self.pool.connection(), self.assertRaises(PoolTimeoutError):
+            self.pool.getconn()
+        self.assertEqual(self.pool.stats.timeouts, 1)
+
+    def test_waits_for_release(self):
+        conn = self.pool.getconn()
+        timer = threading.Timer(0.05, self.pool.putconn, [conn])
+        timer.start()
+        self.addCleanup(timer.join)
+        self.assertIs(self.pool.getconn(timeout=5), conn)
+        self.assertEqual((self.pool.stats.waits, self.pool.stats.opened), (1, 1))
+
+    def test_broken_connection_replaced(self):
+        conn = self.pool.getconn()
+        conn.close()
+        self.pool.putconn(conn)
+        self.assertIsNot(self.pool.getconn(), conn)
+        self.assertEqual((self.pool.stats.opened, self.pool.stats.closed), (2, 1))
+
+    def test_closed(self):
+        self.pool.close()
+        with self.assertRaises(PoolError):
+            self.pool.getconn()
+
+
+class TestCopyFormat(BaseCase):
+    def test_values(self):
+        self.assertEqual(
+            [copy_format(value) for value in (None, True, False, "a\tb\\", b"\x01", dt.date(2026, 1, 2), 1.5)],
+            ["\\N", "t", "f", "a\\tb\\\\", "\\\\x01", "2026-01-02", "1.5"],
+        )
+
+    def test_stream_blocks(self):
+        stream = CopyStream([(1, "a"), (2, None)])
+        self.assertEqual(stream.read(3), b"1\ta")
+        self.assertEqual(stream.read(), b"\n2\t\\N\n")
+        self.assertEqual(stream.count, 2)
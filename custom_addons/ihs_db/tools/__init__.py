@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+from .backends import Backend, CopyStream, PsycopgBackend, SqliteBackend, copy_format
+from .pool import (
+    ConnectionPool,
+    Database,
+    DbSettings,
+    PoolError,
+    PoolStats,
+    PoolTimeoutError,
+    Transaction,
+)
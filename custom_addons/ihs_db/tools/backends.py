@@ -0,0 +1,231 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Database backends of the pool: PostgreSQL through psycopg2, and SQLite.
+
+:class:`SqliteBackend` is the in-memory stand-in: it keeps the pool, batching
+and streaming code paths identical while emulating ``COPY`` and server-side
+cursors, so benchmarks and tests can run without a PostgreSQL server.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import io
+import re
+import sqlite3
+import uuid
+from typing import TYPE_CHECKING, Any, Protocol
+
+import psycopg2
+from psycopg2 import extras, sql
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
+
+    from .pool import DbSettings
+
+    Params = Sequence[Any] | Mapping[str, Any] | None
+
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+class Backend(Protocol):
+    """Operations the pool and :class:`~.pool.Database` need from a driver."""
+
+    def connect(self) -> Any:  # noqa: ANN401
+        """Open a new DB-API connection."""
+
+    def reset(self, conn: Any) -> bool:  # noqa: ANN401
+        """Roll ``conn`` back; return whether it can be reused."""
+
+    def execute(self, cursor: Any, query: str, params: Params) -> None:  # noqa: ANN401
+        """Run ``query`` written with ``%s``/``%(name)s`` placeholders."""
+
+    def insert_values(
+        self, cursor: Any, table: str, columns: Sequence[str], rows: Sequence[Sequence[Any]],  # noqa: ANN401
+    ) -> None:
+        """Insert ``rows`` with a single statement."""
+
+    def copy_rows(
+        self, cursor: Any, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]],  # noqa: ANN401
+    ) -> int:
+        """Stream ``rows`` into ``table``; return the row count."""
+
+    def server_cursor(self, conn: Any, name: str, itersize: int) -> Any:  # noqa: ANN401
+        """Return a cursor that keeps the result set on the server."""
+
+
+def copy_format(value: Any) -> str:  # noqa: ANN401, PLR0911
+    """Format ``value`` as a field of the ``COPY`` text format."""
+    if value is None:
+        return "\\N"
+    if value is True:
+        return "t"
+    if value is False:
+        return "f"
+    if isinstance(value, str):
+        return value.translate(_COPY_ESCAPES)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return "\\\\x" + bytes(value).hex()
+    if isinstance(value, (dt.date, dt.time)):
+        return value.isoformat()
+    return str(value).translate(_COPY_ESCAPES)
+
+
+class CopyStream(io.RawIOBase):
+    """Read-only file producing ``rows`` in ``COPY`` text format on demand.
+
+    ``copy_expert`` pulls it in fixed-size blocks, so the rows are never all
+    formatted in memory at once.
+    """
+
+    def __init__(self, rows: Iterable[Sequence[Any]]) -> None:
+        """Wrap the ``rows`` iterable."""
+        super().__init__()
+        self._rows = iter(rows)
+        self._buffer = b""
+        self.count = 0
+
+    def readable(self) -> bool:
+        """Return True, the stream can be read."""
+        return True
+
+    def _lines(self, size: int) -> Iterator[bytes]:
+        length = 0
+        for row in self._rows:
+            line = ("\t".join(map(copy_format, row)) + "\n").encode()
+            self.count += 1
+            length += len(line)
+            yield line
+            if length >= size:
+                break
+
+    def read(self, size: int = -1) -> bytes:
+        """Return up to ``size`` bytes, or everything left when ``size`` is negative."""
+        if size is None or size < 0:
+            data = self._buffer + b"".join(self._lines(float("inf")))
+            self._buffer = b""
+            return data
+        if len(self._buffer) < size:
+            self._buffer += b"".join(self._lines(size - len(self._buffer)))
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:
+        """Fill ``buffer`` with the next bytes of the stream."""
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+class PsycopgBackend:
+    """PostgreSQL through psycopg2."""
+
+    def __init__(self, settings: DbSettings, **connect_kwargs: Any) -> None:  # noqa: ANN401
+        """Connect with ``settings``; ``connect_kwargs`` override or complete them."""
+        self.connect_kwargs = {**settings.connect_kwargs(), **connect_kwargs}
+
+    def connect(self) -> psycopg2.extensions.connection:
+        """Open a new connection."""
+        return psycopg2.connect(**self.connect_kwargs)
+
+    def reset(self, conn: psycopg2.extensions.connection) -> bool:
+        """Roll ``conn`` back; return whether it can be reused."""
+        if conn.closed:
+            return False
+        try:
+            conn.rollback()
+        except psycopg2.Error:
+            return False
+        return True
+
+    def execute(self, cursor: Any, query: str, params: Params) -> None:  # noqa: ANN401
+        """Run ``query``."""
+        cursor.execute(query, params)
+
+    def insert_values(
+        self, cursor: Any, table: str, columns: Sequence[str], rows: Sequence[Sequence[Any]],  # noqa: ANN401
+    ) -> None:
+        """Insert ``rows`` with one ``INSERT ... VALUES (...), (...)`` statement."""
+        query = sql.SQL("INSERT INTO {} ({}) VALUES %s").format(
+            sql.Identifier(table), sql.SQL(", ").join(map(sql.Identifier, columns)),
+        )
+        extras.execute_values(cursor, query, rows, page_size=len(rows))
+
+    def copy_rows(
+        self, cursor: Any, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]],  # noqa: ANN401
+    ) -> int:
+        """Stream ``rows`` with ``COPY ... FROM STDIN``."""
+        query = sql.SQL("COPY {} ({}) FROM STDIN").format(
+            sql.Identifier(table), sql.SQL(", ").join(map(sql.Identifier, columns)),
+        )
+        stream = CopyStream(rows)
+        cursor.copy_expert(query, stream)
+        return stream.count
+
+    def server_cursor(self, conn: psycopg2.extensions.connection, name: str, itersize: int) -> Any:  # noqa: ANN401
+        """Return a named cursor, its rows stay on the server until fetched."""
+        cursor = conn.cursor(name=name)
+        cursor.itersize = itersize
+        return cursor
+
+
+class SqliteBackend:
+    """In-memory SQLite database shared by all connections of the backend."""
+
+    _placeholder = re.compile(r"%\((\w+)\)s|%s")
+
+    def __init__(self, name: str | None = None) -> None:
+        """Create a new in-memory database; connections with the same ``name`` share it."""
+        self.uri = f"file:{name or uuid.uuid4().hex}?mode=memory&cache=shared"
+        # the database lives as long as one connection to it is open
+        self._keepalive = self.connect()
+
+    def connect(self) -> sqlite3.Connection:
+        """Open a new connection to the in-memory database."""
+        return sqlite3.connect(self.uri, uri=True, check_same_thread=False)
+
+    def reset(self, conn: sqlite3.Connection) -> bool:
+        """Roll ``conn`` back; return whether it can be reused."""
+        try:
+            conn.rollback()
+        except sqlite3.ProgrammingError:
+            return False
+        return True
+
+    def execute(self, cursor: sqlite3.Cursor, query: str, params: Params) -> None:
+        """Run ``query`` after translating its placeholders to SQLite's."""
+        cursor.execute(self._placeholder.sub(lambda m: f":{m[1]}" if m[1] else "?", query), params or ())
+
+    def insert_values(
+        self, cursor: sqlite3.Cursor, table: str, columns: Sequence[str], rows: Sequence[Sequence[Any]],
+    ) -> None:
+        """Insert ``rows`` with one multi-row ``INSERT``."""
+        row_marks = "({})".format(", ".join("?" * len(columns)))
+        cursor.execute(
+            f"INSERT INTO {_quote(table)} ({', '.join(map(_quote, columns))}) "  # noqa: S608
+            f"VALUES {', '.join([row_marks] * len(rows))}",
+            [value for row in rows for value in row],
+        )
+
+    def copy_rows(
+        self, cursor: sqlite3.Cursor, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]],
+    ) -> int:
+        """Emulate ``COPY`` with ``executemany``, which also consumes ``rows`` lazily."""
+        marks = ", ".join("?" * len(columns))
+        before = cursor.connection.total_changes
+        cursor.executemany(
+            f"INSERT INTO {_quote(table)} ({', '.join(map(_quote, columns))}) VALUES ({marks})",  # noqa: S608
+            rows,
+        )
+        return cursor.connection.total_changes - before
+
+    def server_cursor(self, conn: sqlite3.Connection, name: str, itersize: int) -> sqlite3.Cursor:  # noqa: ARG002
+        """Return a plain cursor; SQLite steps through results lazily anyway."""
+        cursor = conn.cursor()
+        cursor.arraysize = itersize
+        return cursor
+
+
+def _quote(identifier: str) -> str:
+    return '"{}"'.format(identifier.replace('"', '""'))
@@ -0,0 +1,329 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Bounded, thread-safe connection pool and batched access helpers.
+
+The pool does not know how connections are made: a backend (see
+:mod:`.backends`) opens them and implements the few operations that differ
+between PostgreSQL and the in-memory stand-in used by benchmarks and tests.
+"""
+
+from __future__ import annotations
+
+import configparser
+import contextlib
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
+
+    from .backends import Backend
+
+DEFAULT_POOL_SIZE = 8
+DEFAULT_POOL_TIMEOUT = 30.0
+DEFAULT_PAGE_SIZE = 1000
+DEFAULT_CHUNK_SIZE = 2000
+
+
+class PoolError(Exception):
+    """Raised when the pool cannot hand out a connection."""
+
+
+class PoolTimeoutError(PoolError):
+    """Raised when no connection was released before the timeout."""
+
+
+@dataclass(frozen=True)
+class DbSettings:
+    """Connection and pool settings, as found in ``odoo.conf``."""
+
+    host: str | None = None
+    port: int | None = None
+    user: str | None = None
+    password: str | None = None
+    dbname: str | None = None
+    pool_size: int = DEFAULT_POOL_SIZE
+    pool_timeout: float = DEFAULT_POOL_TIMEOUT
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> DbSettings:
+        """Read the ``[options]`` of an Odoo config; unset values are falsy there."""
+
+        def get(key: str) -> Any:  # noqa: ANN401
+            value = options.get(key)
+            return value if value not in (None, False, "", "False") else None
+
+        port = get("db_port")
+        pool_size = get("ihs_db_pool_size")
+        pool_timeout = get("ihs_db_pool_timeout")
+        return cls(
+            host=get("db_host"),
+            port=int(port) if port else None,
+            user=get("db_user"),
+            password=get("db_password"),
+            dbname=get("db_name"),
+            pool_size=int(pool_size) if pool_size else DEFAULT_POOL_SIZE,
+            pool_timeout=float(pool_timeout) if pool_timeout else DEFAULT_POOL_TIMEOUT,
+        )
+
+    @classmethod
+    def from_config_file(cls, path: str) -> DbSettings:
+        """Read the settings from an ``odoo.conf`` file."""
+        parser = configparser.ConfigParser(interpolation=None)
+        if not parser.read(path):
+            msg = f"Cannot read config file {path}"
+            raise FileNotFoundError(msg)
+        return cls.from_options(dict(parser.items("options")))
+
+    def connect_kwargs(self) -> dict[str, Any]:
+        """Return the keyword arguments of ``psycopg2.connect``."""
+        kwargs = {
+            "host": self.host,
+            "port": self.port,
+            "user": self.user,
+            "password": self.password,
+            "dbname": self.dbname,
+        }
+        return {key: value for key, value in kwargs.items() if value is not None}
+
+
+@dataclass
+class PoolStats:
+    """Counters of a pool; updated under a lock, read with :meth:`snapshot`."""
+
+    acquisitions: int = 0
+    waits: int = 0
+    wait_time: float = 0.0
+    max_wait: float = 0.0
+    timeouts: int = 0
+    opened: int = 0
+    closed: int = 0
+    round_trips: int = 0
+    rows_written: int = 0
+    rows_read: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record_acquire(self, waited: float, *, blocked: bool) -> None:
+        """Count a connection handed out after ``waited`` seconds."""
+        with self._lock:
+            self.acquisitions += 1
+            self.wait_time += waited
+            self.max_wait = max(self.max_wait, waited)
+            if blocked:
+                self.waits += 1
+
+    def add(self, **counters: float) -> None:
+        """Increment the given counters."""
+        with self._lock:
+            for name, value in counters.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def snapshot(self) -> dict[str, float]:
+        """Return a consistent copy of the counters."""
+        with self._lock:
+            return {f.name: getattr(self, f.name) for f in fields(self) if not f.name.startswith("_")}
+
+
+class ConnectionPool:
+    """At most ``size`` connections, shared between threads.
+
+    ``getconn`` blocks up to ``timeout`` seconds when every connection is in
+    use. Connections are opened lazily and rolled back when given back.
+    """
+
+    def __init__(
+        self, backend: Backend, size: int = DEFAULT_POOL_SIZE, timeout: float = DEFAULT_POOL_TIMEOUT,
+    ) -> None:
+        """Create an empty pool opening its connections through ``backend``."""
+        if size < 1:
+            msg = "Pool size must be at least 1"
+            raise ValueError(msg)
+        self.backend = backend
+        self.size = size
+        self.timeout = timeout
+        self.stats = PoolStats()
+        self._cond = threading.Condition()
+        self._idle: list[Any] = []
+        self._open = 0
+        self._closed = False
+
+    @classmethod
+    def from_settings(cls, backend: Backend, settings: DbSettings) -> ConnectionPool:
+        """Create a pool sized after ``settings``."""
+        return cls(backend, settings.pool_size, settings.pool_timeout)
+
+    def getconn(self, timeout: float | None = None) -> Any:  # noqa: ANN401
+        """Return an idle connection, opening one if the pool is not full."""
+        timeout = self.timeout if timeout is None else timeout
+        start = time.monotonic()
+        blocked = False
+        with self._cond:
+            while True:
+                if self._closed:
+                    msg = "Connection pool is closed"
+                    raise PoolError(msg)
+                if self._idle:
+                    conn = self._idle.pop()
+                    break
+                if self._open < self.size:
+                    self._open += 1
+                    conn = None
+                    break
+                remaining = timeout - (time.monotonic() - start)
+                if remaining <= 0:
+                    self.stats.add(timeouts=1)
+                    msg = f"No connection available after {timeout:.1f}s (pool size {self.size})"
+                    raise PoolTimeoutError(msg)
+                blocked = True
+                self._cond.wait(remaining)
+        if conn is None:
+            try:
+                conn = self.backend.connect()
+            except BaseException:
+                with self._cond:
+                    self._open -= 1
+                    self._cond.notify()
+                raise
+            self.stats.add(opened=1)
+        self.stats.record_acquire(time.monotonic() - start, blocked=blocked)
+        return conn
+
+    def putconn(self, conn: Any, *, discard: bool = False) -> None:  # noqa: ANN401
+        """Give ``conn`` back, closing it if it is broken or ``discard`` is set."""
+        keep = not discard and self.backend.reset(conn)
+        with self._cond:
+            if keep and not self._closed:
+                self._idle.append(conn)
+            else:
+                self._open -= 1
+            self._cond.notify()
+        if not keep or self._closed:
+            self._close(conn)
+
+    @contextmanager
+    def connection(self, timeout: float | None = None) -> Iterator[Any]:
+        """Borrow a connection for the duration of the ``with`` block."""
+        conn = self.getconn(timeout)
+        try:
+            yield conn
+        finally:
+            self.putconn(conn)
+
+    def close(self) -> None:
+        """Close idle connections; busy ones are closed when given back."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+            self._cond.notify_all()
+        for conn in idle:
+            self._close(conn)
+
+    def _close(self, conn: Any) -> None:  # noqa: ANN401
+        self.stats.add(closed=1)
+        # the connection is being dropped, errors while closing it do not matter
+        with contextlib.suppress(Exception):
+            conn.close()
+
+
+class Transaction:
+    """One pooled connection and cursor; counts the round trips it makes."""
+
+    def __init__(self, db: Database, conn: Any) -> None:  # noqa: ANN401
+        """Wrap ``conn`` borrowed from ``db``'s pool."""
+        self.db = db
+        self.backend = db.backend
+        self.connection = conn
+        self.cursor = conn.cursor()
+
+    def execute(self, query: str, params: Sequence[Any] | Mapping[str, Any] | None = None) -> int:
+        """Run one statement and return its row count."""
+        self.backend.execute(self.cursor, query, params)
+        self.db.stats.add(round_trips=1)
+        return self.cursor.rowcount
+
+    def fetchall(self) -> list[tuple]:
+        """Return the rows of the last statement."""
+        return self.cursor.fetchall()
+
+    def insert_values(
+        self,
+        table: str,
+        columns: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> int:
+        """Insert ``rows`` with one multi-row ``INSERT`` per page; return the row count."""
+        total = 0
+        for page in _pages(rows, page_size):
+            self.backend.insert_values(self.cursor, table, columns, page)
+            total += len(page)
+            self.db.stats.add(round_trips=1, rows_written=len(page))
+        return total
+
+    def copy_rows(self, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> int:
+        """Stream ``rows`` into ``table`` with ``COPY FROM STDIN``; return the row count."""
+        count = self.backend.copy_rows(self.cursor, table, columns, rows)
+        self.db.stats.add(round_trips=1, rows_written=count)
+        return count
+
+
+class Database:
+    """Entry point of the helpers: transactions and chunked reads on a pool."""
+
+    _cursor_names = itertools.count(1)
+
+    def __init__(self, pool: ConnectionPool) -> None:
+        """Use connections from ``pool``."""
+        self.pool = pool
+        self.backend = pool.backend
+        self.stats = pool.stats
+
+    @contextmanager
+    def transaction(self, timeout: float | None = None) -> Iterator[Transaction]:
+        """Run the ``with`` block in one transaction, committed unless it raises."""
+        with self.pool.connection(timeout) as conn:
+            tx = Transaction(self, conn)
+            try:
+                yield tx
+            finally:
+                tx.cursor.close()
+            conn.commit()
+            self.stats.add(round_trips=1)
+
+    def iter_chunks(
+        self,
+        query: str,
+        params: Sequence[Any] | Mapping[str, Any] | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[list[tuple]]:
+        """Yield the rows of ``query`` in lists of ``chunk_size`` from a server-side cursor.
+
+        The connection stays borrowed until the generator is exhausted or closed,
+        and only one chunk is held in memory at a time.
+        """
+        name = f"ihs_db_{next(self._cursor_names)}"
+        with self.pool.connection() as conn:
+            cursor = self.backend.server_cursor(conn, name, chunk_size)
+            try:
+                self.backend.execute(cursor, query, params)
+                while True:
+                    rows = cursor.fetchmany(chunk_size)
+                    self.stats.add(round_trips=1, rows_read=len(rows))
+                    if not rows:
+                        break
+                    yield rows
+            finally:
+                cursor.close()
+                conn.rollback()
+
+
+def _pages(rows: Iterable[Sequence[Any]], size: int) -> Iterator[list[Sequence[Any]]]:
+    """Split ``rows`` in lists of at most ``size`` items."""
+    it = iter(rows)
+    while page := list(itertools.islice(it, size)):
+        yield page
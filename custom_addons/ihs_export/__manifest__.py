@@ -0,0 +1,28 @@
+{
+    "name": "IHS Export",
+    "version": "18.0.1.0.0",
+    "summary": "Streaming CSV/XLSX export of large reports in constant memory.",
+    "description": """
+Exports the stored fields of a model, filtered by a domain, without loading
+the records: the rows are read in chunks from a server-side cursor of the
+``ihs_db`` pool and go through a generator pipeline, so memory does not grow
+with the size of the report.
+
+"Download" streams the file in a chunked HTTP response: CSV rows are sent as
+they are read, XLSX is written in constant-memory mode to a temporary file
+sent once complete. "Export to File" writes it in the background, through an
+``ihs_export`` job of the job queue, straight into the filestore and attaches
+it to the export.
+""",
+    "author": "ihs-odoo",
+    "category": "Tools",
+    "license": "LGPL-3",
+    "depends": ["base", "ihs_db", "ihs_job_queue"],
+    "external_dependencies": {"python": ["xlsxwriter"]},
+    "data": [
+        "security/ir.model.access.csv",
+        "views/ihs_export_views.xml",
+    ],
+    "installable": True,
+    "application": False,
+}
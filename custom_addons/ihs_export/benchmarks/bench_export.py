@@ -0,0 +1,179 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Compare buffered report exports with the streaming pipeline as reports grow.
+
+Usage::
+
+    python custom_addons/ihs_export/benchmarks/bench_export.py -c odoo.conf --rows 10000,100000,500000
+
+Fills a scratch table of order lines in the database of ``db_name``, then
+exports its first N rows as CSV and XLSX: buffered, fetching every row and
+rendering the whole file in memory before sending it, as the stock export
+does, then streamed, reading chunks from a server-side cursor through the
+pipeline. For each run: time until the first rows are sent, rows per second and peak
+RSS, each run in a fresh process so peaks do not add up.
+"""
+
+from __future__ import annotations
+
+import argparse
+import configparser
+import csv
+import io
+import multiprocessing
+import resource
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import psycopg2
+import xlsxwriter
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tools import DEFAULT_CHUNK_SIZE, ExportStats, stream
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+TABLE = "ihs_export_bench"
+COLUMNS = ("id", "name", "partner", "date", "qty", "price", "total")
+QUERY = f"SELECT {', '.join(COLUMNS)} FROM {TABLE} WHERE id <= %s ORDER BY id"  # noqa: S608
+MODES = ("buffered csv", "streamed csv", "buffered xlsx", "streamed xlsx")
+
+
+def connection_params(config: Path) -> dict[str, str]:
+    """Return the psycopg2 connection parameters of an Odoo config file."""
+    options = configparser.ConfigParser()
+    options.read(config)
+    params = {
+        "dbname": options.get("options", "db_name", fallback="postgres"),
+        "host": options.get("options", "db_host", fallback=""),
+        "port": options.get("options", "db_port", fallback=""),
+        "user": options.get("options", "db_user", fallback=""),
+        "password": options.get("options", "db_password", fallback=""),
+    }
+    return {key: value for key, value in params.items() if value and value != "False"}
+
+
+def setup(conn: psycopg2.extensions.connection, rows: int) -> None:
+    """Create the scratch table with ``rows`` lines."""
+    with conn.cursor() as cr:
+        cr.execute(f"DROP TABLE IF EXISTS {TABLE}")
+        cr.execute(
+            f"""
+            CREATE TABLE {TABLE} (
+                id serial PRIMARY KEY, name varchar, partner varchar, date date,
+                qty integer, price numeric, total numeric
+            );
+            INSERT INTO {TABLE} (name, partner, date, qty, price, total)
+                SELECT 'SO' || lpad(n::text, 8, '0') || '/' || n %% 7, 'Partner ' || n %% 5000,
+                       date '2026-01-01' + n %% 365, 1 + n %% 17, (n %% 1000) / 10.0 + 0.99,
+                       (1 + n %% 17) * ((n %% 1000) / 10.0 + 0.99)
+                FROM generate_series(1, %s) n;
+            ANALYZE {TABLE};
+        """,  # noqa: S608
+            (rows,),
+        )
+    conn.commit()
+
+
+def max_rss_mb() -> float:
+    """Return the peak resident memory of this process, in MiB."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def server_chunks(conn: psycopg2.extensions.connection, rows: int, chunk_size: int) -> Iterator[list[tuple]]:
+    """Yield the rows in chunks from a server-side cursor, as ``Database.iter_chunks`` does."""
+    with conn.cursor(name="ihs_export_bench") as cr:
+        cr.itersize = chunk_size
+        cr.execute(QUERY, (rows,))
+        while chunk := cr.fetchmany(chunk_size):
+            yield chunk
+    conn.commit()
+
+
+def buffered(conn: psycopg2.extensions.connection, fmt: str, rows: int) -> bytes:
+    """Fetch every row and render the whole file in memory."""
+    with conn.cursor() as cr:
+        cr.execute(QUERY, (rows,))
+        data = cr.fetchall()
+    conn.commit()
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(COLUMNS)
+        writer.writerows(data)
+        return buffer.getvalue().encode()
+    output = io.BytesIO()
+    workbook = xlsxwriter.Workbook(output, {"in_memory": True, "default_date_format": "yyyy-mm-dd"})
+    sheet = workbook.add_worksheet()
+    sheet.write_row(0, 0, COLUMNS)
+    for index, row in enumerate(data, 1):
+        sheet.write_row(index, 0, row)
+    workbook.close()
+    return output.getvalue()
+
+
+def run(params: dict[str, str], mode: str, rows: int, chunk_size: int) -> tuple[float, float, int, float]:
+    """Export ``rows`` rows in ``mode``; return (first rows sent, total seconds, bytes, peak RSS)."""
+    conn = psycopg2.connect(**params)
+    kind, fmt = mode.split()
+    start = time.perf_counter()
+    first = None
+    size = 0
+    stats = ExportStats()
+    if kind == "buffered":
+        body = [buffered(conn, fmt, rows)]
+        stats.rows = rows
+    else:
+        body = stream(fmt, COLUMNS, server_chunks(conn, rows, chunk_size), stats)
+    # what a WSGI server does with the response body; a CSV header leaves at once,
+    # the time that matters is when the first rows do
+    for block in body:
+        if first is None and stats.rows:
+            first = time.perf_counter() - start
+        size += len(block)
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return first, elapsed, size, max_rss_mb()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark and print one line per run."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-c", "--config", type=Path, default=REPO_ROOT / "odoo.conf")
+    parser.add_argument("--rows", default="10000,100000,500000", help="comma-separated row counts")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--modes", default=",".join(MODES), help="comma-separated modes to run")
+    args = parser.parse_args(argv)
+    params = connection_params(args.config)
+    counts = [int(value) for value in args.rows.split(",")]
+    modes = [mode.strip() for mode in args.modes.split(",")]
+
+    conn = psycopg2.connect(**params)
+    setup(conn, max(counts))
+    out = sys.stdout
+    out.write(f"chunks of {args.chunk_size} rows\n")
+    out.write(f"{'rows':>8} {'mode':<14} {'first rows':>10} {'seconds':>8} {'rows/s':>9} {'size':>8} {'peak RSS':>9}\n")
+    context = multiprocessing.get_context("spawn")
+    for rows in counts:
+        for mode in modes:
+            with context.Pool(1) as pool:
+                first, elapsed, size, rss = pool.apply(run, (params, mode, rows, args.chunk_size))
+            out.write(
+                f"{rows:>8} {mode:<14} {first:>9.3f}s {elapsed:>8.2f} {rows / elapsed:>9.0f} "
+                f"{size / 2**20:>6.1f}MB {rss:>7.0f}MB\n",
+            )
+            out.flush()
+    with conn.cursor() as cr:
+        cr.execute(f"DROP TABLE {TABLE}")
+    conn.commit()
+    conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,26 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+from __future__ import annotations
+
+from odoo import http
+from odoo.addons.ihs_export.tools import MIMETYPES, stream
+from odoo.http import content_disposition, request
+
+
+class ExportController(http.Controller):
+    @http.route("/ihs_export/<int:export_id>/download", type="http", auth="user", readonly=True)
+    def download(self, export_id: int) -> http.Response:
+        """Stream an export while it is read, without a Content-Length: the response is chunked."""
+        export = request.env["ihs.export"].browse(export_id).exists()
+        if not export:
+            raise request.not_found()
+        header, query = export._query()  # noqa: SLF001
+        # the rows are read after this returns, on a connection of their own
+        body = stream(export.file_format, header, export._chunks(query))  # noqa: SLF001
+        headers = [
+            ("Content-Type", MIMETYPES[export.file_format]),
+            ("Content-Disposition", content_disposition(export._filename())),  # noqa: SLF001
+            # proxies must pass the chunks on as they come
+            ("X-Accel-Buffering", "no"),
+        ]
+        return request.make_response(body, headers=headers)
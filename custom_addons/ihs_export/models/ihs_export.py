@@ -0,0 +1,168 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from odoo import _, api, fields, models
+from odoo.addons.ihs_db import shared_database
+from odoo.addons.ihs_export.tools import DEFAULT_CHUNK_SIZE, MIMETYPES, export_file, file_sha1
+from odoo.exceptions import AccessError, ValidationError
+from odoo.tools import SQL
+from odoo.tools.safe_eval import safe_eval
+
+_logger = logging.getLogger(__name__)
+
+
+class IhsExport(models.Model):
+    _name = "ihs.export"
+    _description = "Streaming Export"
+    _order = "name"
+
+    name = fields.Char(required=True)
+    model_id = fields.Many2one("ir.model", string="Model", required=True, ondelete="cascade")
+    model_name = fields.Char(related="model_id.model")
+    field_names = fields.Char(
+        string="Fields", required=True,
+        help="Comma-separated stored fields; many-to-one fields export the name of the record, "
+             "or its id when you may not read the related model",
+    )
+    domain = fields.Char(default="[]", required=True)
+    order = fields.Char(help="SQL order of the rows, the model's order by default")
+    file_format = fields.Selection([("csv", "CSV"), ("xlsx", "XLSX")], required=True, default="csv")
+    chunk_size = fields.Integer(default=DEFAULT_CHUNK_SIZE, required=True, help="Rows read from the database at once")
+    attachment_id = fields.Many2one("ir.attachment", string="Last File", readonly=True, copy=False)
+
+    @api.constrains("chunk_size")
+    def _check_chunk_size(self) -> None:
+        if any(export.chunk_size < 1 for export in self):
+            raise ValidationError(_("The chunk size must be positive."))
+
+    @api.constrains("model_id", "field_names")
+    def _check_fields(self) -> None:
+        for export in self:
+            model_fields = self.env[export.model_name]._fields
+            for name in export._field_list():  # noqa: SLF001
+                field = model_fields.get(name)
+                if field is None or not field.store:
+                    raise ValidationError(_("%(field)s is not a stored field of %(model)s",
+                                            field=name, model=export.model_name))
+
+    def _field_list(self) -> list[str]:
+        return [name.strip() for name in (self.field_names or "").split(",") if name.strip()]
+
+    def _filename(self) -> str:
+        return f"{self.name}.{self.file_format}"
+
+    def _query(self) -> tuple[list[str], SQL]:
+        """Return the header and the query of the rows, as the current user may read them.
+
+        Record rules are part of the query, which can then run on a connection
+        of its own, outside of the current transaction.
+        """
+        self.ensure_one()
+        model = self.env[self.model_name]
+        model.check_access("read")
+        names = self._field_list()
+        model.check_field_access_rights("read", names)
+        query = model._search(safe_eval(self.domain or "[]"), order=self.order or model._order)  # noqa: SLF001
+        table = model._table  # noqa: SLF001
+        header, columns = [], []
+        for name in names:
+            field = model._fields[name]
+            header.append(field.get_description(self.env)["string"])
+            column = model._field_to_sql(table, name, query)  # noqa: SLF001
+            comodel = self.env[field.comodel_name] if field.type == "many2one" else None
+            if comodel is not None and self._can_read_names(comodel):
+                alias = query.make_alias(table, name)
+                condition = SQL("%s = %s", column, SQL.identifier(alias, "id"))
+                # the comodel's record rules: the names of other records stay empty
+                readable = comodel.with_context(active_test=False)._search([])  # noqa: SLF001
+                if readable.where_clause:
+                    condition = SQL("%s AND %s IN %s", condition, SQL.identifier(alias, "id"), readable.subselect())
+                query.add_join("LEFT JOIN", alias, comodel._table, condition)  # noqa: SLF001
+                column = comodel._field_to_sql(alias, comodel._rec_name, query)  # noqa: SLF001
+            columns.append(column)
+        return header, query.select(*columns)
+
+    @api.model
+    def _can_read_names(self, comodel: models.BaseModel) -> bool:
+        """Return whether many-to-one fields to ``comodel`` export names rather than ids."""
+        rec_field = comodel._fields.get(comodel._rec_name)  # noqa: SLF001
+        if not (rec_field and rec_field.store and comodel.has_access("read")):
+            return False
+        try:
+            comodel.check_field_access_rights("read", [rec_field.name])
+        except AccessError:
+            return False
+        return True
+
+    def _chunks(self, query: SQL) -> object:
+        """Return the rows of ``query`` in chunks, read by a server-side cursor."""
+        return shared_database(self.env.cr.dbname).iter_chunks(query.code, query.params, self.chunk_size)
+
+    def action_download(self):
+        """Stream the export to the browser."""
+        self.ensure_one()
+        return {"type": "ir.actions.act_url", "url": f"/ihs_export/{self.id}/download", "target": "self"}
+
+    def action_export_attachment(self):
+        """Write the export to an attachment in the background."""
+        for export in self:
+            self.env["ihs.job"]._enqueue(export, "_export_attachment", channel="ihs_export", name=f"Export {export.name}")  # noqa: SLF001
+        return {
+            "type": "ir.actions.client",
+            "tag": "display_notification",
+            "params": {
+                "type": "info",
+                "message": _("The export runs in the background, the file will be attached to it."),
+            },
+        }
+
+    def _export_attachment(self) -> int:
+        """Write the export to a new attachment straight in the filestore; return its id.
+
+        Users who may read the export may run it: the attachment and the link
+        to it are written as superuser. The file only moves into the filestore
+        once the attachment points to it, and is marked for the filestore's garbage
+        collection like any file Odoo writes, so a transaction rolled back
+        afterwards leaves no orphan.
+        """
+        self.ensure_one()
+        header, query = self._query()
+        attachments = self.env["ir.attachment"].sudo()
+        # written next to its final place, the file is then only renamed
+        directory = Path(attachments._full_path(""))  # noqa: SLF001
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=".ihs_export_", suffix=f".{self.file_format}")
+        os.close(fd)
+        try:
+            stats = export_file(self.file_format, tmp_name, header, self._chunks(query))
+            values = {
+                "name": self._filename(),
+                "res_model": self._name,
+                "res_id": self.id,
+                "mimetype": MIMETYPES[self.file_format],
+            }
+            if attachments._storage() != "file":  # noqa: SLF001
+                values["raw"] = Path(tmp_name).read_bytes()
+                attachment = attachments.create(values)
+                self.sudo().attachment_id = attachment
+            else:
+                checksum = file_sha1(tmp_name)
+                fname, full_path = attachments._get_path(b"", checksum)  # noqa: SLF001
+                # create() drops the file columns, they are written as they are
+                attachment = attachments.create(values)
+                attachment._write({"store_fname": fname, "file_size": stats.size, "checksum": checksum})  # noqa: SLF001
+                attachment.invalidate_recordset(["store_fname", "file_size", "checksum"])
+                self.sudo().attachment_id = attachment
+                if not Path(full_path).exists():
+                    Path(tmp_name).replace(full_path)
+                    attachments._mark_for_gc(fname)  # noqa: SLF001
+        finally:
+            Path(tmp_name).unlink(missing_ok=True)
+        _logger.info("Export %s: %d rows, %d bytes in %.1fs", self.name, stats.rows, stats.size, stats.elapsed)
+        return attachment.id
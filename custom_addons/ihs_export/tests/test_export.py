@@ -0,0 +1,66 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+from odoo.addons.ihs_export.tools import stream
+from odoo.tests.common import TransactionCase, new_test_user
+
+
+class TestExport(TransactionCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # the rows are read on a connection of their own: only committed data is exported
+        cls.export = cls.env["ihs.export"].create({
+            "name": "Countries",
+            "model_id": cls.env.ref("base.model_res_country").id,
+            "field_names": "code,name",
+            "domain": "[('code', 'in', ['BE', 'FR'])]",
+            "order": "code",
+        })
+
+    def expected(self, export):
+        header, query = export._query()
+        return b"".join(stream(export.file_format, header, export._chunks(query)))
+
+    def test_export_attachment_file_storage(self):
+        self.env["ir.config_parameter"].sudo().set_param("ir_attachment.location", "file")
+        attachment = self.env["ir.attachment"].browse(self.export._export_attachment())
+        self.assertEqual(self.export.attachment_id, attachment)
+        self.assertTrue(attachment.store_fname)
+        self.assertEqual(attachment.file_size, len(attachment.raw))
+        self.assertEqual(attachment.raw, self.expected(self.export))
+        self.assertIn("Belgium", attachment.raw.decode())
+
+    def test_export_attachment_db_storage(self):
+        self.env["ir.config_parameter"].sudo().set_param("ir_attachment.location", "db")
+        self.export.file_format = "xlsx"
+        attachment = self.env["ir.attachment"].browse(self.export._export_attachment())
+        self.assertFalse(attachment.store_fname)
+        self.assertEqual(attachment.mimetype, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+        self.assertTrue(attachment.raw.startswith(b"PK"))
+
+    def test_many2one_names_follow_record_rules(self):
+        belgian, french = self.env["res.partner"].create([
+            {"name": "Belgian", "country_id": self.env.ref("base.be").id},
+            {"name": "French", "country_id": self.env.ref("base.fr").id},
+        ])
+        self.env["ir.rule"].create({
+            "name": "No Belgium",
+            "model_id": self.env.ref("base.model_res_country").id,
+            "domain_force": "[('code', '!=', 'BE')]",
+            "groups": [self.env.ref("base.group_user").id],
+        })
+        export = self.env["ihs.export"].create({
+            "name": "Partners",
+            "model_id": self.env.ref("base.model_res_partner").id,
+            "field_names": "name,country_id",
+            "domain": f"[('id', 'in', {[belgian.id, french.id]})]",
+            "order": "name",
+        })
+        user = new_test_user(self.env, login="exporter", groups="base.group_user")
+        # the query runs on the test transaction here, to see the partners
+        _header, query = export.with_user(user)._query()
+        self.env.cr.execute(query)
+        self.assertEqual(self.env.cr.fetchall(), [("Belgian", None), ("French", "France")])
+        _header, query = export._query()
+        self.env.cr.execute(query)
+        self.assertEqual(self.env.cr.fetchall(), [("Belgian", "Belgium"), ("French", "France")])
@@ -0,0 +1,78 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+import csv
+import datetime as dt
+import io
+import tempfile
+from decimal import Decimal
+from pathlib import Path
+
+import openpyxl
+from odoo.addons.ihs_export.tools import ExportStats, export_file, stream, writers
+from odoo.tests.common import BaseCase
+
+HEADER = ["Name", "Amount", "Date", "Data"]
+CHUNKS = [
+    [("Alpha", 1, dt.date(2026, 1, 2), {"a": 1}), ("Beta, Inc.", Decimal("2.50"), None, False)],
+    [],
+    [("Gamma\nline", -3.5, dt.datetime(2026, 1, 2, 3, 4, 5), ["x"])],  # noqa: DTZ001
+]
+
+
+class TestPipeline(BaseCase):
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def read_xlsx(self, path):
+        workbook = openpyxl.load_workbook(path, read_only=True)
+        self.addCleanup(workbook.close)
+        return {sheet.title: list(sheet.iter_rows(values_only=True)) for sheet in workbook.worksheets}
+
+    def test_csv_round_trip(self):
+        stats = ExportStats()
+        data = b"".join(stream("csv", HEADER, iter(CHUNKS), stats))
+        self.assertTrue(data.startswith(b"\xef\xbb\xbf"))
+        rows = list(csv.reader(io.StringIO(data.decode("utf-8-sig"))))
+        self.assertEqual(rows, [
+            HEADER,
+            ["Alpha", "1", "2026-01-02", '{"a": 1}'],
+            ["Beta, Inc.", "2.50", "", ""],
+            ["Gamma\nline", "-3.5", "2026-01-02 03:04:05", '["x"]'],
+        ])
+        self.assertEqual((stats.rows, stats.chunks, stats.size), (3, 3, len(data)))
+
+    def test_xlsx_round_trip(self):
+        path = self.directory / "export.xlsx"
+        stats = export_file("xlsx", path, HEADER, iter(CHUNKS))
+        self.assertEqual((stats.rows, stats.size), (3, path.stat().st_size))
+        self.assertEqual(self.read_xlsx(path), {"Export": [
+            tuple(HEADER),
+            ("Alpha", 1, dt.datetime(2026, 1, 2), '{"a": 1}'),  # noqa: DTZ001
+            ("Beta, Inc.", 2.5, None, None),
+            ("Gamma\nline", -3.5, dt.datetime(2026, 1, 2, 3, 4, 5), '["x"]'),  # noqa: DTZ001
+        ]})
+
+    def test_xlsx_sheet_rollover(self):
+        self.patch(writers, "XLSX_MAX_ROWS", 3)
+        path = self.directory / "export.xlsx"
+        rows = [(f"row {index}",) for index in range(5)]
+        export_file("xlsx", path, ["Name"], [rows[:3], rows[3:]])
+        # every sheet repeats the header
+        self.assertEqual(self.read_xlsx(path), {
+            "Export": [("Name",), ("row 0",), ("row 1",)],
+            "Export 2": [("Name",), ("row 2",), ("row 3",)],
+            "Export 3": [("Name",), ("row 4",)],
+        })
+
+    def test_xlsx_empty(self):
+        path = self.directory / "export.xlsx"
+        self.assertEqual(export_file("xlsx", path, HEADER, iter([])).rows, 0)
+        self.assertEqual(self.read_xlsx(path), {"Export": [tuple(HEADER)]})
+
+    def test_xlsx_stream_removes_its_file(self):
+        data = b"".join(stream("xlsx", HEADER, iter(CHUNKS), tmpdir=self.directory))
+        self.assertTrue(data.startswith(b"PK"))
+        self.assertEqual(list(self.directory.iterdir()), [])
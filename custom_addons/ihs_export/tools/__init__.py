@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+from .pipeline import (
+    DEFAULT_CHUNK_SIZE,
+    FORMATS,
+    ExportStats,
+    counted,
+    export_file,
+    file_blocks,
+    file_sha1,
+    stream,
+)
+from .writers import MIMETYPES, XLSX_MAX_ROWS, csv_chunks, csv_value, write_xlsx, xlsx_value
@@ -0,0 +1,118 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Export pipeline: chunks of rows in, bytes or a file out, never the whole result in memory.
+
+The source is any iterable of row chunks, typically a server-side cursor
+read ``chunk_size`` rows at a time; every stage is a generator, so memory
+holds one chunk whatever the number of rows, and the first bytes of a CSV
+leave before the last rows are read.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .writers import csv_chunks, write_xlsx
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+FORMATS = ("csv", "xlsx")
+DEFAULT_CHUNK_SIZE = 5000
+BLOCK_SIZE = 256 * 1024
+
+
+@dataclass
+class ExportStats:
+    """What an export did, filled in as it runs."""
+
+    rows: int = 0
+    chunks: int = 0
+    size: int = 0
+    first_chunk: float | None = None
+    elapsed: float = 0.0
+
+
+def counted(chunks: Iterable[Sequence[Sequence[Any]]], stats: ExportStats) -> Iterator[Sequence[Sequence[Any]]]:
+    """Pass ``chunks`` through, counting rows and timing into ``stats``."""
+    start = time.perf_counter()
+    for rows in chunks:
+        if stats.first_chunk is None:
+            stats.first_chunk = time.perf_counter() - start
+        stats.rows += len(rows)
+        stats.chunks += 1
+        yield rows
+    stats.elapsed = time.perf_counter() - start
+
+
+def file_blocks(path: str | os.PathLike[str], block_size: int = BLOCK_SIZE, *, delete: bool = False) -> Iterator[bytes]:
+    """Yield the content of ``path`` in blocks, deleting the file afterwards if asked."""
+    try:
+        with Path(path).open("rb") as handle:
+            while block := handle.read(block_size):
+                yield block
+    finally:
+        if delete:
+            Path(path).unlink(missing_ok=True)
+
+
+def stream(
+    fmt: str,
+    header: Sequence[str],
+    chunks: Iterable[Sequence[Sequence[Any]]],
+    stats: ExportStats | None = None,
+    tmpdir: str | os.PathLike[str] | None = None,
+) -> Iterator[bytes]:
+    """Yield the export as bytes, for a chunked HTTP response.
+
+    CSV bytes follow the chunks as they are read. An XLSX file is only
+    readable once complete: it is written to a temporary file in ``tmpdir``
+    first, then sent.
+    """
+    stats = stats if stats is not None else ExportStats()
+    chunks = counted(chunks, stats)
+    if fmt == "csv":
+        for block in csv_chunks(header, chunks):
+            stats.size += len(block)
+            yield block
+        return
+    fd, tmp_name = tempfile.mkstemp(dir=tmpdir, prefix="ihs_export_", suffix=".xlsx")
+    os.close(fd)
+    try:
+        write_xlsx(tmp_name, header, chunks)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    for block in file_blocks(tmp_name, delete=True):
+        stats.size += len(block)
+        yield block
+
+
+def export_file(
+    fmt: str,
+    path: str | os.PathLike[str],
+    header: Sequence[str],
+    chunks: Iterable[Sequence[Sequence[Any]]],
+) -> ExportStats:
+    """Write the export to ``path``; return its stats."""
+    stats = ExportStats()
+    chunks = counted(chunks, stats)
+    if fmt == "csv":
+        with Path(path).open("wb") as handle:
+            handle.writelines(csv_chunks(header, chunks))
+    else:
+        write_xlsx(path, header, chunks)
+    stats.size = Path(path).stat().st_size
+    return stats
+
+
+def file_sha1(path: str | os.PathLike[str]) -> str:
+    """Return the SHA-1 of the file at ``path``, read in blocks."""
+    with Path(path).open("rb") as handle:
+        return hashlib.file_digest(handle, "sha1").hexdigest()
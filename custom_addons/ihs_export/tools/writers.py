@@ -0,0 +1,124 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Render chunks of rows as CSV bytes or into an XLSX file, one chunk at a time.
+
+CSV is produced as a generator of byte blocks, one per chunk of rows, so it
+can be sent while the next chunk is being read. XLSX is a zip archive that
+is only complete when closed: it is written to a file in xlsxwriter's
+constant-memory mode, which flushes every row to disk as soon as the next
+one starts.
+"""
+
+from __future__ import annotations
+
+import csv
+import datetime as dt
+import io
+import json
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+
+import xlsxwriter
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable, Iterator, Sequence
+
+CSV_MIMETYPE = "text/csv;charset=utf-8"
+XLSX_MIMETYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+MIMETYPES = {"csv": CSV_MIMETYPE, "xlsx": XLSX_MIMETYPE}
+# rows of a worksheet, header included; the rest goes to the next sheet
+XLSX_MAX_ROWS = 1048576
+XLSX_DATE_FORMAT = "yyyy-mm-dd"
+XLSX_DATETIME_FORMAT = "yyyy-mm-dd hh:mm:ss"
+# written by the csv module as they are, without a call to csv_value
+CSV_PLAIN_TYPES = frozenset((str, int, float, Decimal))
+
+
+def csv_value(value: Any) -> Any:  # noqa: ANN401
+    """Return ``value`` as written in a CSV cell."""
+    if value is None or value is False:
+        return ""
+    if isinstance(value, (dt.date, dt.datetime)):
+        return value.isoformat(sep=" ") if isinstance(value, dt.datetime) else value.isoformat()
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def csv_chunks(header: Sequence[str], chunks: Iterable[Sequence[Sequence[Any]]], *, bom: bool = True) -> Iterator[bytes]:
+    """Yield the CSV encoding of ``header`` then of every chunk of rows.
+
+    The UTF-8 BOM makes spreadsheet applications detect the encoding.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    yield ("\ufeff" if bom else "").encode() + buffer.getvalue().encode()
+    for rows in chunks:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(
+            [value if type(value) in CSV_PLAIN_TYPES else csv_value(value) for value in row] for row in rows
+        )
+        yield buffer.getvalue().encode()
+
+
+def xlsx_value(value: Any) -> Any:  # noqa: ANN401
+    """Return ``value`` as xlsxwriter can write it."""
+    if value is False:
+        return None
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, dt.datetime) and value.tzinfo is not None:
+        return value.astimezone(dt.UTC).replace(tzinfo=None)
+    return value
+
+
+def write_xlsx(
+    path: str | os.PathLike[str],
+    header: Sequence[str],
+    chunks: Iterable[Sequence[Sequence[Any]]],
+    sheet_name: str = "Export",
+) -> int:
+    """Write ``header`` and the rows of ``chunks`` as an XLSX file; return the row count.
+
+    Worksheets hold :data:`XLSX_MAX_ROWS` rows at most: the rows beyond go to
+    ``<sheet_name> 2``, ``<sheet_name> 3``... each with the header.
+    """
+    workbook = xlsxwriter.Workbook(str(path), {
+        "constant_memory": True,
+        # cell text is data, never formulas or links
+        "strings_to_formulas": False,
+        "strings_to_urls": False,
+        "default_date_format": XLSX_DATETIME_FORMAT,
+    })
+    date_format = workbook.add_format({"num_format": XLSX_DATE_FORMAT})
+    bold = workbook.add_format({"bold": True})
+    count = 0
+    sheets = 0
+    worksheet = None
+    row_index = XLSX_MAX_ROWS
+    try:
+        for rows in chunks:
+            for row in rows:
+                if row_index >= XLSX_MAX_ROWS:
+                    sheets += 1
+                    worksheet = workbook.add_worksheet(sheet_name if sheets == 1 else f"{sheet_name} {sheets}")
+                    worksheet.write_row(0, 0, header, bold)
+                    row_index = 1
+                for col, value in enumerate(row):
+                    value = xlsx_value(value)  # noqa: PLW2901
+                    if value is None:
+                        continue
+                    if type(value) is dt.date:
+                        worksheet.write_datetime(row_index, col, value, date_format)
+                    else:
+                        worksheet.write(row_index, col, value)
+                row_index += 1
+                count += 1
+        if worksheet is None:
+            workbook.add_worksheet(sheet_name).write_row(0, 0, header, bold)
+    finally:
+        workbook.close()
+    return count
@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+from . import controllers
+from . import models
+from . import tools
+from .images import shared_pipeline
@@ -0,0 +1,24 @@
+{
+    "name": "IHS Image Pipeline",
+    "version": "18.0.1.0.0",
+    "summary": "Process-pool image resizing with a content-addressed thumbnail cache.",
+    "description": """
+Moves image resizing out of HTTP workers: every configured size of an image
+is produced from a single decode (``Image.draft`` and ``reduce`` for JPEGs) in
+a ``ProcessPoolExecutor``, and stored in an on-disk cache keyed by the source
+hash and size, bounded in size with LRU eviction.
+
+Variants are served by ``/ihs_image/<model>/<id>/<field>/<size>`` and warmed in
+the background when an image is uploaded. Options in ``odoo.conf``:
+``ihs_image_sizes``, ``ihs_image_cache_dir``, ``ihs_image_cache_max_mb`` and
+``ihs_image_workers``.
+""",
+    "author": "ihs-odoo",
+    "category": "Tools",
+    "license": "LGPL-3",
+    "depends": ["base", "web"],
+    "external_dependencies": {"python": ["PIL"]},
+    "data": [],
+    "installable": True,
+    "application": False,
+}
@@ -0,0 +1,122 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Measure variant rendering throughput and thumbnail cache hit latency.
+
+Usage::
+
+    python custom_addons/ihs_image_pipeline/benchmarks/bench_image_pipeline.py --images 48
+
+The corpus is generated: JPEG photos (noise over gradients, so they do not
+compress to nothing) and PNG images with transparency.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tools import (
+    DEFAULT_SIZES,
+    ImagePipeline,
+    ThumbnailCache,
+    render_variants,
+    render_variants_naive,
+)
+
+PNG_EVERY = 4
+
+
+def synthetic_image(index: int, width: int, height: int) -> bytes:
+    """Return image ``index`` of the corpus, every fourth one a PNG."""
+    base = Image.linear_gradient("L").resize((width, height)).convert("RGB")
+    noise = Image.effect_noise((width, height), 40 + index % 20).convert("RGB")
+    image = Image.blend(base, noise, 0.35)
+    ImageDraw.Draw(image).ellipse((width // 4, height // 4, width // 2, height // 2), fill=(index % 255, 90, 160))
+    buffer = io.BytesIO()
+    if index % PNG_EVERY == PNG_EVERY - 1:
+        image.putalpha(Image.linear_gradient("L").resize((width, height)))
+        image.save(buffer, "PNG")
+    else:
+        image.save(buffer, "JPEG", quality=90)
+    return buffer.getvalue()
+
+
+def throughput(func, corpus: list[bytes], sizes: tuple[int, ...], workers: int) -> float:  # noqa: ANN001
+    """Return images/s of ``func`` over ``corpus`` with ``workers`` processes."""
+    start = time.perf_counter()
+    if workers == 1:
+        for data in corpus:
+            func(data, sizes)
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            list(executor.map(func, corpus, [sizes] * len(corpus), chunksize=1))
+    return len(corpus) / (time.perf_counter() - start)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Image pipeline benchmark")
+    parser.add_argument("--images", type=int, default=32)
+    parser.add_argument("--width", type=int, default=2400)
+    parser.add_argument("--height", type=int, default=1600)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--hits", type=int, default=5000, help="cache reads for the hit latency")
+    args = parser.parse_args(argv)
+    sizes = DEFAULT_SIZES
+
+    out = sys.stdout
+    corpus = [synthetic_image(index, args.width, args.height) for index in range(args.images)]
+    out.write(
+        f"{len(corpus)} images {args.width}x{args.height} "
+        f"({sum(map(len, corpus)) / 2**20:.1f} MiB), sizes {sizes}\n",
+    )
+    out.write(f"{'strategy':>22} {'workers':>8} {'images/s':>9} {'per core':>9}\n")
+    baseline = throughput(render_variants_naive, corpus, sizes, 1)
+    out.write(f"{'decode per size':>22} {1:>8} {baseline:>9.2f} {baseline:>9.2f}\n")
+    workers = 1
+    while True:
+        rate = throughput(render_variants, corpus, sizes, workers)
+        out.write(f"{'single decode':>22} {workers:>8} {rate:>9.2f} {rate / workers:>9.2f}\n")
+        if workers >= args.workers:
+            break
+        workers = min(workers * 2, args.workers)
+
+    with tempfile.TemporaryDirectory(prefix="bench_image_cache_") as tmp:
+        pipeline = ImagePipeline(ThumbnailCache(tmp), sizes, max_workers=args.workers)
+        start = time.perf_counter()
+        for future in [pipeline.submit(data) for data in corpus]:
+            future.result()
+        warm = len(corpus) / (time.perf_counter() - start)
+        out.write(f"{'pipeline warm (miss)':>22} {args.workers:>8} {warm:>9.2f} {warm / args.workers:>9.2f}\n")
+
+        latencies = []
+        for index in range(args.hits):
+            data = corpus[index % len(corpus)]
+            size = sizes[index % len(sizes)]
+            start = time.perf_counter()
+            _fmt, path = pipeline.get(data, size)
+            path.read_bytes()
+            latencies.append(time.perf_counter() - start)
+        pipeline.shutdown()
+        latencies.sort()
+        out.write(
+            f"cache hit (hash + lookup + read): p50 {statistics.median(latencies) * 1e3:.3f} ms, "
+            f"p99 {latencies[int(len(latencies) * 0.99)] * 1e3:.3f} ms, "
+            f"{pipeline.cache.size_bytes / 2**20:.1f} MiB cached, {pipeline.renders} renders\n",
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+from __future__ import annotations
+
+import base64
+
+from odoo import fields, http, models
+from odoo.addons.ihs_image_pipeline.images import shared_pipeline
+from odoo.addons.ihs_image_pipeline.tools import FORMAT_MIMETYPES, ImageProcessError
+from odoo.exceptions import AccessError
+from odoo.http import request
+
+CACHE_MAX_AGE = 7 * 24 * 3600
+
+
+def _can_read(record: models.BaseModel, field: str) -> bool:
+    """Return whether the user of ``record`` may read its ``field``."""
+    try:
+        record.check_access("read")
+        record.check_field_access_rights("read", [field])
+    except AccessError:
+        return False
+    return True
+
+
+class ImagePipelineController(http.Controller):
+    @http.route(
+        "/ihs_image/<string:model>/<int:res_id>/<string:field>/<int:size>",
+        type="http",
+        auth="public",
+        readonly=True,
+    )
+    def image_variant(self, model: str, res_id: int, field: str, size: int) -> http.Response:
+        """Serve the ``size`` variant of an image field from the thumbnail cache."""
+        pipeline = shared_pipeline()
+        if model not in request.env or size not in pipeline.sizes:
+            raise request.not_found()
+        record = request.env[model].browse(res_id).exists()
+        if not record or not isinstance(record._fields.get(field), fields.Image):
+            raise request.not_found()
+        # field groups too: the field is read below without the ORM's checks
+        if not _can_read(record, field):
+            raise request.not_found()
+        source = record.with_context(bin_size=False)[field]
+        if not source:
+            raise request.not_found()
+        try:
+            fmt, path = pipeline.get(base64.b64decode(source), size)
+        except ImageProcessError:
+            raise request.not_found() from None
+
+        # shared caches may only keep what anybody can read, as for /web/image
+        public = request.env.user._is_public() or _can_read(  # noqa: SLF001
+            record.with_user(request.env.ref("base.public_user")), field,
+        )
+        etag = f'"{path.stem}"'
+        headers = [
+            ("Content-Type", FORMAT_MIMETYPES[fmt]),
+            ("Cache-Control", f"{'public' if public else 'private'}, max-age={CACHE_MAX_AGE}"),
+            ("ETag", etag),
+        ]
+        if request.httprequest.headers.get("If-None-Match") == etag:
+            return request.make_response(b"", headers=headers, status=304)
+        return request.make_response(path.read_bytes(), headers=headers)
@@ -0,0 +1,61 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+from __future__ import annotations
+
+import importlib
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import odoo.addons
+from odoo.tools import config
+
+from .tools import DEFAULT_SIZES, ImagePipeline, ThumbnailCache, default_workers
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import ModuleType
+
+_lock = threading.Lock()
+_pipeline = None
+
+
+class _Import:
+    """Stands for the module ``name`` in the arguments sent to another process.
+
+    Unpickled as the import of the module there, without loading any code of
+    this addon: spawned pool processes start from a bare interpreter, where
+    the modules of addons cannot be imported before the addons path is set.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __reduce__(self) -> tuple[Callable[[str], ModuleType], tuple[str]]:
+        return importlib.import_module, (self.name,)
+
+
+def shared_pipeline() -> ImagePipeline:
+    """Return the process-wide :class:`ImagePipeline` configured from ``odoo.conf``.
+
+    Options: ``ihs_image_sizes`` (comma separated), ``ihs_image_cache_dir``
+    (defaults to ``<data_dir>/ihs_image_cache``), ``ihs_image_cache_max_mb``
+    and ``ihs_image_workers`` (defaults to the CPUs shared between the HTTP
+    worker processes, at most ``MAX_DEFAULT_WORKERS`` each).
+    """
+    global _pipeline  # noqa: PLW0603
+    with _lock:
+        if _pipeline is None:
+            sizes = config.get("ihs_image_sizes")
+            cache_dir = config.get("ihs_image_cache_dir") or Path(config["data_dir"], "ihs_image_cache")
+            max_mb = int(config.get("ihs_image_cache_max_mb") or 1024)
+            workers = int(config.get("ihs_image_workers") or 0) or default_workers(config["workers"])
+            _pipeline = ImagePipeline(
+                ThumbnailCache(cache_dir, max_mb * 2**20),
+                [int(size) for size in str(sizes).split(",")] if sizes else DEFAULT_SIZES,
+                max_workers=workers,
+                # restores the addons path before the render functions are unpickled
+                initializer=setattr,
+                initargs=(_Import("odoo.addons"), "__path__", list(odoo.addons.__path__)),
+            )
+        return _pipeline
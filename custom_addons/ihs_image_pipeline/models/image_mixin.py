@@ -0,0 +1,58 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+from __future__ import annotations
+
+import base64
+import binascii
+import logging
+from typing import TYPE_CHECKING
+
+from odoo import api, models
+from odoo.addons.ihs_image_pipeline.images import shared_pipeline
+from odoo.addons.ihs_image_pipeline.tools import ImageProcessError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+_logger = logging.getLogger(__name__)
+
+
+class ImageMixin(models.AbstractModel):
+    _inherit = "image.mixin"
+
+    @api.model_create_multi
+    def create(self, vals_list: list[dict]):
+        """Warm the image variants of the new records."""
+        records = super().create(vals_list)
+        self._warm_image_variants(vals.get("image_1920") for vals in vals_list)
+        return records
+
+    def write(self, vals: dict):
+        """Warm the image variants of a new ``image_1920``."""
+        res = super().write(vals)
+        if vals.get("image_1920"):
+            self._warm_image_variants([vals["image_1920"]])
+        return res
+
+    def _warm_image_variants(self, images: Iterable[str | bytes | bool]) -> None:
+        """Render the cached variants of uploaded images once the transaction is committed."""
+        sources = []
+        for image in images:
+            if not image:
+                continue
+            try:
+                sources.append(base64.b64decode(image))
+            except (binascii.Error, TypeError):
+                continue
+        if not sources:
+            return
+
+        def warm() -> None:
+            pipeline = shared_pipeline()
+            for data in sources:
+                try:
+                    pipeline.submit(data)
+                except ImageProcessError as exc:
+                    _logger.info("Not warming image variants: %s", exc)
+
+        self.env.cr.postcommit.add(warm)
@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+from .cache import ThumbnailCache, source_digest
+from .pipeline import DEFAULT_SIZES, MAX_DEFAULT_WORKERS, ImagePipeline, default_workers, source_format
+from .resize import FORMAT_MIMETYPES, ImageProcessError, render_variants, render_variants_naive
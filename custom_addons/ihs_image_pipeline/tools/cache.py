@@ -0,0 +1,126 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Content-addressed on-disk cache of image variants with LRU eviction.
+
+Entries are keyed by the SHA-256 of the source image and the variant size,
+and stored as ``<root>/<2 hex>/<digest>-<size>.<ext>``. The modification
+time of a file is its last use, so the LRU order survives restarts; each
+process keeps its own view of the cache and treats files evicted by another
+process as misses.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+DEFAULT_MAX_BYTES = 1 << 30
+EXTENSIONS = {"JPEG": "jpg", "PNG": "png", "WEBP": "webp"}
+
+
+def source_digest(data: bytes) -> str:
+    """Return the cache key of a source image."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class ThumbnailCache:
+    """Variants on disk, evicted least recently used first beyond ``max_bytes``."""
+
+    def __init__(self, root: str | os.PathLike[str], max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Use (and index) the cache directory ``root``."""
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._bytes = 0
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._scan()
+
+    def _scan(self) -> None:
+        """Index the files already in the cache, oldest use first."""
+        found = []
+        for path in self.root.glob("??/*-*.*"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            found.append((stat.st_mtime_ns, path.name, stat.st_size))
+        found.sort()
+        for _mtime, name, size in found:
+            self._entries[name] = size
+            self._bytes += size
+        self._evict()
+
+    @staticmethod
+    def filename(digest: str, size: int, fmt: str) -> str:
+        """Return the file name of a variant."""
+        return f"{digest}-{size}.{EXTENSIONS.get(fmt, fmt.lower())}"
+
+    def path(self, name: str) -> Path:
+        """Return where the file ``name`` lives."""
+        return self.root / name[:2] / name
+
+    def lookup(self, digest: str, size: int, fmt: str) -> Path | None:
+        """Return the path of a cached variant and mark it as used, or None."""
+        name = self.filename(digest, size, fmt)
+        path = self.path(name)
+        try:
+            os.utime(path)
+            size_bytes = path.stat().st_size
+        except FileNotFoundError:
+            # never cached, or evicted by another process
+            with self._lock:
+                self._bytes -= self._entries.pop(name, 0)
+                self.misses += 1
+            return None
+        with self._lock:
+            self._bytes += size_bytes - self._entries.pop(name, 0)
+            self._entries[name] = size_bytes
+            self.hits += 1
+        return path
+
+    def get(self, digest: str, size: int, fmt: str) -> bytes | None:
+        """Return the bytes of a cached variant, or None."""
+        path = self.lookup(digest, size, fmt)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def put(self, digest: str, size: int, fmt: str, data: bytes) -> Path:
+        """Store a variant atomically and evict old entries if the cache is full."""
+        name = self.filename(digest, size, fmt)
+        path = self.path(name)
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+        Path(tmp_name).replace(path)
+        with self._lock:
+            previous = self._entries.pop(name, 0)
+            self._entries[name] = len(data)
+            self._bytes += len(data) - previous
+            self._evict()
+        return path
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits; lock held."""
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            name, size = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+            self.path(name).unlink(missing_ok=True)
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of the indexed entries."""
+        return self._bytes
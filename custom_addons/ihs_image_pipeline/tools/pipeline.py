@@ -0,0 +1,151 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Resize images in a process pool and keep the variants in a disk cache.
+
+Decoding and resampling run in worker processes, so the calling thread (an
+HTTP worker) only hashes the source, reads the image header and waits on a
+future while the GIL stays free for other requests.
+"""
+
+from __future__ import annotations
+
+import io
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from PIL import Image
+
+from .cache import ThumbnailCache, source_digest
+from .resize import DEFAULT_QUALITY, ImageProcessError, output_format, render_variants
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+DEFAULT_SIZES = (1024, 512, 256, 128)
+# every HTTP worker process has a pool of its own
+MAX_DEFAULT_WORKERS = 4
+
+
+def default_workers(processes: int = 1) -> int:
+    """Return the pool size sharing the CPUs between ``processes`` pools, at most ``MAX_DEFAULT_WORKERS``."""
+    return max(1, min(MAX_DEFAULT_WORKERS, (os.cpu_count() or 1) // max(processes, 1)))
+
+
+def source_format(data: bytes) -> str:
+    """Return the output format for ``data``, reading only the image header."""
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            return output_format(image.format)
+    except (OSError, SyntaxError) as exc:
+        msg = f"Cannot identify image: {exc}"
+        raise ImageProcessError(msg) from exc
+
+
+class ImagePipeline:
+    """Serve size variants of images from the cache, rendering misses in a pool.
+
+    The pool processes are started with ``context`` (``spawn`` by default, as
+    forking a threaded server copies locks held by its other threads), and
+    run ``initializer(*initargs)`` first.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        cache: ThumbnailCache,
+        sizes: Iterable[int] = DEFAULT_SIZES,
+        max_workers: int | None = None,
+        quality: int = DEFAULT_QUALITY,
+        *,
+        context: str = "spawn",
+        initializer: Callable[..., object] | None = None,
+        initargs: tuple[Any, ...] = (),
+    ) -> None:
+        """Render ``sizes`` of every image with up to ``max_workers`` processes."""
+        self.cache = cache
+        self.sizes = tuple(sorted(set(sizes), reverse=True))
+        self.max_workers = max_workers or default_workers()
+        self.quality = quality
+        self.initializer = initializer
+        self.initargs = initargs
+        self._context = multiprocessing.get_context(context)
+        self.renders = 0
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_pid: int | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """The process pool of the current process, created on first use.
+
+        A pool inherited through ``fork`` (prefork HTTP workers) is unusable, so
+        a new one is made when the process id changes.
+        """
+        with self._lock:
+            if self._executor is None or self._executor_pid != os.getpid():
+                self._executor = ProcessPoolExecutor(
+                    self.max_workers, mp_context=self._context, initializer=self.initializer, initargs=self.initargs,
+                )
+                self._executor_pid = os.getpid()
+            return self._executor
+
+    def _missing(self, digest: str, fmt: str) -> list[int]:
+        return [size for size in self.sizes if self.cache.lookup(digest, size, fmt) is None]
+
+    def _store(self, digest: str, fmt: str, variants: dict[int, bytes]) -> dict[int, Path]:
+        self.renders += 1
+        return {size: self.cache.put(digest, size, fmt, data) for size, data in variants.items()}
+
+    def submit(self, data: bytes) -> Future:
+        """Render the missing variants of ``data`` in the background.
+
+        The returned future resolves to ``{size: path}`` of the variants it
+        rendered, which is empty when everything was cached already.
+        """
+        digest, fmt = source_digest(data), source_format(data)
+        missing = self._missing(digest, fmt)
+        if not missing:
+            done: Future = Future()
+            done.set_result({})
+            return done
+        result: Future = Future()
+        render = self.executor.submit(render_variants, data, missing, self.quality)
+
+        def store(render: Future) -> None:
+            try:
+                rendered_fmt, variants = render.result()
+                result.set_result(self._store(digest, rendered_fmt, variants))
+            except BaseException as exc:  # noqa: BLE001
+                result.set_exception(exc)
+
+        render.add_done_callback(store)
+        return result
+
+    def get(self, data: bytes, size: int) -> tuple[str, Path]:
+        """Return ``(format, path)`` of the ``size`` variant of ``data``.
+
+        On a miss every missing configured size is rendered at once, so the
+        source is decoded a single time for all of them.
+        """
+        if size not in self.sizes:
+            msg = f"Size {size} is not one of the configured sizes {self.sizes}"
+            raise ValueError(msg)
+        digest, fmt = source_digest(data), source_format(data)
+        path = self.cache.lookup(digest, size, fmt)
+        if path is not None:
+            return fmt, path
+        missing = self._missing(digest, fmt)
+        rendered_fmt, variants = self.executor.submit(
+            render_variants, data, [*missing, size], self.quality,
+        ).result()
+        return rendered_fmt, self._store(digest, rendered_fmt, variants)[size]
+
+    def shutdown(self) -> None:
+        """Stop the worker processes of this process' pool."""
+        with self._lock:
+            if self._executor is not None and self._executor_pid == os.getpid():
+                self._executor.shutdown()
+            self._executor = None
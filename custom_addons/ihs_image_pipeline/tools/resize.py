@@ -0,0 +1,117 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Produce every size variant of an image from a single decode.
+
+JPEG sources are decoded directly at a reduced scale with ``Image.draft``
+(the DCT scaling of libjpeg), then each variant is derived from the previous,
+larger one with ``Image.reduce`` for the integer part of the ratio and a
+Lanczos resize for the rest. Smaller variants never touch the full-size pixels.
+"""
+
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING
+
+from PIL import Image, ImageOps
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+DEFAULT_QUALITY = 85
+# keep at least this much resolution above the target before the final resize
+REDUCING_GAP = 2.0
+FORMAT_MIMETYPES = {
+    "JPEG": "image/jpeg",
+    "PNG": "image/png",
+    "WEBP": "image/webp",
+}
+
+
+class ImageProcessError(ValueError):
+    """Raised when the source cannot be decoded as an image."""
+
+
+def _scaled(image: Image.Image, box: int) -> Image.Image:
+    """Return ``image`` scaled to fit in ``box`` x ``box``, never upscaled."""
+    width, height = image.size
+    ratio = max(width, height) / box
+    if ratio <= 1:
+        return image
+    target = (max(1, round(width / ratio)), max(1, round(height / ratio)))
+    factor = int(ratio / REDUCING_GAP)
+    if factor > 1:
+        image = image.reduce(factor)
+    return image.resize(target, Image.Resampling.LANCZOS)
+
+
+def _encode(image: Image.Image, fmt: str, quality: int) -> bytes:
+    buffer = io.BytesIO()
+    if fmt == "JPEG":
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        image.save(buffer, "JPEG", quality=quality, optimize=True, progressive=True)
+    elif fmt == "PNG":
+        image.save(buffer, "PNG", optimize=False, compress_level=6)
+    else:
+        image.save(buffer, fmt, quality=quality)
+    return buffer.getvalue()
+
+
+def output_format(source_format: str | None) -> str:
+    """Return the format variants of a ``source_format`` image are saved in."""
+    return source_format if source_format in ("JPEG", "PNG", "WEBP") else "PNG"
+
+
+def render_variants(
+    data: bytes, sizes: Iterable[int], quality: int = DEFAULT_QUALITY,
+) -> tuple[str, dict[int, bytes]]:
+    """Decode ``data`` once and return ``(format, {size: encoded variant})``.
+
+    Each size is the bounding box of the variant, the aspect ratio is kept.
+    Runs in worker processes, so it only takes and returns plain bytes.
+    """
+    sizes = sorted(set(sizes), reverse=True)
+    if not sizes:
+        return "PNG", {}
+    try:
+        image = Image.open(io.BytesIO(data))
+        fmt = output_format(image.format)
+        if image.format == "JPEG":
+            # let libjpeg decode at 1/2, 1/4 or 1/8 scale when that is still big enough
+            box = int(sizes[0] * REDUCING_GAP)
+            image.draft("RGB", (box, box))
+        image = ImageOps.exif_transpose(image)
+    except (OSError, SyntaxError, Image.DecompressionBombError) as exc:
+        msg = f"Cannot decode image: {exc}"
+        raise ImageProcessError(msg) from exc
+    if image.mode == "P":
+        image = image.convert("RGBA")
+    elif image.mode not in ("RGB", "RGBA", "L", "LA"):
+        image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+    variants = {}
+    for size in sizes:
+        image = _scaled(image, size)
+        variants[size] = _encode(image, fmt, quality)
+    return fmt, variants
+
+
+def render_variants_naive(
+    data: bytes, sizes: Iterable[int], quality: int = DEFAULT_QUALITY,
+) -> tuple[str, dict[int, bytes]]:
+    """Decode ``data`` at full size for every variant, as inline resizing does.
+
+    Only kept as the baseline of the benchmark.
+    """
+    variants = {}
+    fmt = "PNG"
+    for size in sorted(set(sizes), reverse=True):
+        image = Image.open(io.BytesIO(data))
+        fmt = output_format(image.format)
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ("RGB", "RGBA", "L", "LA"):
+            image = image.convert("RGBA")
+        image.thumbnail((size, size), Image.Resampling.LANCZOS, reducing_gap=None)
+        variants[size] = _encode(image, fmt, quality)
+    return fmt, variants
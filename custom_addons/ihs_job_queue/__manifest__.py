@@ -0,0 +1,28 @@
+{
+    "name": "IHS Job Queue",
+    "version": "18.0.1.0.0",
+    "summary": "PostgreSQL-backed job queue with channels, priorities, retries and worker processes.",
+    "description": """
+Runs model methods in the background. ``env["ihs.job"]._enqueue(records,
+"method", args, kwargs, channel="reports", priority=5)`` queues a job in the
+``ihs_job`` table, run after the transaction commits by the worker processes
+of ``scripts/job_runner.py``.
+
+Workers claim jobs by priority then ETA with ``SELECT ... FOR UPDATE SKIP
+LOCKED``, are woken by ``LISTEN/NOTIFY`` instead of polling, and retry failed
+jobs with an exponential backoff. Channels limit how many jobs of a kind run
+at once across all workers. Options in ``odoo.conf``: ``ihs_job_channels``
+(e.g. ``root:2,reports:1``), ``ihs_job_workers``, ``ihs_job_poll_interval``
+and ``ihs_job_keep_days``.
+""",
+    "author": "ihs-odoo",
+    "category": "Tools",
+    "license": "LGPL-3",
+    "depends": ["base"],
+    "data": [
+        "security/ir.model.access.csv",
+        "views/ihs_job_views.xml",
+    ],
+    "installable": True,
+    "application": False,
+}
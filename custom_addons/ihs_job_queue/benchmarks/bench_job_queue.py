@@ -0,0 +1,146 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Measure job throughput against the number of workers.
+
+Usage::
+
+    python custom_addons/ihs_job_queue/benchmarks/bench_job_queue.py -c odoo.conf --jobs 2000 --workers 1,2,4,8
+
+Queues ``--jobs`` jobs in a scratch table of the database of ``db_name``,
+then times worker processes draining it. A job sleeps ``--job-ms`` (waiting
+on I/O) and then spins ``--cpu-ms`` (computing): sleeping jobs scale with
+workers, computing ones with cores. ``--limit`` caps the channel, to check
+the cap holds across processes. ``--backend memory`` runs the workers as
+threads of one process on :class:`MemoryJobStore`, measuring the queue logic
+without the database.
+"""
+
+from __future__ import annotations
+
+import argparse
+import configparser
+import functools
+import sys
+import threading
+import time
+from pathlib import Path
+
+import psycopg2
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tools import MemoryJobStore, PostgresJobStore, Runner, Worker
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+TABLE = "ihs_job_bench"
+CHANNEL = "bench"
+
+
+def connection_params(config: Path) -> dict[str, str]:
+    """Return the psycopg2 connection parameters of an Odoo config file."""
+    options = configparser.ConfigParser()
+    options.read(config)
+    params = {
+        "dbname": options.get("options", "db_name", fallback="postgres"),
+        "host": options.get("options", "db_host", fallback=""),
+        "port": options.get("options", "db_port", fallback=""),
+        "user": options.get("options", "db_user", fallback=""),
+        "password": options.get("options", "db_password", fallback=""),
+    }
+    return {key: value for key, value in params.items() if value and value != "False"}
+
+
+def run_job(job_ms: float, cpu_ms: float, _job: object) -> None:
+    """Sleep then spin, as a job waiting on I/O then computing."""
+    time.sleep(job_ms / 1000)
+    deadline = time.perf_counter() + cpu_ms / 1000
+    while time.perf_counter() < deadline:
+        pass
+
+
+def build_worker(params: dict[str, str], job_ms: float, cpu_ms: float, limit: int, index: int) -> Worker:
+    """Build a worker process of the PostgreSQL backend."""
+    store = PostgresJobStore(functools.partial(psycopg2.connect, **params), TABLE)
+    return Worker(store, {"root": limit, CHANNEL: limit}, functools.partial(run_job, job_ms, cpu_ms), f"bench/{index}")
+
+
+def bench_postgres(params: dict[str, str], args: argparse.Namespace, workers: int) -> float:
+    """Return the seconds taken by ``workers`` processes to run the jobs."""
+    store = PostgresJobStore(functools.partial(psycopg2.connect, **params), TABLE)
+    try:
+        store.ensure_schema()
+        with store.conn.cursor() as cr:
+            cr.execute(f"TRUNCATE {TABLE}")
+        runner = Runner(
+            functools.partial(build_worker, params, args.job_ms, args.cpu_ms, args.limit or workers), workers,
+        )
+        runner.start()
+        try:
+            # wait for the workers to listen, so start-up is not timed
+            time.sleep(args.warmup)
+            start = time.perf_counter()
+            store.enqueue_many(CHANNEL, ({"n": n} for n in range(args.jobs)))
+            while store.counts().get("done", 0) < args.jobs:
+                time.sleep(0.01)
+            return time.perf_counter() - start
+        finally:
+            runner.stop()
+    finally:
+        store.close()
+
+
+def bench_memory(args: argparse.Namespace, workers: int) -> float:
+    """Return the seconds taken by ``workers`` threads to run the jobs."""
+    store = MemoryJobStore()
+    stop = threading.Event()
+    execute = functools.partial(run_job, args.job_ms, args.cpu_ms)
+    limit = args.limit or workers
+    threads = [
+        threading.Thread(target=Worker(store, {"root": limit, CHANNEL: limit}, execute, f"bench/{index}").run, args=(stop,))
+        for index in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    start = time.perf_counter()
+    for n in range(args.jobs):
+        store.enqueue(CHANNEL, {"n": n})
+    while store.counts().get("done", 0) < args.jobs:
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return elapsed
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark and print one line per worker count."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-c", "--config", type=Path, default=REPO_ROOT / "odoo.conf")
+    parser.add_argument("--backend", choices=("postgres", "memory"), default="postgres")
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument("--workers", default="1,2,4,8", help="comma-separated worker counts")
+    parser.add_argument("--job-ms", type=float, default=5.0, help="sleep of a job")
+    parser.add_argument("--cpu-ms", type=float, default=0.0, help="computation of a job")
+    parser.add_argument("--limit", type=int, help="concurrency limit of the channel (default: workers)")
+    parser.add_argument("--warmup", type=float, default=3.0, help="seconds for the processes to start")
+    args = parser.parse_args(argv)
+    params = connection_params(args.config)
+
+    out = sys.stdout
+    out.write(f"{args.jobs} jobs of {args.job_ms:g} ms sleep + {args.cpu_ms:g} ms CPU, {args.backend} backend\n")
+    out.write(f"{'workers':>8} {'seconds':>9} {'jobs/s':>9} {'speedup':>8}\n")
+    baseline = None
+    for workers in (int(value) for value in args.workers.split(",")):
+        if args.backend == "memory":
+            elapsed = bench_memory(args, workers)
+        else:
+            elapsed = bench_postgres(params, args, workers)
+        rate = args.jobs / elapsed
+        baseline = baseline or rate
+        out.write(f"{workers:>8} {elapsed:>9.2f} {rate:>9.0f} {rate / baseline:>7.2f}x\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
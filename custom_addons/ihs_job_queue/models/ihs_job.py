@@ -0,0 +1,125 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+from __future__ import annotations
+
+import datetime as dt
+from typing import TYPE_CHECKING, Any
+
+from odoo import _, api, fields, models
+from odoo.addons.ihs_job_queue.tools import (
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_PRIORITY,
+    NOTIFY_CHANNEL,
+    PENDING_INDEX,
+    ROOT_CHANNEL,
+)
+from odoo.exceptions import UserError
+from odoo.tools import config, sql
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# context keys kept for the execution of a job
+CONTEXT_KEYS = ("lang", "tz", "allowed_company_ids")
+
+
+class IhsJob(models.Model):
+    _name = "ihs.job"
+    _description = "Background Job"
+    _order = "id desc"
+
+    name = fields.Char(readonly=True)
+    channel = fields.Char(required=True, default=ROOT_CHANNEL, readonly=True, index=True)
+    priority = fields.Integer(required=True, default=DEFAULT_PRIORITY, readonly=True, help="Lower runs first")
+    state = fields.Selection(
+        [
+            ("pending", "Pending"),
+            ("running", "Running"),
+            ("done", "Done"),
+            ("failed", "Failed"),
+        ],
+        default="pending",
+        required=True,
+        readonly=True,
+        index=True,
+    )
+    payload = fields.Json(readonly=True)
+    attempts = fields.Integer(required=True, default=0, readonly=True)
+    max_attempts = fields.Integer(required=True, default=DEFAULT_MAX_ATTEMPTS, readonly=True)
+    eta = fields.Datetime(required=True, default=fields.Datetime.now, readonly=True, help="Not run before")
+    date_started = fields.Datetime(readonly=True)
+    date_done = fields.Datetime(readonly=True)
+    worker = fields.Char(readonly=True)
+    result = fields.Text(readonly=True)
+    error = fields.Text(readonly=True)
+
+    def init(self) -> None:
+        """Index the pending jobs in the order workers claim them."""
+        sql.create_index(
+            self.env.cr, "ihs_job_pending_index", self._table, list(PENDING_INDEX), where="state = 'pending'",
+        )
+
+    @api.model
+    def _enqueue(  # noqa: PLR0913
+        self,
+        records: models.BaseModel,
+        method: str,
+        args: Iterable[Any] = (),
+        kwargs: dict[str, Any] | None = None,
+        *,
+        channel: str = ROOT_CHANNEL,
+        priority: int = DEFAULT_PRIORITY,
+        eta: dt.datetime | None = None,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        name: str | None = None,
+    ) -> IhsJob:
+        """Queue ``records.method(*args, **kwargs)`` to run in a job worker.
+
+        The call runs as the current user with the language, timezone and
+        companies of the current context, once the transaction is committed.
+        Arguments must be JSON serializable.
+        """
+        model = records._name  # noqa: SLF001
+        if method.startswith("__") or not callable(getattr(records, method, None)):
+            raise UserError(_("%(model)s has no method %(method)s", model=model, method=method))
+        context = {key: self.env.context[key] for key in CONTEXT_KEYS if key in self.env.context}
+        job = self.sudo().create({
+            "name": name or f"{model}.{method}",
+            "channel": channel,
+            "priority": priority,
+            "eta": eta or fields.Datetime.now(),
+            "max_attempts": max_attempts,
+            "payload": {
+                "model": model,
+                "method": method,
+                "ids": records.ids,
+                "args": list(args),
+                "kwargs": kwargs or {},
+                "uid": self.env.uid,
+                "context": context,
+            },
+        })
+        # delivered to the listening workers when the transaction commits
+        self.env.cr.execute("SELECT pg_notify(%s, %s)", [NOTIFY_CHANNEL, channel])
+        return job
+
+    def action_requeue(self):
+        """Run failed jobs again, with a fresh count of attempts."""
+        if self.filtered(lambda job: job.state != "failed"):
+            raise UserError(_("Only failed jobs can be queued again."))
+        self.write({"state": "pending", "attempts": 0, "eta": fields.Datetime.now(), "worker": False})
+        for channel in set(self.mapped("channel")):
+            self.env.cr.execute("SELECT pg_notify(%s, %s)", [NOTIFY_CHANNEL, channel])
+
+    def action_cancel(self):
+        """Give up on pending jobs."""
+        if self.filtered(lambda job: job.state != "pending"):
+            raise UserError(_("Only pending jobs can be cancelled."))
+        self.write({"state": "failed", "error": _("Cancelled by %s", self.env.user.name)})
+
+    @api.autovacuum
+    def _gc_done_jobs(self) -> None:
+        """Delete the jobs done for more than ``ihs_job_keep_days`` days (7 by default)."""
+        days = int(config.get("ihs_job_keep_days") or 7)
+        limit = fields.Datetime.now() - dt.timedelta(days=days)
+        self.search([("state", "=", "done"), ("date_done", "<", limit)]).unlink()
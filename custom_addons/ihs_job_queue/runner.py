@@ -0,0 +1,54 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+from __future__ import annotations
+
+import psycopg2
+from odoo import api, models
+from odoo.modules.registry import Registry
+from odoo.sql_db import connection_info_for
+from odoo.tools import config
+
+from .tools import Job, PostgresJobStore, Worker, parse_channels
+
+
+class OdooExecutor:
+    """Run the ORM call of a job in its own transaction on ``dbname``."""
+
+    def __init__(self, dbname: str) -> None:
+        """Run jobs of ``dbname``."""
+        self.dbname = dbname
+
+    def __call__(self, job: Job) -> object:
+        """Call the method of the job, committing when it returns."""
+        payload = job.payload
+        registry = Registry(self.dbname).check_signaling()
+        try:
+            with registry.cursor() as cr:
+                env = api.Environment(cr, payload["uid"], payload.get("context") or {})
+                records = env[payload["model"]].browse(payload["ids"])
+                result = getattr(records, payload["method"])(*payload["args"], **payload["kwargs"])
+                # records are tied to the closed cursor, keep their ids
+                if isinstance(result, models.BaseModel):
+                    result = result.ids
+        except Exception:
+            registry.reset_changes()
+            raise
+        registry.signal_changes()
+        return result
+
+
+def build_worker(dbname: str, index: int) -> Worker:
+    """Return a worker of ``dbname`` configured from ``odoo.conf``.
+
+    Options: ``ihs_job_channels`` (``name:limit`` pairs, ``root:1`` by
+    default) and ``ihs_job_poll_interval`` (seconds).
+    """
+    _db, info = connection_info_for(dbname)
+    store = PostgresJobStore(lambda: psycopg2.connect(**info))
+    return Worker(
+        store,
+        parse_channels(config.get("ihs_job_channels")),
+        OdooExecutor(dbname),
+        name=f"{dbname}/{index}",
+        poll_interval=float(config.get("ihs_job_poll_interval") or 60),
+    )
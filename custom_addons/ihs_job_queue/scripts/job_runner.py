@@ -0,0 +1,85 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Run the background jobs of an Odoo database in worker processes.
+
+Usage::
+
+    python custom_addons/ihs_job_queue/scripts/job_runner.py -c odoo.conf -d mydb
+
+Starts ``ihs_job_workers`` processes (one per CPU by default), each running
+the jobs of the channels of ``ihs_job_channels`` within their concurrency
+limits, and restarts the ones that die. SIGTERM lets running jobs finish.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import logging
+import signal
+import sys
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import odoo
+from odoo.tools import config
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from odoo.addons.ihs_job_queue.tools import Worker
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+_logger = logging.getLogger("ihs_job_queue.runner")
+
+
+def build_worker(dbname: str, index: int) -> Worker:
+    """Build the worker of a worker process, see :func:`run_process`."""
+    from odoo.addons.ihs_job_queue.runner import build_worker as build_odoo_worker  # noqa: PLC0415
+
+    return build_odoo_worker(dbname, index)
+
+
+def run_process(config_path: str, factory: Callable[[int], Worker], index: int) -> None:
+    """Load the Odoo configuration in a worker process, then run its worker.
+
+    Spawned processes import this script as their main module, so they can
+    unpickle this function while no addon is importable yet: addons are
+    importable once the addons path is configured.
+    """
+    config.parse_config(["-c", config_path])
+    odoo.netsvc.init_logger()
+    from odoo.addons.ihs_job_queue.tools import run_worker  # noqa: PLC0415
+
+    run_worker(factory, index)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the workers until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-c", "--config", type=Path, default=REPO_ROOT / "odoo.conf")
+    parser.add_argument("-d", "--database", required=True)
+    parser.add_argument("--workers", type=int, help="worker processes (default: ihs_job_workers)")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    config.parse_config(["-c", str(args.config)])
+    from odoo.addons.ihs_job_queue.tools import Runner  # noqa: PLC0415
+
+    workers = args.workers or int(config.get("ihs_job_workers") or 0) or None
+    runner = Runner(
+        functools.partial(build_worker, args.database), workers, main=functools.partial(run_process, str(args.config)),
+    )
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_args: stop.set())
+    signal.signal(signal.SIGINT, lambda *_args: stop.set())
+    runner.start()
+    _logger.info("Running jobs of %s in %d process(es)", args.database, runner.processes)
+    runner.supervise(stop)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
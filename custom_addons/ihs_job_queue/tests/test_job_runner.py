@@ -0,0 +1,61 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import odoo
+import psycopg2
+from odoo import SUPERUSER_ID
+from odoo.addons.ihs_job_queue.tools import PostgresJobStore
+from odoo.sql_db import connection_info_for
+from odoo.tests.common import BaseCase, get_db_name, tagged
+from odoo.tools import config
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "job_runner.py"
+TIMEOUT = 60
+
+
+@tagged("post_install", "-at_install")
+class TestJobRunner(BaseCase):
+    def test_spawned_worker_runs_job(self):
+        # the workers start from a fresh interpreter, and only know the configuration file
+        if not config.rcfile or not Path(config.rcfile).is_file():
+            self.skipTest("The job runner needs a configuration file")
+        dbname = get_db_name()
+        _db, info = connection_info_for(dbname)
+        store = PostgresJobStore(lambda: psycopg2.connect(**info))
+        self.addCleanup(store.close)
+        payload = {
+            "model": "res.users",
+            "ids": [SUPERUSER_ID],
+            "method": "exists",
+            "args": [],
+            "kwargs": {},
+            "uid": SUPERUSER_ID,
+        }
+        job_id = store.enqueue("root", payload, max_attempts=1, name="job runner smoke test")
+        self.addCleanup(store._execute, "DELETE FROM ihs_job WHERE id = %s", [job_id])
+
+        pythonpath = [str(Path(odoo.__file__).resolve().parents[1]), os.environ.get("PYTHONPATH", "")]
+        process = subprocess.Popen(  # noqa: S603
+            [sys.executable, str(SCRIPT), "-c", config.rcfile, "-d", dbname, "--workers", "1"],
+            env=dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, pythonpath))),
+        )
+
+        def stop():
+            process.terminate()
+            process.wait(TIMEOUT)
+
+        self.addCleanup(stop)
+        deadline = time.monotonic() + TIMEOUT
+        state = result = None
+        while time.monotonic() < deadline and process.poll() is None:
+            [(state, result)] = store._execute("SELECT state, result FROM ihs_job WHERE id = %s", [job_id])
+            if state in ("done", "failed"):
+                break
+            time.sleep(0.2)
+        self.assertIsNone(process.poll(), "the job runner exited")
+        self.assertEqual((state, result), ("done", f"[{SUPERUSER_ID}]"))
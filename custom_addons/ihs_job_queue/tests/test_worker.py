@@ -0,0 +1,122 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+import datetime as dt
+import threading
+
+from odoo.addons.ihs_job_queue.tools import (
+    DONE,
+    FAILED,
+    PENDING,
+    MemoryJobStore,
+    NoRetryError,
+    Worker,
+    parse_channels,
+)
+from odoo.addons.ihs_job_queue.tools import worker as worker_module
+from odoo.tests.common import BaseCase
+
+
+class TestWorker(BaseCase):
+    def setUp(self):
+        super().setUp()
+        self.store = MemoryJobStore()
+        self.ran = []
+
+    def execute(self, job):
+        self.ran.append(job.payload["n"])
+        if job.payload.get("error"):
+            msg = "boom"
+            raise job.payload["error"](msg)
+        return job.payload["n"] * 2
+
+    def worker(self, channels="root:1"):
+        return Worker(self.store, parse_channels(channels), self.execute, "test")
+
+    def record(self, job_id):
+        return self.store.jobs[job_id]
+
+    def test_runs_jobs_by_priority(self):
+        low = self.store.enqueue("root", {"n": 1}, priority=20)
+        high = self.store.enqueue("root", {"n": 2}, priority=5)
+        worker = self.worker()
+        while worker.run_once():
+            pass
+        self.assertEqual(self.ran, [2, 1])
+        self.assertEqual((self.record(low)["state"], self.record(low)["result"]), (DONE, "2"))
+        self.assertEqual((self.record(high)["state"], self.record(high)["result"]), (DONE, "4"))
+        self.assertEqual(worker.done, 2)
+
+    def test_retry_is_delayed(self):
+        job_id = self.store.enqueue("root", {"n": 1, "error": ValueError})
+        worker = self.worker()
+        self.assertTrue(worker.run_once())
+        record = self.record(job_id)
+        self.assertEqual((record["state"], worker.retried), (PENDING, 1))
+        self.assertIn("ValueError: boom", record["error"])
+        self.assertFalse(worker.run_once())
+        self.assertGreater(self.store.next_eta(), 0)
+
+    def test_fails_after_max_attempts(self):
+        self.patch(worker_module, "retry_delay", lambda _attempt: 0)
+        job_id = self.store.enqueue("root", {"n": 1, "error": ValueError}, max_attempts=2)
+        worker = self.worker()
+        self.assertTrue(worker.run_once())
+        self.assertEqual(self.record(job_id)["state"], PENDING)
+        self.assertTrue(worker.run_once())
+        self.assertEqual((self.record(job_id)["state"], worker.failed), (FAILED, 1))
+
+    def test_no_retry_error(self):
+        job_id = self.store.enqueue("root", {"n": 1, "error": NoRetryError})
+        self.assertTrue(self.worker().run_once())
+        self.assertEqual(self.record(job_id)["state"], FAILED)
+
+    def test_delayed_job(self):
+        eta = dt.datetime.now(dt.UTC) + dt.timedelta(hours=1)
+        self.store.enqueue("root", {"n": 1}, eta=eta)
+        self.assertFalse(self.worker().run_once())
+        self.assertAlmostEqual(self.store.next_eta(), 3600, delta=60)
+
+    def test_channel_limit(self):
+        self.store.enqueue("reports", {"n": 1})
+        self.store.enqueue("other", {"n": 2})
+        slot = self.store.acquire_slot("reports", 1)
+        worker = self.worker("root:1,reports:1")
+        # jobs of unlisted channels share the root channel's slots
+        self.assertTrue(worker.run_once())
+        self.assertFalse(worker.run_once())
+        self.assertEqual((self.ran, worker.blocked), ([2], ["reports"]))
+        # the due job of the blocked channel waits for the slot, not for its eta
+        self.assertIsNone(self.store.next_eta(worker.blocked))
+        self.store.wait(0)
+        self.store.release_slot("reports", slot)
+        self.assertTrue(self.store.wait(0))
+        self.assertTrue(worker.run_once())
+        self.assertEqual(self.ran, [2, 1])
+
+    def test_wait_sees_each_announcement_once(self):
+        self.store.wait(0)
+        self.assertFalse(self.store.wait(0))
+        self.store.enqueue("root", {"n": 1})
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append(self.store.wait(1)))
+        thread.start()
+        thread.join()
+        self.assertEqual(seen, [True])
+        self.assertTrue(self.store.wait(0))
+        self.assertFalse(self.store.wait(0))
+
+    def test_run_until_stopped(self):
+        for n in range(3):
+            self.store.enqueue("root", {"n": n})
+        stop = threading.Event()
+        worker = Worker(self.store, parse_channels("root:2"), self.execute, "test", poll_interval=0.05)
+        thread = threading.Thread(target=worker.run, args=(stop,))
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(stop.set)
+        self.store.enqueue("root", {"n": 3})
+        for _attempt in range(100):
+            if self.store.counts().get(DONE) == len(self.store.jobs):
+                break
+            stop.wait(0.02)
+        self.assertEqual(self.store.counts(), {DONE: len(self.store.jobs)})
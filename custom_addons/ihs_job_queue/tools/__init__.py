@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+from .jobs import (
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_PRIORITY,
+    DONE,
+    FAILED,
+    PENDING,
+    ROOT_CHANNEL,
+    RUNNING,
+    STATES,
+    Job,
+    NoRetryError,
+    parse_channels,
+    retry_delay,
+)
+from .store import NOTIFY_CHANNEL, PENDING_INDEX, SCHEMA, JobStore, MemoryJobStore, PostgresJobStore
+from .worker import Runner, Worker, run_worker
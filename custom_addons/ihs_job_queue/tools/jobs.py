@@ -0,0 +1,68 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Jobs, channels and retry policy of the queue."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from typing import Any
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+STATES = (PENDING, RUNNING, DONE, FAILED)
+
+ROOT_CHANNEL = "root"
+DEFAULT_PRIORITY = 10
+DEFAULT_MAX_ATTEMPTS = 5
+RETRY_BASE = 10.0
+RETRY_CAP = 3600.0
+
+
+class NoRetryError(Exception):
+    """Raised by a job that must fail at once instead of being retried."""
+
+
+@dataclass
+class Job:
+    """A job claimed by a worker."""
+
+    id: int
+    channel: str
+    payload: dict[str, Any] = field(default_factory=dict)
+    priority: int = DEFAULT_PRIORITY
+    attempts: int = 0
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    name: str | None = None
+
+
+def parse_channels(spec: str | None) -> dict[str, int]:
+    """Parse ``"root:4,reports:2"`` into ``{channel: concurrency limit}``.
+
+    ``root`` runs the jobs of the channels that are not listed, and defaults
+    to a limit of 1 when absent.
+    """
+    channels = {}
+    for item in (spec or "").split(","):
+        if not item.strip():
+            continue
+        name, _sep, limit = item.partition(":")
+        try:
+            channels[name.strip()] = int(limit or 1)
+        except ValueError:
+            msg = f"Invalid channel limit in {item.strip()!r}"
+            raise ValueError(msg) from None
+    channels.setdefault(ROOT_CHANNEL, 1)
+    return channels
+
+
+def retry_delay(attempt: int, base: float = RETRY_BASE, cap: float = RETRY_CAP) -> float:
+    """Return the delay before retrying a job after its ``attempt``-th failure.
+
+    Exponential, capped, and jittered between half and all of it so jobs
+    failing together are not retried together.
+    """
+    delay = min(cap, base * 2 ** max(attempt - 1, 0))
+    return delay * random.uniform(0.5, 1.0)  # noqa: S311
@@ -0,0 +1,455 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Where jobs are kept: a PostgreSQL table, or memory for tests.
+
+With PostgreSQL, workers claim jobs with ``SELECT ... FOR UPDATE SKIP
+LOCKED``, so concurrent workers never wait on each other's rows. Each
+running job is covered by a session advisory lock of its worker, released
+when the job finishes or the connection dies: a running job whose lock can be
+taken belongs to a dead worker and is queued again. Channel concurrency is
+enforced with one advisory lock per slot of the channel. Workers ``LISTEN``
+for the notification sent with every new job, every finished or retried job
+and every freed slot instead of polling.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import heapq
+import itertools
+import select
+import threading
+import time
+import zlib
+from typing import TYPE_CHECKING, Any, Protocol
+
+from psycopg2 import extras
+
+from .jobs import DEFAULT_MAX_ATTEMPTS, DEFAULT_PRIORITY, DONE, FAILED, PENDING, RUNNING, Job
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+NOTIFY_CHANNEL = "ihs_job"
+# advisory lock namespaces (first key of the two-key form)
+JOB_LOCK_NS = 0x1A51
+SLOT_LOCK_NS = 0x1A52
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS ihs_job (
+    id serial PRIMARY KEY,
+    name varchar,
+    channel varchar NOT NULL,
+    priority integer NOT NULL DEFAULT 10,
+    state varchar NOT NULL DEFAULT 'pending',
+    payload jsonb,
+    attempts integer NOT NULL DEFAULT 0,
+    max_attempts integer NOT NULL DEFAULT 5,
+    eta timestamp NOT NULL DEFAULT (now() at time zone 'UTC'),
+    date_started timestamp,
+    date_done timestamp,
+    worker varchar,
+    result text,
+    error text
+);
+CREATE INDEX IF NOT EXISTS ihs_job_pending_index
+    ON ihs_job (channel, priority, eta, id) WHERE state = 'pending';
+"""
+PENDING_INDEX = ("channel", "priority", "eta", "id")
+
+
+def slot_key(channel: str, slot: int) -> int:
+    """Return the advisory lock key of ``slot`` of ``channel``, a signed int4."""
+    return zlib.crc32(f"{channel}/{slot}".encode()) - 2**31
+
+
+class JobStore(Protocol):
+    """Operations the workers need from the job storage."""
+
+    def enqueue(  # noqa: PLR0913
+        self,
+        channel: str,
+        payload: dict[str, Any],
+        *,
+        priority: int = DEFAULT_PRIORITY,
+        eta: dt.datetime | None = None,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        name: str | None = None,
+    ) -> int:
+        """Add a job and wake the workers up; return its id."""
+
+    def ready_channels(self) -> list[str]:
+        """Return the channels having jobs to run now, most urgent first."""
+
+    def acquire_slot(self, channel: str, limit: int) -> int | None:
+        """Take one of the ``limit`` slots of ``channel``, or return None if all are taken."""
+
+    def release_slot(self, channel: str, slot: int) -> None:
+        """Give back a slot taken with :meth:`acquire_slot`."""
+
+    def claim(self, channel: str, worker: str) -> Job | None:
+        """Mark the most urgent job of ``channel`` as running and return it."""
+
+    def complete(self, job: Job, result: str | None) -> None:
+        """Mark a claimed job as done."""
+
+    def fail(self, job: Job, error: str, retry_in: float | None) -> None:
+        """Retry a claimed job in ``retry_in`` seconds, or mark it failed when None."""
+
+    def next_eta(self, blocked: Iterable[str] = ()) -> float | None:
+        """Return the seconds until the next pending job is due, None if there is none.
+
+        Jobs already due in the ``blocked`` channels, whose slots are all
+        taken, are left out: freeing a slot sends a notification.
+        """
+
+    def wait(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for a new job; return whether one was announced."""
+
+    def requeue_dead(self) -> int:
+        """Queue again the running jobs of dead workers; return how many."""
+
+    def close(self) -> None:
+        """Release the resources of the store."""
+
+
+class PostgresJobStore:
+    """Jobs in the ``ihs_job`` table, through one autocommit psycopg2 connection."""
+
+    def __init__(self, connect: Callable[[], Any], table: str = "ihs_job") -> None:
+        """Open the connection with ``connect`` and listen for new jobs."""
+        self.table = table
+        self.conn = connect()
+        self.conn.autocommit = True
+        with self.conn.cursor() as cr:
+            cr.execute(f"LISTEN {NOTIFY_CHANNEL}")
+
+    def _execute(self, query: str, params: Iterable[Any] | None = None) -> list[tuple]:
+        with self.conn.cursor() as cr:
+            cr.execute(query.replace("ihs_job", self.table), params)
+            return cr.fetchall() if cr.description else []
+
+    def ensure_schema(self) -> None:
+        """Create the table when used outside of Odoo, which otherwise owns it."""
+        self._execute(SCHEMA)
+
+    def enqueue(  # noqa: PLR0913
+        self,
+        channel: str,
+        payload: dict[str, Any],
+        *,
+        priority: int = DEFAULT_PRIORITY,
+        eta: dt.datetime | None = None,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        name: str | None = None,
+    ) -> int:
+        """Add a job and wake the workers up; return its id."""
+        rows = self._execute(
+            """
+            WITH job AS (
+                INSERT INTO ihs_job (name, channel, priority, payload, max_attempts, eta)
+                VALUES (%s, %s, %s, %s, %s, COALESCE(%s, now() at time zone 'UTC'))
+                RETURNING id
+            )
+            SELECT id, pg_notify(%s, %s) FROM job
+            """,
+            (name, channel, priority, extras.Json(payload), max_attempts, eta, NOTIFY_CHANNEL, channel),
+        )
+        return rows[0][0]
+
+    def enqueue_many(self, channel: str, payloads: Iterable[dict[str, Any]], priority: int = DEFAULT_PRIORITY) -> int:
+        """Add jobs in pages of one statement each; return how many."""
+        count = 0
+        payloads = iter(payloads)
+        with self.conn.cursor() as cr:
+            while page := list(itertools.islice(payloads, 1000)):
+                extras.execute_values(
+                    cr,
+                    f"INSERT INTO {self.table} (channel, priority, payload) VALUES %s",  # noqa: S608
+                    [(channel, priority, extras.Json(payload)) for payload in page],
+                )
+                count += len(page)
+            cr.execute("SELECT pg_notify(%s, %s)", (NOTIFY_CHANNEL, channel))
+        return count
+
+    def ready_channels(self) -> list[str]:
+        """Return the channels having jobs to run now, most urgent first."""
+        rows = self._execute(
+            """
+            SELECT channel FROM ihs_job
+             WHERE state = 'pending' AND eta <= now() at time zone 'UTC'
+             GROUP BY channel
+             ORDER BY min(priority), min(eta)
+            """,
+        )
+        return [channel for (channel,) in rows]
+
+    def acquire_slot(self, channel: str, limit: int) -> int | None:
+        """Take one of the ``limit`` slots of ``channel``, or return None if all are taken."""
+        for slot in range(limit):
+            if self._execute("SELECT pg_try_advisory_lock(%s, %s)", (SLOT_LOCK_NS, slot_key(channel, slot)))[0][0]:
+                return slot
+        return None
+
+    def release_slot(self, channel: str, slot: int) -> None:
+        """Give back a slot taken with :meth:`acquire_slot`, waking up the workers waiting for one."""
+        self._execute(
+            "SELECT pg_advisory_unlock(%s, %s), pg_notify(%s, %s)",
+            (SLOT_LOCK_NS, slot_key(channel, slot), NOTIFY_CHANNEL, channel),
+        )
+
+    def claim(self, channel: str, worker: str) -> Job | None:
+        """Mark the most urgent job of ``channel`` as running and return it."""
+        rows = self._execute(
+            """
+            UPDATE ihs_job
+               SET state = 'running', attempts = attempts + 1, worker = %s,
+                   date_started = now() at time zone 'UTC'
+             WHERE id = (
+                    SELECT id FROM ihs_job
+                     WHERE state = 'pending' AND channel = %s AND eta <= now() at time zone 'UTC'
+                     ORDER BY priority, eta, id
+                     LIMIT 1
+                       FOR UPDATE SKIP LOCKED
+                   )
+            RETURNING id, channel, payload, priority, attempts, max_attempts, name,
+                      pg_advisory_lock(%s, id)
+            """,
+            (worker, channel, JOB_LOCK_NS),
+        )
+        if not rows:
+            return None
+        return Job(*rows[0][:7])
+
+    def complete(self, job: Job, result: str | None) -> None:
+        """Mark a claimed job as done."""
+        self._execute(
+            """
+            UPDATE ihs_job SET state = 'done', result = %s, error = NULL,
+                   date_done = now() at time zone 'UTC'
+             WHERE id = %s
+            RETURNING pg_advisory_unlock(%s, id), pg_notify(%s, channel)
+            """,
+            (result, job.id, JOB_LOCK_NS, NOTIFY_CHANNEL),
+        )
+
+    def fail(self, job: Job, error: str, retry_in: float | None) -> None:
+        """Retry a claimed job in ``retry_in`` seconds, or mark it failed when None."""
+        if retry_in is None:
+            query = """
+                UPDATE ihs_job SET state = 'failed', error = %s, date_done = now() at time zone 'UTC'
+                 WHERE id = %s
+                RETURNING pg_advisory_unlock(%s, id), pg_notify(%s, channel)
+            """
+            params = (error, job.id, JOB_LOCK_NS, NOTIFY_CHANNEL)
+        else:
+            query = """
+                UPDATE ihs_job SET state = 'pending', error = %s, worker = NULL,
+                       eta = now() at time zone 'UTC' + make_interval(secs => %s)
+                 WHERE id = %s
+                RETURNING pg_advisory_unlock(%s, id), pg_notify(%s, channel)
+            """
+            params = (error, retry_in, job.id, JOB_LOCK_NS, NOTIFY_CHANNEL)
+        self._execute(query, params)
+
+    def next_eta(self, blocked: Iterable[str] = ()) -> float | None:
+        """Return the seconds until the next pending job is due, None if there is none.
+
+        Jobs already due in the ``blocked`` channels, whose slots are all
+        taken, are left out: freeing a slot sends a notification.
+        """
+        rows = self._execute(
+            """
+            SELECT extract(epoch FROM min(eta) - now() at time zone 'UTC')
+              FROM ihs_job
+             WHERE state = 'pending' AND (channel <> ALL(%s) OR eta > now() at time zone 'UTC')
+            """,
+            (list(blocked),),
+        )
+        return None if rows[0][0] is None else max(float(rows[0][0]), 0.0)
+
+    def wait(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for a new job; return whether one was announced."""
+        if not self.conn.notifies:
+            if not select.select([self.conn], [], [], max(timeout, 0))[0]:
+                return False
+            self.conn.poll()
+        notified = bool(self.conn.notifies)
+        self.conn.notifies.clear()
+        return notified
+
+    def requeue_dead(self) -> int:
+        """Queue again the running jobs of dead workers; return how many.
+
+        Only call it while this connection holds no job lock: a session can
+        always take the locks it holds itself.
+        """
+        rows = self._execute(
+            """
+            UPDATE ihs_job
+               SET state = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'pending' END,
+                   error = 'Worker died while running the job', worker = NULL
+             WHERE state = 'running' AND pg_try_advisory_xact_lock(%s, id)
+            RETURNING id, pg_notify(%s, channel)
+            """,
+            (JOB_LOCK_NS, NOTIFY_CHANNEL),
+        )
+        return len(rows)
+
+    def counts(self) -> dict[str, int]:
+        """Return the number of jobs per state."""
+        return dict(self._execute("SELECT state, count(*) FROM ihs_job GROUP BY state"))
+
+    def close(self) -> None:
+        """Close the connection, releasing its locks."""
+        self.conn.close()
+
+
+class MemoryJobStore:
+    """Thread-safe in-memory stand-in of :class:`PostgresJobStore`, for tests and benchmarks.
+
+    Jobs are only visible to the threads of the process that created it.
+    """
+
+    def __init__(self) -> None:
+        """Start empty."""
+        self.jobs: dict[int, dict[str, Any]] = {}
+        self._ids = itertools.count(1)
+        # {channel: heap of (priority, eta, id)} of pending jobs
+        self._queues: dict[str, list[tuple[int, float, int]]] = {}
+        self._slots: dict[str, set[int]] = {}
+        self._condition = threading.Condition()
+        # like notifications queued on a connection, each thread sees every announcement once
+        self._announced = 0
+        self._seen = threading.local()
+
+    def enqueue(  # noqa: PLR0913
+        self,
+        channel: str,
+        payload: dict[str, Any],
+        *,
+        priority: int = DEFAULT_PRIORITY,
+        eta: dt.datetime | None = None,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        name: str | None = None,
+    ) -> int:
+        """Add a job and wake the workers up; return its id."""
+        with self._condition:
+            job_id = next(self._ids)
+            due = time.time() if eta is None else eta.replace(tzinfo=eta.tzinfo or dt.UTC).timestamp()
+            self.jobs[job_id] = {
+                "job": Job(job_id, channel, payload, priority, 0, max_attempts, name),
+                "state": PENDING,
+                "eta": due,
+                "result": None,
+                "error": None,
+            }
+            heapq.heappush(self._queues.setdefault(channel, []), (priority, due, job_id))
+            self._announce()
+            return job_id
+
+    def _announce(self) -> None:
+        """Wake up the waiting threads, like a notification; condition held."""
+        self._announced += 1
+        self._condition.notify_all()
+
+    def ready_channels(self) -> list[str]:
+        """Return the channels having jobs to run now, most urgent first."""
+        now = time.time()
+        with self._condition:
+            heads = []
+            for channel, queue in self._queues.items():
+                due = [item for item in queue if item[1] <= now]
+                if due:
+                    heads.append((min(due), channel))
+            return [channel for _head, channel in sorted(heads)]
+
+    def acquire_slot(self, channel: str, limit: int) -> int | None:
+        """Take one of the ``limit`` slots of ``channel``, or return None if all are taken."""
+        with self._condition:
+            taken = self._slots.setdefault(channel, set())
+            for slot in range(limit):
+                if slot not in taken:
+                    taken.add(slot)
+                    return slot
+            return None
+
+    def release_slot(self, channel: str, slot: int) -> None:
+        """Give back a slot taken with :meth:`acquire_slot`, waking up the workers waiting for one."""
+        with self._condition:
+            self._slots[channel].discard(slot)
+            self._announce()
+
+    def claim(self, channel: str, worker: str) -> Job | None:  # noqa: ARG002
+        """Mark the most urgent job of ``channel`` as running and return it."""
+        now = time.time()
+        with self._condition:
+            queue = self._queues.get(channel, [])
+            due = [item for item in queue if item[1] <= now]
+            if not due:
+                return None
+            item = min(due)
+            queue.remove(item)
+            heapq.heapify(queue)
+            record = self.jobs[item[2]]
+            record["state"] = RUNNING
+            record["job"].attempts += 1
+            return record["job"]
+
+    def complete(self, job: Job, result: str | None) -> None:
+        """Mark a claimed job as done."""
+        with self._condition:
+            self.jobs[job.id].update(state=DONE, result=result, error=None)
+            self._announce()
+
+    def fail(self, job: Job, error: str, retry_in: float | None) -> None:
+        """Retry a claimed job in ``retry_in`` seconds, or mark it failed when None."""
+        with self._condition:
+            record = self.jobs[job.id]
+            record["error"] = error
+            self._announce()
+            if retry_in is None:
+                record["state"] = FAILED
+                return
+            record.update(state=PENDING, eta=time.time() + retry_in)
+            heapq.heappush(self._queues.setdefault(job.channel, []), (job.priority, record["eta"], job.id))
+
+    def next_eta(self, blocked: Iterable[str] = ()) -> float | None:
+        """Return the seconds until the next pending job is due, None if there is none.
+
+        Jobs already due in the ``blocked`` channels, whose slots are all
+        taken, are left out: freeing a slot wakes the workers up.
+        """
+        blocked = set(blocked)
+        now = time.time()
+        with self._condition:
+            etas = [
+                item[1]
+                for channel, queue in self._queues.items()
+                for item in queue
+                if channel not in blocked or item[1] > now
+            ]
+        return max(min(etas) - now, 0.0) if etas else None
+
+    def wait(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for a new job; return whether one was announced."""
+        with self._condition:
+            seen = getattr(self._seen, "count", 0)
+            notified = self._condition.wait_for(lambda: self._announced != seen, max(timeout, 0))
+            self._seen.count = self._announced
+            return notified
+
+    def requeue_dead(self) -> int:
+        """Return 0: threads sharing the store cannot die without the process."""
+        return 0
+
+    def counts(self) -> dict[str, int]:
+        """Return the number of jobs per state."""
+        with self._condition:
+            counts: dict[str, int] = {}
+            for record in self.jobs.values():
+                counts[record["state"]] = counts.get(record["state"], 0) + 1
+            return counts
+
+    def close(self) -> None:
+        """Do nothing, for interface parity."""
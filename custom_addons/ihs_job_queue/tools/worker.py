@@ -0,0 +1,210 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Run jobs: one worker per process, and a runner supervising the processes.
+
+A worker runs one job at a time. It only queries the store when it was
+notified of a new job, a finished one or a freed channel slot, when a
+delayed job is due, or after a job finished, and otherwise sleeps on the
+store's ``wait``, also when due jobs wait for a slot; ``poll_interval`` is a
+safety net for lost notifications. The runner starts the worker processes, so jobs
+run on every core, and restarts the ones that die.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import time
+import traceback
+from typing import TYPE_CHECKING, Any
+
+from .jobs import ROOT_CHANNEL, NoRetryError, retry_delay
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .jobs import Job
+    from .store import JobStore
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL = 60.0
+DEFAULT_REAP_INTERVAL = 60.0
+# longest sleep between two checks of the stop flag
+STOP_CHECK_INTERVAL = 1.0
+MAX_RESULT_LENGTH = 10000
+
+
+class Worker:
+    """Take jobs from ``store`` and run them with ``execute``."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        store: JobStore,
+        channels: dict[str, int],
+        execute: Callable[[Job], Any],
+        name: str | None = None,
+        *,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        reap_interval: float = DEFAULT_REAP_INTERVAL,
+    ) -> None:
+        """Run the jobs of ``channels`` (``{name: concurrency limit}``)."""
+        self.store = store
+        self.channels = channels
+        self.execute = execute
+        self.name = name or f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+        self.poll_interval = poll_interval
+        self.reap_interval = reap_interval
+        self.done = 0
+        self.failed = 0
+        self.retried = 0
+        # ready channels whose slots were all taken at the last run_once
+        self.blocked: list[str] = []
+
+    def run_once(self) -> bool:
+        """Run the most urgent job a free channel slot allows; return whether one ran."""
+        self.blocked = []
+        for channel in self.store.ready_channels():
+            # jobs of channels without a limit of their own share the root channel's
+            limited = channel if channel in self.channels else ROOT_CHANNEL
+            slot = self.store.acquire_slot(limited, self.channels.get(limited, 0))
+            if slot is None:
+                self.blocked.append(channel)
+                continue
+            outcome = None
+            try:
+                job = self.store.claim(channel, self.name)
+                if job is not None:
+                    outcome = self._execute(job)
+            finally:
+                self.store.release_slot(limited, slot)
+            if job is not None:
+                # recorded once the slot is free, for the workers it wakes up to take it
+                self._record(job, *outcome)
+                return True
+        return False
+
+    def _execute(self, job: Job) -> tuple[Any, Exception | None, str | None]:
+        """Run ``job``; return its result, or the exception and traceback it raised."""
+        try:
+            return self.execute(job), None, None
+        except Exception as exc:  # noqa: BLE001
+            return None, exc, traceback.format_exc()
+
+    def _record(self, job: Job, result: Any, exc: Exception | None, error: str | None) -> None:  # noqa: ANN401
+        if exc is not None:
+            if isinstance(exc, NoRetryError) or job.attempts >= job.max_attempts:
+                _logger.warning("Job %s failed after %d attempt(s): %s", job.id, job.attempts, exc)
+                self.store.fail(job, error, None)
+                self.failed += 1
+            else:
+                delay = retry_delay(job.attempts)
+                _logger.info("Job %s failed (%s), retrying in %.0fs", job.id, exc, delay)
+                self.store.fail(job, error, delay)
+                self.retried += 1
+        else:
+            self.store.complete(job, None if result is None else str(result)[:MAX_RESULT_LENGTH])
+            self.done += 1
+
+    def run(self, stop: threading.Event | None = None) -> None:
+        """Run jobs until ``stop`` is set."""
+        stop = stop or threading.Event()
+        ready = True
+        wake_at = reap_at = poll_at = 0.0
+        while not stop.is_set():
+            now = time.monotonic()
+            if now >= reap_at:
+                # no job lock is held here, see requeue_dead
+                if self.store.requeue_dead():
+                    ready = True
+                reap_at = now + self.reap_interval
+            if ready or now >= wake_at or now >= poll_at:
+                if self.run_once():
+                    continue
+                ready = False
+                # due jobs waiting for a slot are woken up by its release instead
+                eta = self.store.next_eta(self.blocked)
+                wake_at = now + eta if eta is not None else float("inf")
+                poll_at = now + self.poll_interval
+            timeout = min(wake_at, poll_at, reap_at) - time.monotonic()
+            if self.store.wait(min(max(timeout, 0.0), STOP_CHECK_INTERVAL)):
+                ready = True
+
+
+def run_worker(factory: Callable[[int], Worker], index: int) -> None:
+    """Build the worker ``index`` with ``factory`` and run it until SIGTERM."""
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_args: stop.set())
+    signal.signal(signal.SIGINT, lambda *_args: stop.set())
+    worker = factory(index)
+    try:
+        worker.run(stop)
+    finally:
+        worker.store.close()
+
+
+class Runner:
+    """Keep ``processes`` worker processes running.
+
+    Each child runs ``main(factory, index)``, which builds its worker (and
+    store) with ``factory(index)``. Both are pickled, so they must be
+    module-level functions or partials of them. A spawned child unpickles
+    them in a fresh interpreter, where the modules of Odoo addons cannot be
+    imported before the configuration is loaded: the job runner script
+    passes a ``main`` of its own that loads it first.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[int], Worker],
+        processes: int | None = None,
+        context: str = "spawn",
+        main: Callable[[Callable[[int], Worker], int], None] = run_worker,
+    ) -> None:
+        """Prepare ``processes`` workers, one per CPU by default."""
+        self.factory = factory
+        self.main = main
+        self.processes = processes or os.cpu_count() or 1
+        self._context = multiprocessing.get_context(context)
+        self._children: dict[int, multiprocessing.process.BaseProcess] = {}
+        self._stopping = False
+
+    def _spawn(self, index: int) -> None:
+        process = self._context.Process(
+            target=self.main, args=(self.factory, index), name=f"ihs-job-worker-{index}",
+        )
+        process.start()
+        self._children[index] = process
+
+    def start(self) -> None:
+        """Start the worker processes."""
+        for index in range(self.processes):
+            self._spawn(index)
+
+    def supervise(self, stop: threading.Event, interval: float = 1.0) -> None:
+        """Restart dead workers until ``stop`` is set, then stop them all."""
+        try:
+            while not stop.wait(interval):
+                for index, process in list(self._children.items()):
+                    if not process.is_alive():
+                        _logger.warning("Job worker %d exited with %s, restarting", index, process.exitcode)
+                        self._spawn(index)
+        finally:
+            self.stop()
+
+    def stop(self, timeout: float = 60.0) -> None:
+        """Ask the workers to stop after their current job and wait for them."""
+        for process in self._children.values():
+            if process.is_alive():
+                process.terminate()
+        deadline = time.monotonic() + timeout
+        for process in self._children.values():
+            process.join(max(deadline - time.monotonic(), 0))
+            if process.is_alive():
+                process.kill()
+                process.join()
+        self._children.clear()
@@ -0,0 +1,3 @@
+# -*- coding: utf-8 -*-
+from . import tools
+from .hooks import post_load
@@ -0,0 +1,23 @@
+{
+    "name": "IHS Manifest Index",
+    "version": "18.0.1.0.0",
+    "summary": "Persistent index of addon manifests for faster server start.",
+    "description": """
+Parses every ``__manifest__.py`` on the addons path with ``ast.literal_eval``
+and caches the result in an on-disk index keyed by file mtime and content
+hash, so a server start only reads manifests that changed.
+
+Load it as a server-wide module (``server_wide_modules = base,web,ihs_manifest_index``)
+to serve manifests from the index. The index file defaults to
+``<data_dir>/manifest_index.json`` and can be moved with the
+``manifest_index_path`` option.
+""",
+    "author": "ihs-odoo",
+    "category": "Tools",
+    "license": "LGPL-3",
+    "depends": ["base"],
+    "data": [],
+    "installable": True,
+    "application": False,
+    "post_load": "post_load",
+}
@@ -0,0 +1,155 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Compare manifest scans over a tree of synthetic addons.
+
+Usage::
+
+    python custom_addons/ihs_manifest_index/benchmarks/bench_manifest_index.py --addons 5000
+
+Scenarios:
+
+* ``literal_eval``: read and evaluate every manifest, as a plain server start does;
+* ``cold``: build the index from nothing and write it to disk;
+* ``warm``: load the index from disk and rescan an unchanged tree;
+* ``warm+touch``: same, after bumping the mtime of 1% of the manifests;
+* ``warm+edit``: same, after editing 1% of the manifests.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tools import ManifestIndex, resolve_load_order
+
+MANIFEST_TEMPLATE = """{{
+    "name": "Synthetic Addon {index}",
+    "version": "18.0.1.0.{revision}",
+    "summary": "Generated addon number {index} for the manifest index benchmark.",
+    "author": "ihs-odoo",
+    "category": "Tools",
+    "license": "LGPL-3",
+    "depends": {depends!r},
+    "data": {data!r},
+    "assets": {{
+        "web.assets_backend": [
+            "{name}/static/src/**/*",
+            ("remove", "{name}/static/src/legacy/**/*"),
+        ],
+    }},
+    "installable": True,
+    "application": False,
+}}
+"""
+
+
+def addon_name(index: int) -> str:
+    """Return the name of synthetic addon ``index``."""
+    return f"bench_addon_{index:05d}"
+
+
+def write_manifest(root: Path, index: int, revision: int = 0) -> Path:
+    """Write the manifest of synthetic addon ``index``; it only depends on lower indexes."""
+    name = addon_name(index)
+    depends = sorted({addon_name(dep) for dep in (index - 1, index // 2, index // 3) if dep >= 0})
+    if index and index % 7 == 0:
+        depends.append("base")
+    data = ["security/ir.model.access.csv", *(f"views/view_{i}.xml" for i in range(index % 9))]
+    manifest = root / name / "__manifest__.py"
+    manifest.parent.mkdir(exist_ok=True)
+    manifest.write_text(
+        MANIFEST_TEMPLATE.format(
+            index=index, revision=revision, name=name, depends=[d for d in depends if d != name], data=data,
+        ),
+    )
+    return manifest
+
+
+def timed(func, *args, **kwargs):  # noqa: ANN001, ANN002, ANN003
+    """Return ``(result, seconds)`` of ``func(*args, **kwargs)``."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def literal_eval_scan(root: Path) -> dict:
+    """Read and evaluate every manifest under ``root`` without any cache."""
+    manifests = {}
+    for manifest in sorted(root.glob("*/__manifest__.py")):
+        manifests[manifest.parent.name] = ast.literal_eval(manifest.read_text())
+    return manifests
+
+
+def indexed_scan(root: Path, index_path: Path) -> ManifestIndex:
+    """Load the index from disk, rescan ``root`` and save the index."""
+    index = ManifestIndex(index_path)
+    index.load()
+    index.scan([root])
+    index.save()
+    return index
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Manifest index benchmark")
+    parser.add_argument("--addons", type=int, default=3000, help="number of synthetic addons")
+    parser.add_argument("--repeat", type=int, default=3, help="keep the best of N runs")
+    args = parser.parse_args(argv)
+
+    out = sys.stdout
+    with tempfile.TemporaryDirectory(prefix="bench_manifest_index_") as tmp:
+        root = Path(tmp, "addons")
+        root.mkdir()
+        manifests = [write_manifest(root, index) for index in range(args.addons)]
+        index_path = Path(tmp, "index.json")
+        changed = manifests[:: max(1, len(manifests) // max(1, args.addons // 100))]
+
+        results: dict[str, float] = {}
+
+        def run(label: str, func, *func_args, setup=None):  # noqa: ANN001, ANN002, ANN202
+            best = float("inf")
+            result = None
+            for _ in range(args.repeat):
+                if setup:
+                    setup()
+                result, elapsed = timed(func, *func_args)
+                best = min(best, elapsed)
+            results[label] = best
+            return result
+
+        def touch() -> None:
+            for manifest in changed:
+                os.utime(manifest, ns=(time.time_ns(), time.time_ns()))
+
+        revision = iter(range(1, 1_000_000))
+
+        def edit() -> None:
+            current = next(revision)
+            for manifest in changed:
+                write_manifest(root, int(manifest.parent.name.rsplit("_", 1)[1]), current)
+
+        run("literal_eval", literal_eval_scan, root)
+        run("cold", indexed_scan, root, index_path, setup=lambda: index_path.unlink(missing_ok=True))
+        run("warm", indexed_scan, root, index_path)
+        run("warm+touch", indexed_scan, root, index_path, setup=touch)
+        index = run("warm+edit", indexed_scan, root, index_path, setup=edit)
+        _, order_time = timed(resolve_load_order, index.manifests(), None, ignore_missing=True)
+
+        out.write(f"{args.addons} synthetic addons, {len(changed)} touched/edited, best of {args.repeat}\n")
+        baseline = results["literal_eval"]
+        for label, elapsed in results.items():
+            out.write(f"{label:>14}: {elapsed * 1000:9.1f} ms  ({baseline / elapsed:5.1f}x)\n")
+        out.write(f"{'load order':>14}: {order_time * 1000:9.1f} ms\n")
+        out.write(f"{'index size':>14}: {index_path.stat().st_size / 1024:9.1f} KiB\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+from __future__ import annotations
+
+import collections.abc
+import copy
+import logging
+import os
+from pathlib import Path
+
+import odoo
+from odoo.modules import module as module_lib
+from odoo.tools import config
+
+from .tools import MANIFEST_NAME, DependencyError, ManifestIndex
+
+_logger = logging.getLogger(__name__)
+
+_index = None
+_original_load_manifest = module_lib.load_manifest
+
+
+def _index_path() -> Path:
+    """Return the index file configured in ``odoo.conf``."""
+    return Path(config.get("manifest_index_path") or Path(config["data_dir"], "manifest_index.json"))
+
+
+def _load_manifest(module: str, mod_path: str | None = None) -> dict:
+    """Serve ``module_lib.load_manifest`` from the index when it is fresh.
+
+    Mirrors the post-processing of the Odoo 18 implementation; anything that
+    needs more than the manifest itself (README fallback for the description,
+    default license warning, invalid values) goes through the original.
+    """
+    if not mod_path:
+        mod_path = module_lib.get_module_path(module, downloaded=True)
+    raw = _index.lookup(Path(mod_path, MANIFEST_NAME)) if mod_path else None
+    if not raw or not raw.get("description") or not raw.get("license"):
+        return _original_load_manifest(module, mod_path)
+
+    manifest = copy.deepcopy(module_lib._DEFAULT_MANIFEST)  # noqa: SLF001
+    manifest["icon"] = module_lib.get_module_icon(module)
+    manifest.update(copy.deepcopy(raw))
+    if isinstance(manifest["auto_install"], collections.abc.Iterable):
+        manifest["auto_install"] = set(manifest["auto_install"])
+        if manifest["auto_install"].difference(manifest["depends"]):
+            return _original_load_manifest(module, mod_path)
+    elif manifest["auto_install"]:
+        manifest["auto_install"] = set(manifest["depends"])
+    try:
+        manifest["version"] = module_lib.adapt_version(manifest["version"])
+    except ValueError:
+        return _original_load_manifest(module, mod_path)
+    manifest["addons_path"] = os.path.normpath(Path(mod_path, os.pardir))
+    return manifest
+
+
+def post_load():
+    """Refresh the manifest index and route manifest loading through it."""
+    global _index  # noqa: PLW0603
+    index = ManifestIndex(_index_path())
+    index.load()
+    stats = index.scan(odoo.addons.__path__)
+    for name, error in stats.errors.items():
+        _logger.warning("Manifest of %s left out of the index: %s", name, error)
+    try:
+        index.save()
+    except OSError as exc:
+        _logger.warning("Could not write manifest index %s: %s", index.index_path, exc)
+    try:
+        index.load_order()
+    except DependencyError as exc:
+        _logger.warning("Addons dependency graph: %s", exc)
+    _logger.info(
+        "Manifest index: %d addons (%d unchanged, %d rehashed, %d parsed, %d removed) in %.3fs",
+        stats.addons,
+        stats.unchanged,
+        stats.rehashed,
+        stats.parsed,
+        stats.removed,
+        stats.duration,
+    )
+    _index = index
+    module_lib.load_manifest = _load_manifest
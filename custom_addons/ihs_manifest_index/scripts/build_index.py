@@ -0,0 +1,87 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Refresh the manifest index outside of the server and print the load order.
+
+Usage::
+
+    python custom_addons/ihs_manifest_index/scripts/build_index.py -c odoo.conf --order
+"""
+
+from __future__ import annotations
+
+import argparse
+import configparser
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tools import DependencyError, ManifestIndex
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+def config_addons_paths(config_file: Path, odoo_dir: Path | None = None) -> list[Path]:
+    """Return ``addons_path`` from ``config_file`` plus Odoo's own base addons.
+
+    ``odoo_dir`` is the Odoo source tree, ``odoo/`` next to the config by default.
+    """
+    parser = configparser.ConfigParser()
+    parser.read(config_file)
+    base = config_file.resolve().parent
+    paths = [
+        base / item.strip()
+        for item in parser.get("options", "addons_path", fallback="").split(",")
+        if item.strip()
+    ]
+    # odoo-bin always prepends the directory holding ``base``
+    root_addons = (odoo_dir or base / "odoo") / "odoo" / "addons"
+    if root_addons.is_dir() and root_addons not in paths:
+        paths.insert(0, root_addons)
+    return paths
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the command line tool."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-c", "--config", type=Path, default=REPO_ROOT / "odoo.conf")
+    parser.add_argument(
+        "--addons-path",
+        help="comma separated addons directories, defaults to the config's addons_path",
+    )
+    parser.add_argument("--index", type=Path, default=REPO_ROOT / ".manifest_index.json")
+    parser.add_argument(
+        "--order",
+        nargs="*",
+        metavar="ADDON",
+        help="print the load order of the given addons (all addons when none given)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.addons_path:
+        paths = [Path(item) for item in args.addons_path.split(",") if item]
+    else:
+        paths = config_addons_paths(args.config)
+    index = ManifestIndex(args.index)
+    index.load()
+    stats = index.scan(paths)
+    index.save()
+    out = sys.stdout
+    out.write(
+        f"{stats.addons} addons: {stats.unchanged} unchanged, {stats.rehashed} rehashed, "
+        f"{stats.parsed} parsed, {stats.removed} removed in {stats.duration * 1000:.1f} ms\n",
+    )
+    for name, error in stats.errors.items():
+        out.write(f"error: {name}: {error}\n")
+    if args.order is not None:
+        try:
+            order = index.load_order(args.order or None)
+        except DependencyError as exc:
+            out.write(f"error: {exc}\n")
+            return 1
+        out.write("\n".join(order) + "\n")
+    return 1 if stats.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
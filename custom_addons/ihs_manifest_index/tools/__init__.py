@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+from .manifest_index import (
+    MANIFEST_NAME,
+    DependencyCycleError,
+    DependencyError,
+    IndexEntry,
+    ManifestError,
+    ManifestIndex,
+    MissingDependencyError,
+    ScanStats,
+    parse_manifest,
+    resolve_load_order,
+)
@@ -0,0 +1,416 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""On-disk index of addon manifests.
+
+The index records, for every addon found on the addons path, the stat
+signature (``st_mtime_ns`` and ``st_size``) and the SHA-256 digest of its
+``__manifest__.py`` together with the parsed manifest. A rescan only stats the
+manifest files; a manifest is read again when its stat signature changed, and
+parsed again only when its content digest changed as well.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import heapq
+import json
+import logging
+import os
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+_logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "__manifest__.py"
+INDEX_VERSION = 1
+
+
+class ManifestError(ValueError):
+    """Raised when a manifest file cannot be evaluated as a literal dict."""
+
+
+class DependencyError(ValueError):
+    """Base class for errors found while resolving the ``depends`` graph."""
+
+
+class MissingDependencyError(DependencyError):
+    """Raised when installable addons depend on addons that are not indexed."""
+
+    def __init__(self, missing: Mapping[str, Iterable[str]]) -> None:
+        """Keep the ``{addon: [missing dependencies]}`` mapping on the error."""
+        self.missing = {name: sorted(deps) for name, deps in sorted(missing.items())}
+        details = ", ".join(f"{name} -> {', '.join(deps)}" for name, deps in self.missing.items())
+        super().__init__(f"Missing dependencies: {details}")
+
+
+class DependencyCycleError(DependencyError):
+    """Raised when the ``depends`` graph contains a cycle."""
+
+    def __init__(self, cycle: list[str]) -> None:
+        """Keep the cycle, first addon repeated at the end, on the error."""
+        self.cycle = cycle
+        super().__init__(f"Dependency cycle: {' -> '.join(cycle)}")
+
+
+def parse_manifest(source: str | bytes, filename: str = MANIFEST_NAME) -> dict[str, Any]:
+    """Evaluate manifest ``source`` without executing it."""
+    if isinstance(source, bytes):
+        source = source.decode("utf-8")
+    try:
+        manifest = ast.literal_eval(source)
+    except (SyntaxError, ValueError, TypeError, MemoryError, RecursionError) as exc:
+        msg = f"{filename}: manifest is not a Python literal ({exc})"
+        raise ManifestError(msg) from exc
+    if not isinstance(manifest, dict):
+        msg = f"{filename}: manifest must be a dict, got {type(manifest).__name__}"
+        raise ManifestError(msg)
+    return manifest
+
+
+def _encode(value: Any) -> Any:  # noqa: ANN401, PLR0911
+    """Make a literal JSON-serializable while keeping tuples, sets and bytes."""
+    if isinstance(value, dict):
+        if all(isinstance(key, str) for key in value):
+            return {key: _encode(item) for key, item in value.items()}
+        return {"__dict__": [[_encode(key), _encode(item)] for key, item in value.items()]}
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, tuple):
+        return {"__tuple__": [_encode(item) for item in value]}
+    if isinstance(value, (set, frozenset)):
+        return {"__set__": [_encode(item) for item in value]}
+    if isinstance(value, bytes):
+        return {"__bytes__": value.hex()}
+    return value
+
+
+def _decode(value: Any) -> Any:  # noqa: ANN401, PLR0911
+    """Invert :func:`_encode`."""
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if len(value) == 1:
+        ((tag, payload),) = value.items()
+        if tag == "__tuple__":
+            return tuple(_decode(item) for item in payload)
+        if tag == "__set__":
+            return {_decode(item) for item in payload}
+        if tag == "__bytes__":
+            return bytes.fromhex(payload)
+        if tag == "__dict__":
+            return {_decode(key): _decode(item) for key, item in payload}
+    return {key: _decode(item) for key, item in value.items()}
+
+
+@dataclass
+class IndexEntry:
+    """Indexed state of one addon manifest.
+
+    The manifest is kept in its JSON form and only decoded on first access, so
+    loading and saving the index does not walk manifests nobody asked for.
+    """
+
+    name: str
+    path: str
+    mtime_ns: int
+    size: int
+    sha256: str
+    encoded: Any = field(repr=False)
+    _manifest: dict[str, Any] | None = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_manifest(
+        cls, name: str, path: str, stat: os.stat_result, sha256: str, manifest: dict[str, Any],
+    ) -> IndexEntry:
+        """Build an entry for a freshly parsed manifest."""
+        return cls(name, path, stat.st_mtime_ns, stat.st_size, sha256, _encode(manifest), manifest)
+
+    @property
+    def manifest(self) -> dict[str, Any]:
+        """The manifest dict, as ``ast.literal_eval`` returned it."""
+        if self._manifest is None:
+            self._manifest = _decode(self.encoded)
+        return self._manifest
+
+    def matches(self, stat: os.stat_result) -> bool:
+        """Return whether ``stat`` has the signature recorded in the entry."""
+        return stat.st_mtime_ns == self.mtime_ns and stat.st_size == self.size
+
+    def to_json(self) -> dict[str, Any]:
+        """Serialize the entry for the index file."""
+        return {
+            "name": self.name,
+            "path": self.path,
+            "mtime_ns": self.mtime_ns,
+            "size": self.size,
+            "sha256": self.sha256,
+            "manifest": self.encoded,
+        }
+
+    @classmethod
+    def from_json(cls, data: Mapping[str, Any]) -> IndexEntry:
+        """Build an entry from its serialized form."""
+        return cls(
+            name=data["name"],
+            path=data["path"],
+            mtime_ns=data["mtime_ns"],
+            size=data["size"],
+            sha256=data["sha256"],
+            encoded=data["manifest"],
+        )
+
+
+@dataclass
+class ScanStats:
+    """What a :meth:`ManifestIndex.scan` had to do."""
+
+    addons: int = 0
+    unchanged: int = 0
+    rehashed: int = 0
+    parsed: int = 0
+    removed: int = 0
+    errors: dict[str, str] = field(default_factory=dict)
+    duration: float = 0.0
+
+    @property
+    def changed(self) -> bool:
+        """Return whether the index content differs from before the scan."""
+        return bool(self.rehashed or self.parsed or self.removed)
+
+
+class ManifestIndex:
+    """Manifests of the addons found on an addons path, cached on disk."""
+
+    def __init__(self, index_path: str | os.PathLike[str] | None = None) -> None:
+        """Create an empty index persisted at ``index_path`` (memory only if None)."""
+        self.index_path = Path(index_path) if index_path else None
+        self.entries: dict[str, IndexEntry] = {}
+        self._by_path: dict[str, IndexEntry] = {}
+        self._dirty = False
+
+    def load(self) -> bool:
+        """Read the index file; return False when it is missing or unusable."""
+        if self.index_path is None:
+            return False
+        try:
+            data = json.loads(self.index_path.read_bytes())
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as exc:
+            _logger.warning("Ignoring unreadable manifest index %s: %s", self.index_path, exc)
+            return False
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            _logger.info("Ignoring manifest index %s with another format", self.index_path)
+            return False
+        try:
+            entries = [IndexEntry.from_json(item) for item in data["entries"]]
+        except (KeyError, TypeError, ValueError) as exc:
+            _logger.warning("Ignoring corrupted manifest index %s: %s", self.index_path, exc)
+            return False
+        self._set_entries(entries)
+        self._dirty = False
+        return True
+
+    def save(self, *, force: bool = False) -> bool:
+        """Atomically write the index file if it changed since it was loaded."""
+        if self.index_path is None or not (self._dirty or force):
+            return False
+        payload = {
+            "version": INDEX_VERSION,
+            "entries": [entry.to_json() for entry in self.entries.values()],
+        }
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.index_path.parent, prefix=f".{self.index_path.name}.", suffix=".tmp",
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+                json.dump(payload, tmp, separators=(",", ":"))
+            Path(tmp_name).replace(self.index_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self._dirty = False
+        return True
+
+    def scan(self, addons_paths: Iterable[str | os.PathLike[str]]) -> ScanStats:
+        """Refresh the index from ``addons_paths``, first path winning on duplicates.
+
+        Addons whose manifest cannot be parsed are left out of the index and
+        reported in :attr:`ScanStats.errors`.
+        """
+        start = time.perf_counter()
+        stats = ScanStats()
+        previous = self._by_path
+        found: list[IndexEntry] = []
+        seen: set[str] = set()
+        for addons_path in addons_paths:
+            for name, manifest_path, stat in _iter_manifests(addons_path):
+                if name in seen:
+                    continue
+                seen.add(name)
+                entry = previous.get(manifest_path)
+                if entry is not None and entry.name == name and entry.matches(stat):
+                    stats.unchanged += 1
+                    found.append(entry)
+                    continue
+                try:
+                    entry = self._read(name, manifest_path, entry, stats)
+                except (OSError, ManifestError) as exc:
+                    stats.errors[name] = str(exc)
+                    continue
+                found.append(entry)
+        stats.addons = len(found)
+        stats.removed = len(set(previous) - {entry.path for entry in found})
+        self._set_entries(found)
+        self._dirty = self._dirty or stats.changed
+        stats.duration = time.perf_counter() - start
+        return stats
+
+    def _read(
+        self, name: str, manifest_path: str, previous: IndexEntry | None, stats: ScanStats,
+    ) -> IndexEntry:
+        """Read one manifest, reusing ``previous`` when only its stat changed."""
+        with Path(manifest_path).open("rb") as handle:
+            stat = os.fstat(handle.fileno())
+            source = handle.read()
+        digest = hashlib.sha256(source).hexdigest()
+        if previous is not None and previous.sha256 == digest:
+            stats.rehashed += 1
+            return IndexEntry(
+                name, manifest_path, stat.st_mtime_ns, stat.st_size, digest, previous.encoded,
+                previous._manifest,  # noqa: SLF001
+            )
+        stats.parsed += 1
+        manifest = parse_manifest(source, manifest_path)
+        return IndexEntry.from_manifest(name, manifest_path, stat, digest, manifest)
+
+    def _set_entries(self, entries: Iterable[IndexEntry]) -> None:
+        self.entries = {entry.name: entry for entry in entries}
+        self._by_path = {entry.path: entry for entry in self.entries.values()}
+
+    def manifests(self) -> dict[str, dict[str, Any]]:
+        """Return ``{addon name: manifest}`` for every indexed addon."""
+        return {name: entry.manifest for name, entry in self.entries.items()}
+
+    def lookup(self, manifest_path: str | os.PathLike[str]) -> dict[str, Any] | None:
+        """Return the indexed manifest of ``manifest_path`` if it is still fresh."""
+        entry = self._by_path.get(os.path.abspath(manifest_path))  # noqa: PTH100
+        if entry is None:
+            return None
+        try:
+            stat = Path(entry.path).stat()
+        except OSError:
+            return None
+        return entry.manifest if entry.matches(stat) else None
+
+    def load_order(
+        self, roots: Iterable[str] | None = None, *, ignore_missing: bool = False,
+    ) -> list[str]:
+        """Return the indexed addons in dependency order, see :func:`resolve_load_order`."""
+        return resolve_load_order(self.manifests(), roots, ignore_missing=ignore_missing)
+
+
+def _iter_manifests(addons_path: str | os.PathLike[str]) -> Iterable[tuple[str, str, os.stat_result]]:
+    """Yield ``(name, manifest path, stat)`` for every addon directly in ``addons_path``."""
+    root = os.path.abspath(addons_path)  # noqa: PTH100
+    try:
+        with os.scandir(root) as it:
+            dirs = sorted(entry.name for entry in it if entry.is_dir() and entry.name.isidentifier())
+    except FileNotFoundError:
+        _logger.warning("Addons path %s does not exist", root)
+        return
+    for name in dirs:
+        manifest_path = os.path.join(root, name, MANIFEST_NAME)  # noqa: PTH118
+        try:
+            stat = os.stat(manifest_path)  # noqa: PTH116
+        except FileNotFoundError:
+            continue
+        yield name, manifest_path, stat
+
+
+def resolve_load_order(
+    manifests: Mapping[str, Mapping[str, Any]],
+    roots: Iterable[str] | None = None,
+    *,
+    ignore_missing: bool = False,
+) -> list[str]:
+    """Sort installable addons so that every addon comes after its dependencies.
+
+    ``roots`` restricts the result to the given addons and their transitive
+    dependencies. Ties are broken alphabetically so the order is stable.
+    Raises :class:`MissingDependencyError` for unknown dependencies, unless
+    ``ignore_missing`` is set, and :class:`DependencyCycleError` on cycles.
+    """
+    graph = {
+        name: list(dict.fromkeys(manifest.get("depends") or ()))
+        for name, manifest in manifests.items()
+        if manifest.get("installable", True)
+    }
+    if roots is not None:
+        graph = _closure(graph, roots)
+    missing = {
+        name: [dep for dep in deps if dep not in graph]
+        for name, deps in graph.items()
+        if any(dep not in graph for dep in deps)
+    }
+    if missing and not ignore_missing:
+        raise MissingDependencyError(missing)
+    graph = {name: [dep for dep in deps if dep in graph] for name, deps in graph.items()}
+
+    pending = {name: len(deps) for name, deps in graph.items()}
+    dependents: dict[str, list[str]] = {name: [] for name in graph}
+    for name, deps in graph.items():
+        for dep in deps:
+            dependents[dep].append(name)
+    ready = [name for name, count in pending.items() if not count]
+    heapq.heapify(ready)
+    order = []
+    while ready:
+        name = heapq.heappop(ready)
+        order.append(name)
+        for dependent in dependents[name]:
+            pending[dependent] -= 1
+            if not pending[dependent]:
+                heapq.heappush(ready, dependent)
+    if len(order) != len(graph):
+        raise DependencyCycleError(_find_cycle(graph, {name for name, count in pending.items() if count}))
+    return order
+
+
+def _closure(graph: Mapping[str, list[str]], roots: Iterable[str]) -> dict[str, list[str]]:
+    """Restrict ``graph`` to ``roots`` and everything they depend on."""
+    result: dict[str, list[str]] = {}
+    stack = list(roots)
+    while stack:
+        name = stack.pop()
+        if name in result:
+            continue
+        deps = graph.get(name)
+        if deps is None:
+            msg = f"Unknown or uninstallable addon {name!r}"
+            raise DependencyError(msg)
+        result[name] = deps
+        stack.extend(dep for dep in deps if dep in graph)
+    return result
+
+
+def _find_cycle(graph: Mapping[str, list[str]], blocked: set[str]) -> list[str]:
+    """Return one cycle among the ``blocked`` nodes left over by the sort."""
+    # every blocked node has a blocked dependency, so walking them must loop
+    node = min(blocked)
+    path: list[str] = []
+    position: dict[str, int] = {}
+    while node not in position:
+        position[node] = len(path)
+        path.append(node)
+        node = min(dep for dep in graph[node] if dep in blocked)
+    return [*path[position[node] :], node]
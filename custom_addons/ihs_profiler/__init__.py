@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+from . import controllers
+from . import models
+from . import tools
+from .profiling import sampling_rules, shared_profiler
@@ -0,0 +1,27 @@
+{
+    "name": "IHS Profiler",
+    "version": "18.0.1.0.0",
+    "summary": "Per-route request and cron timing, SQL counts and sampled flamegraphs.",
+    "description": """
+Measures every HTTP request and cron job: wall time, CPU time of the thread,
+and the number and duration of its SQL queries (read from the counters the
+cursor keeps on the current thread). Figures are aggregated per route in
+fixed-bucket histograms and exposed with p50/p95/p99 estimates in the
+Prometheus text format at ``/ihs_profiler/metrics``, for local scrapers only.
+
+Requests can be profiled with a sampling profiler, per route or per user,
+through the system parameters ``ihs_profiler.sample_routes`` (patterns such as
+``/web/dataset/call_kw/sale.order/*`` or ``cron:*``) and
+``ihs_profiler.sample_users`` (logins). Profiles are written as collapsed
+stacks for ``flamegraph.pl`` or speedscope. Options in ``odoo.conf``:
+``ihs_profiler_dir``, ``ihs_profiler_sample_interval_ms`` and
+``ihs_profiler_metrics_allow``.
+""",
+    "author": "ihs-odoo",
+    "category": "Tools",
+    "license": "LGPL-3",
+    "depends": ["base"],
+    "data": [],
+    "installable": True,
+    "application": False,
+}
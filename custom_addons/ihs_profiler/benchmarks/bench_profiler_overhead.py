@@ -0,0 +1,117 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Measure what the request instrumentation costs with sampling off.
+
+Usage::
+
+    python custom_addons/ihs_profiler/benchmarks/bench_profiler_overhead.py --work-us 1000
+
+The simulated request burns ``--work-us`` microseconds of CPU and bumps the
+thread query counters like the Odoo cursor does. Bare and measured requests
+are run in alternating rounds and the best round of each is compared, which
+keeps frequency scaling and noisy neighbours out of the ratio. The exit status
+is 1 when the overhead reaches ``--budget`` percent.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tools import RequestProfiler, SamplingRules, render_prometheus
+
+QUERIES_PER_REQUEST = 12
+
+
+def request(work: float) -> None:
+    """Spin for ``work`` seconds, counting queries like the cursor does."""
+    thread = threading.current_thread()
+    deadline = time.perf_counter() + work
+    step = work / QUERIES_PER_REQUEST
+    next_query = time.perf_counter() + step
+    while (now := time.perf_counter()) < deadline:
+        if now >= next_query and hasattr(thread, "query_count"):
+            thread.query_count += 1
+            thread.query_time += 0.0001
+            next_query += step
+
+
+def round_time(
+    profiler: RequestProfiler | None, rules: SamplingRules, requests: int, work: float,
+) -> float:
+    """Return the median duration of ``requests`` requests, measured or not."""
+    durations = []
+    for index in range(requests):
+        route = f"/bench/route/{index % 20}"
+        start = time.perf_counter()
+        if profiler is None:
+            request(work)
+        else:
+            with profiler.measure(route, sample=rules.matches(route, 2)):
+                request(work)
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Profiler overhead benchmark")
+    parser.add_argument("--work-us", type=float, default=1000.0, help="CPU time of one request")
+    parser.add_argument("--requests", type=int, default=1000, help="requests per round")
+    parser.add_argument("--rounds", type=int, default=7)
+    parser.add_argument("--budget", type=float, default=2.0, help="allowed overhead in percent")
+    args = parser.parse_args(argv)
+    work = args.work_us / 1e6
+
+    out = sys.stdout
+    with tempfile.TemporaryDirectory(prefix="bench_profiler_") as tmp:
+        profiler = RequestProfiler(tmp, dump_interval=1.0)
+        off = SamplingRules()
+        sampled = SamplingRules.parse("/bench/route/*")
+
+        # cost of the bookkeeping alone, on an empty request
+        start = time.perf_counter()
+        for _index in range(args.requests * 20):
+            with profiler.measure("/bench/empty", sample=off.matches("/bench/empty", 2)):
+                pass
+        per_call = (time.perf_counter() - start) / (args.requests * 20)
+        out.write(f"instrumentation per request: {per_call * 1e6:.2f} us\n")
+
+        bare, measured = [], []
+        for _round in range(args.rounds):
+            bare.append(round_time(None, off, args.requests, work))
+            measured.append(round_time(profiler, off, args.requests, work))
+        sampling = round_time(profiler, sampled, max(args.requests // 10, 10), work)
+
+        base = min(bare)
+        overhead = (min(measured) - base) / base * 100
+        out.write(f"{'mode':>16} {'median':>11} {'overhead':>9}\n")
+        out.write(f"{'bare':>16} {base * 1e6:>8.1f} us {'':>9}\n")
+        out.write(f"{'profiling off':>16} {min(measured) * 1e6:>8.1f} us {overhead:>8.2f}%\n")
+        out.write(
+            f"{'sampling on':>16} {sampling * 1e6:>8.1f} us "
+            f"{(sampling - base) / base * 100:>8.2f}%\n",
+        )
+        collected = profiler.collect()
+        stats = collected.routes["/bench/route/0"]
+        out.write(
+            f"{len(collected.routes)} routes, /bench/route/0: {stats.wall.count} requests, "
+            f"p50 {stats.wall.quantile(0.5) * 1e3:.2f} ms, p99 {stats.wall.quantile(0.99) * 1e3:.2f} ms, "
+            f"{stats.sql_queries} queries; "
+            f"{len(render_prometheus(collected).splitlines())} exposition lines, "
+            f"{len(list(Path(tmp, 'profiles').glob('*.folded')))} profiles\n",
+        )
+    verdict = "PASS" if overhead < args.budget else "FAIL"
+    out.write(f"{verdict}: overhead {overhead:.2f}% with sampling off (budget {args.budget}%)\n")
+    return 0 if overhead < args.budget else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,37 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+from __future__ import annotations
+
+import ipaddress
+
+from odoo import http
+from odoo.addons.ihs_profiler.profiling import shared_profiler
+from odoo.addons.ihs_profiler.tools import render_prometheus
+from odoo.http import request
+from odoo.tools import config
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def allowed_networks() -> list[ipaddress.IPv4Network | ipaddress.IPv6Network]:
+    """Return the networks allowed to scrape, from ``ihs_profiler_metrics_allow``."""
+    allow = config.get("ihs_profiler_metrics_allow") or ""
+    return [ipaddress.ip_network(net.strip(), strict=False) for net in allow.split(",") if net.strip()]
+
+
+class ProfilerController(http.Controller):
+    @http.route("/ihs_profiler/metrics", type="http", auth="none", save_session=False)
+    def metrics(self) -> http.Response:
+        """Expose the metrics of all workers in the Prometheus text format.
+
+        Only served to loopback addresses and the networks listed in the
+        ``ihs_profiler_metrics_allow`` option.
+        """
+        try:
+            address = ipaddress.ip_address(request.httprequest.remote_addr or "")
+        except ValueError:
+            raise request.not_found() from None
+        if not address.is_loopback and not any(address in net for net in allowed_networks()):
+            raise request.not_found()
+        body = render_prometheus(shared_profiler().collect())
+        return request.make_response(body, headers=[("Content-Type", CONTENT_TYPE)])
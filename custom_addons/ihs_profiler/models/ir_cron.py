@@ -0,0 +1,17 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+from __future__ import annotations
+
+from odoo import models
+from odoo.addons.ihs_profiler.profiling import sampling_rules, shared_profiler
+
+
+class IrCron(models.Model):
+    _inherit = "ir.cron"
+
+    def _callback(self, cron_name: str, server_action_id: int) -> None:
+        """Measure every cron job as the route ``cron:<name>``."""
+        route = f"cron:{cron_name}"
+        sample = sampling_rules(self.env).matches(route, self.env.uid)
+        with shared_profiler().measure(route, sample=sample):
+            super()._callback(cron_name, server_action_id)
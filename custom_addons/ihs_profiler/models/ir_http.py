@@ -0,0 +1,37 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from odoo import models
+from odoo.addons.ihs_profiler.profiling import sampling_rules, shared_profiler
+from odoo.http import request
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from odoo.http import Response
+
+# routes whose path tail names the model and method, kept in the label
+RPC_ROUTE_PREFIXES = ("/web/dataset/call_kw", "/web/dataset/call_button")
+
+
+def route_label(endpoint: Callable) -> str:
+    """Return the metrics label of a request: its route, not its URL."""
+    routes = getattr(endpoint, "routing", {}).get("routes") or [request.httprequest.path]
+    if routes[0].startswith(RPC_ROUTE_PREFIXES):
+        return request.httprequest.path
+    return routes[0]
+
+
+class IrHttp(models.AbstractModel):
+    _inherit = "ir.http"
+
+    @classmethod
+    def _dispatch(cls, endpoint: Callable) -> Response:
+        """Measure the controller of every request, sampling the selected ones."""
+        route = route_label(endpoint)
+        sample = sampling_rules(request.env).matches(route, request.env.uid)
+        with shared_profiler().measure(route, sample=sample):
+            return super()._dispatch(endpoint)
@@ -0,0 +1,64 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from odoo.tools import config
+
+from .tools import RequestProfiler, SamplingRules
+
+if TYPE_CHECKING:
+    from odoo.api import Environment
+
+# sampling rules are re-read from the system parameters at most this often
+RULES_TTL = 60.0
+
+_lock = threading.Lock()
+_profiler = None
+_rules: dict[str, tuple[float, SamplingRules]] = {}
+
+
+def shared_profiler() -> RequestProfiler:
+    """Return the process-wide :class:`RequestProfiler` configured from ``odoo.conf``.
+
+    Options: ``ihs_profiler_dir`` (defaults to ``<data_dir>/ihs_profiler``)
+    and ``ihs_profiler_sample_interval_ms`` (defaults to 5).
+    """
+    global _profiler  # noqa: PLW0603
+    with _lock:
+        if _profiler is None:
+            directory = config.get("ihs_profiler_dir") or Path(config["data_dir"], "ihs_profiler")
+            interval = float(config.get("ihs_profiler_sample_interval_ms") or 5) / 1000
+            _profiler = RequestProfiler(directory, sample_interval=interval)
+        return _profiler
+
+
+def sampling_rules(env: Environment) -> SamplingRules:
+    """Return the sampling rules of ``env``'s database.
+
+    They come from the system parameters ``ihs_profiler.sample_routes``
+    (comma separated patterns such as ``/web/dataset/call_kw/sale.order/*`` or
+    ``cron:*``) and ``ihs_profiler.sample_users`` (comma separated logins).
+    """
+    dbname = env.cr.dbname
+    cached = _rules.get(dbname)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < RULES_TTL:
+        return cached[1]
+    params = env["ir.config_parameter"].sudo()
+    logins = [
+        login.strip()
+        for login in (params.get_param("ihs_profiler.sample_users") or "").split(",")
+        if login.strip()
+    ]
+    user_ids = []
+    if logins:
+        users = env["res.users"].sudo().with_context(active_test=False)
+        user_ids = users.search([("login", "in", logins)]).ids
+    rules = SamplingRules.parse(params.get_param("ihs_profiler.sample_routes"), user_ids)
+    _rules[dbname] = (now, rules)
+    return rules
@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+from .metrics import BUCKETS, QUANTILES, Histogram, MetricsRegistry, RouteStats, load_snapshots, render_prometheus
+from .profiler import RequestProfiler, SamplingRules, profile_filename
+from .sampler import StackSampler, collapse
@@ -0,0 +1,239 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Per-route request metrics with fixed-bucket histograms.
+
+Buckets are the same in every process, so the snapshots written by the
+workers of a prefork server can be merged by adding them up, and quantiles are
+estimated from the merged buckets.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# upper bounds in seconds, roughly 4 buckets per power of ten from 1ms to 2min
+BUCKETS = (
+    0.001, 0.002, 0.003, 0.005, 0.0075, 0.01, 0.02, 0.03, 0.05, 0.075,
+    0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 2.0, 3.0, 5.0, 7.5,
+    10.0, 20.0, 30.0, 60.0, 120.0,
+)  # fmt: skip
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+@dataclass
+class Histogram:
+    """Counts of observations per bucket, plus their sum."""
+
+    counts: list[int] = field(default_factory=lambda: [0] * (len(BUCKETS) + 1))
+    total: float = 0.0
+
+    @property
+    def count(self) -> int:
+        """Number of observations."""
+        return sum(self.counts)
+
+    def observe(self, value: float) -> None:
+        """Add one observation."""
+        self.counts[bisect.bisect_left(BUCKETS, value)] += 1
+        self.total += value
+
+    def merge(self, other: Histogram) -> None:
+        """Add the observations of ``other``."""
+        self.counts = [a + b for a, b in zip(self.counts, other.counts, strict=True)]
+        self.total += other.total
+
+    def quantile(self, q: float) -> float:
+        """Estimate quantile ``q`` by interpolating inside its bucket."""
+        count = self.count
+        if not count:
+            return math.nan
+        rank = q * count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= rank and bucket_count:
+                lower = BUCKETS[index - 1] if index else 0.0
+                if index == len(BUCKETS):
+                    return lower
+                return lower + (BUCKETS[index] - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return BUCKETS[-1]
+
+
+@dataclass
+class RouteStats:
+    """Everything recorded for one route (or cron job)."""
+
+    wall: Histogram = field(default_factory=Histogram)
+    cpu_seconds: float = 0.0
+    sql_queries: int = 0
+    sql_seconds: float = 0.0
+    errors: int = 0
+
+    def merge(self, other: RouteStats) -> None:
+        """Add the figures of ``other``."""
+        self.wall.merge(other.wall)
+        self.cpu_seconds += other.cpu_seconds
+        self.sql_queries += other.sql_queries
+        self.sql_seconds += other.sql_seconds
+        self.errors += other.errors
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for a snapshot file."""
+        return {
+            "counts": self.wall.counts,
+            "wall": self.wall.total,
+            "cpu": self.cpu_seconds,
+            "sql_queries": self.sql_queries,
+            "sql": self.sql_seconds,
+            "errors": self.errors,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RouteStats:
+        """Rebuild stats serialized with :meth:`to_dict`."""
+        return cls(
+            Histogram(list(data["counts"]), data["wall"]),
+            data["cpu"],
+            data["sql_queries"],
+            data["sql"],
+            data["errors"],
+        )
+
+
+class MetricsRegistry:
+    """Thread-safe ``{route: RouteStats}`` of one process."""
+
+    def __init__(self) -> None:
+        """Start empty."""
+        self.routes: dict[str, RouteStats] = {}
+        self._lock = threading.Lock()
+
+    def observe(  # noqa: PLR0913
+        self,
+        route: str,
+        wall: float,
+        cpu: float,
+        sql_queries: int,
+        sql_seconds: float,
+        *,
+        error: bool = False,
+    ) -> None:
+        """Record one request of ``route``."""
+        with self._lock:
+            stats = self.routes.get(route)
+            if stats is None:
+                stats = self.routes[route] = RouteStats()
+            stats.wall.observe(wall)
+            stats.cpu_seconds += cpu
+            stats.sql_queries += sql_queries
+            stats.sql_seconds += sql_seconds
+            stats.errors += error
+
+    def merge(self, other: MetricsRegistry) -> None:
+        """Add the routes of ``other``."""
+        for route, stats in other.routes.items():
+            self.routes.setdefault(route, RouteStats()).merge(stats)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize every route."""
+        with self._lock:
+            return {route: stats.to_dict() for route, stats in self.routes.items()}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> MetricsRegistry:
+        """Rebuild a registry serialized with :meth:`to_dict`."""
+        registry = cls()
+        registry.routes = {route: RouteStats.from_dict(stats) for route, stats in data.items()}
+        return registry
+
+    def dump(self, path: str | os.PathLike[str]) -> None:
+        """Atomically write a snapshot of the registry to ``path``."""
+        path = Path(path)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        with os.fdopen(fd, "w") as tmp:
+            json.dump(self.to_dict(), tmp)
+        Path(tmp_name).replace(path)
+
+
+def load_snapshots(directory: str | os.PathLike[str], max_age: float | None = None) -> MetricsRegistry:
+    """Merge the snapshots of all processes found in ``directory``.
+
+    Snapshots not updated for ``max_age`` seconds belong to workers gone for
+    good and are deleted.
+    """
+    merged = MetricsRegistry()
+    now = time.time()
+    for path in Path(directory).glob("*.json"):
+        try:
+            if max_age is not None and now - path.stat().st_mtime > max_age:
+                path.unlink(missing_ok=True)
+                continue
+            merged.merge(MetricsRegistry.from_dict(json.loads(path.read_text())))
+        except (OSError, ValueError, KeyError):
+            continue
+    return merged
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_prometheus(registry: MetricsRegistry, prefix: str = "ihs_request") -> str:
+    """Render ``registry`` in the Prometheus text exposition format (0.0.4)."""
+    routes = sorted(registry.routes.items())
+    lines = [
+        f"# HELP {prefix}_wall_seconds Wall time of requests and cron jobs.",
+        f"# TYPE {prefix}_wall_seconds histogram",
+    ]
+    for route, stats in routes:
+        label = f'route="{_escape(route)}"'
+        cumulative = 0
+        for bound, count in zip((*BUCKETS, math.inf), stats.wall.counts, strict=True):
+            cumulative += count
+            le = "+Inf" if math.isinf(bound) else repr(bound)
+            lines.append(f'{prefix}_wall_seconds_bucket{{{label},le="{le}"}} {cumulative}')
+        lines.append(f"{prefix}_wall_seconds_sum{{{label}}} {_number(stats.wall.total)}")
+        lines.append(f"{prefix}_wall_seconds_count{{{label}}} {cumulative}")
+
+    lines += [
+        f"# HELP {prefix}_wall_quantile_seconds Wall time quantiles estimated from the histogram.",
+        f"# TYPE {prefix}_wall_quantile_seconds gauge",
+    ]
+    lines.extend(
+        f'{prefix}_wall_quantile_seconds{{route="{_escape(route)}",quantile="{q}"}} '
+        f"{_number(stats.wall.quantile(q))}"
+        for route, stats in routes
+        for q in QUANTILES
+    )
+
+    counters: Iterable[tuple[str, str, str]] = (
+        ("cpu_seconds", "cpu_seconds", "CPU time of the request thread."),
+        ("sql_queries", "sql_queries", "SQL queries executed."),
+        ("sql_seconds", "sql_seconds", "Time spent in SQL queries."),
+        ("errors", "errors", "Requests that raised an exception."),
+    )
+    for name, attribute, help_text in counters:
+        lines += [f"# HELP {prefix}_{name}_total {help_text}", f"# TYPE {prefix}_{name}_total counter"]
+        lines.extend(
+            f'{prefix}_{name}_total{{route="{_escape(route)}"}} {_number(getattr(stats, attribute))}'
+            for route, stats in routes
+        )
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,154 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Time requests and jobs, and sample the stacks of the selected ones.
+
+SQL figures come from the ``query_count`` and ``query_time`` attributes the
+Odoo cursor increments on the current thread after every ``execute``; they are
+read before and after the measured block, so measuring costs no extra work
+per query.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import datetime as dt
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .metrics import MetricsRegistry, load_snapshots
+from .sampler import DEFAULT_INTERVAL, StackSampler
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+DEFAULT_DUMP_INTERVAL = 10.0
+# snapshots of workers that stopped more than a day ago are dropped
+SNAPSHOT_MAX_AGE = 24 * 3600.0
+
+
+@dataclass(frozen=True)
+class SamplingRules:
+    """Which requests get their stacks sampled: by route pattern or by user."""
+
+    routes: tuple[str, ...] = ()
+    user_ids: frozenset[int] = frozenset()
+
+    @classmethod
+    def parse(cls, routes: str | None, user_ids: Iterable[int] = ()) -> SamplingRules:
+        """Build rules from comma separated ``fnmatch`` route patterns."""
+        patterns = tuple(p.strip() for p in (routes or "").split(",") if p.strip())
+        return cls(patterns, frozenset(user_ids))
+
+    def matches(self, route: str, uid: int | None) -> bool:
+        """Tell whether a request of ``route`` by ``uid`` is sampled."""
+        if not self.routes and not self.user_ids:
+            return False
+        return uid in self.user_ids or any(fnmatchcase(route, p) for p in self.routes)
+
+
+def profile_filename(route: str) -> str:
+    """Return a collapsed-stack file name for a profile of ``route``."""
+    slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", route).strip("_")[:80] or "root"
+    stamp = dt.datetime.now(dt.UTC).strftime("%Y%m%dT%H%M%S.%f")
+    return f"{slug}-{stamp}-{os.getpid()}.folded"
+
+
+class RequestProfiler:
+    """Record the metrics of every measured block in a per-process registry.
+
+    With a ``directory``, the registry of each process is dumped to
+    ``<directory>/metrics/<pid>.json`` at most every ``dump_interval``
+    seconds, and sampled profiles are written to ``<directory>/profiles``.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str] | None = None,
+        dump_interval: float = DEFAULT_DUMP_INTERVAL,
+        sample_interval: float = DEFAULT_INTERVAL,
+    ) -> None:
+        """Keep snapshots and profiles in ``directory``."""
+        self.directory = Path(directory) if directory is not None else None
+        self.dump_interval = dump_interval
+        self.sample_interval = sample_interval
+        self._registry = MetricsRegistry()
+        self._pid = os.getpid()
+        self._last_dump = time.monotonic()
+        self._dump_lock = threading.Lock()
+
+    @property
+    def registry(self) -> MetricsRegistry:
+        """The registry of the current process.
+
+        A registry inherited through ``fork`` holds the parent's requests, so a
+        new one is started when the process id changes.
+        """
+        if self._pid != os.getpid():
+            self._registry = MetricsRegistry()
+            self._pid = os.getpid()
+        return self._registry
+
+    @contextlib.contextmanager
+    def measure(self, route: str, *, sample: bool = False) -> Iterator[None]:
+        """Measure the block as one request of ``route``, sampling its stacks if asked."""
+        thread = threading.current_thread()
+        if not hasattr(thread, "query_count"):
+            # the cursor only counts on threads that have the attributes
+            thread.query_count = 0
+            thread.query_time = 0.0
+        queries, query_time = thread.query_count, thread.query_time
+        sampler = StackSampler(interval=self.sample_interval).start() if sample else None
+        error = False
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        except BaseException:
+            error = True
+            raise
+        finally:
+            cpu, wall = time.thread_time() - cpu, time.perf_counter() - wall
+            self.registry.observe(
+                route,
+                wall,
+                cpu,
+                thread.query_count - queries,
+                thread.query_time - query_time,
+                error=error,
+            )
+            # never let bookkeeping on disk fail the measured request
+            with contextlib.suppress(OSError):
+                if sampler is not None:
+                    sampler.stop()
+                    if self.directory is not None:
+                        sampler.write(self.directory / "profiles" / profile_filename(route))
+                self.maybe_dump()
+
+    def maybe_dump(self, *, force: bool = False) -> None:
+        """Write the snapshot of this process if the last one is old enough."""
+        if self.directory is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_dump < self.dump_interval:
+            return
+        if not self._dump_lock.acquire(blocking=force):
+            return
+        try:
+            self._last_dump = now
+            path = self.directory / "metrics" / f"{os.getpid()}.json"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self.registry.dump(path)
+        finally:
+            self._dump_lock.release()
+
+    def collect(self) -> MetricsRegistry:
+        """Return the metrics of all the processes sharing ``directory``."""
+        if self.directory is None:
+            return self.registry
+        self.maybe_dump(force=True)
+        return load_snapshots(self.directory / "metrics", SNAPSHOT_MAX_AGE)
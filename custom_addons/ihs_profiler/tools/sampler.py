@@ -0,0 +1,78 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Statistical profiler of a single thread, in collapsed-stack format.
+
+A helper thread reads the current frame of the profiled thread every
+``interval`` seconds, so the profiled code runs unmodified (no ``setprofile``
+hook) and the cost is bounded by the sampling rate. The output is the
+``frame;frame;frame count`` format read by ``flamegraph.pl`` and speedscope.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import os
+    from types import FrameType
+
+DEFAULT_INTERVAL = 0.005
+MAX_DEPTH = 256
+
+
+def collapse(frame: FrameType | None) -> str:
+    """Return the stack of ``frame`` as ``outermost;...;innermost``."""
+    names = []
+    while frame is not None and len(names) < MAX_DEPTH:
+        code = frame.f_code
+        names.append(f"{frame.f_globals.get('__name__', '?')}:{code.co_qualname}")
+        frame = frame.f_back
+    names.reverse()
+    return ";".join(names).replace(" ", "_")
+
+
+class StackSampler:
+    """Sample the stack of one thread until stopped."""
+
+    def __init__(self, thread_id: int | None = None, interval: float = DEFAULT_INTERVAL) -> None:
+        """Profile the thread ``thread_id`` (the calling thread by default)."""
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> StackSampler:
+        """Start sampling in a daemon thread."""
+        self._thread = threading.Thread(target=self._run, name="ihs-stack-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> Counter[str]:
+        """Stop sampling and return ``{collapsed stack: samples}``."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self.stacks
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)  # noqa: SLF001
+            if frame is None:
+                return
+            self.stacks[collapse(frame)] += 1
+            self.samples += 1
+            del frame
+
+    def write(self, path: str | os.PathLike[str]) -> Path:
+        """Write the collected stacks to ``path`` in collapsed-stack format."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w") as out:
+            out.writelines(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+        return path
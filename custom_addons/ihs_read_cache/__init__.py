@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+from . import models
+from . import tools
+from .cache import shared_cache
+from .decorators import cached_read
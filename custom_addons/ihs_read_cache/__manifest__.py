@@ -0,0 +1,25 @@
+{
+    "name": "IHS Read Cache",
+    "version": "18.0.1.0.0",
+    "summary": "Multi-tier cache for model reads with invalidation by model and record.",
+    "description": """
+Caches the results of model methods declared with ``@cached_read``, for the
+configuration and master data read on every request (price lists, tax maps,
+units of measure). Each process keeps an LRU cache bounded in entries with a
+TTL, optionally backed by a cache shared by the workers of the host through
+the Unix socket server of ``scripts/cache_server.py``.
+
+Entries depend on records (model and IDs) and whole models. Creating,
+writing or deleting records invalidates the matching entries in every process
+once the transaction commits. Options in ``odoo.conf``:
+``ihs_read_cache_size``, ``ihs_read_cache_ttl``, ``ihs_read_cache_socket``
+and ``ihs_read_cache_sync_ms``.
+""",
+    "author": "ihs-odoo",
+    "category": "Tools",
+    "license": "LGPL-3",
+    "depends": ["base"],
+    "data": [],
+    "installable": True,
+    "application": False,
+}
@@ -0,0 +1,185 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Compare hit ratios and read latency of the cache tiers against uncached reads.
+
+Usage::
+
+    python custom_addons/ihs_read_cache/benchmarks/bench_read_cache.py --workers 4 --reads 20000
+
+The stand-in database is an SQLite file of price lists and their items. Each
+worker process reads price tables (one query per table) with a skewed
+popularity, and updates a random item for ``--write-ratio`` of the
+operations, invalidating the tables holding it. The local tier is kept
+smaller than the set of tables, so the shared tier has misses to absorb.
+SQLite answers from the page cache in tens of microseconds, far less than an
+ORM read on PostgreSQL: ``--db-latency-us`` adds that cost to every query.
+In ``local`` mode a worker never hears of the other workers' writes, which
+flatters its hit ratio: only ``local+shared`` is coherent across processes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import multiprocessing
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tools import MISSING, LocalCache, SharedCacheClient, SharedCacheServer, TieredCache
+
+ITEMS_PER_LIST = 40
+ZIPF_EXPONENT = 1.1
+
+
+def build_database(path: Path, pricelists: int) -> None:
+    """Create the stand-in database."""
+    conn = sqlite3.connect(path)
+    # readers do not wait for the writers of the other workers
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE item (id INTEGER PRIMARY KEY, pricelist_id INTEGER, product_id INTEGER, price REAL)")
+    conn.execute("CREATE INDEX item_pricelist ON item (pricelist_id)")
+    rows = (
+        (pricelist * ITEMS_PER_LIST + index, pricelist, index * 7 % 1000, float(index))
+        for pricelist in range(pricelists)
+        for index in range(ITEMS_PER_LIST)
+    )
+    conn.executemany("INSERT INTO item VALUES (?, ?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+
+def price_table(
+    conn: sqlite3.Connection, pricelist: int, latency: float,
+) -> tuple[dict[int, float], list[int]]:
+    """Read ``{product: price}`` of a price list and the item IDs it comes from."""
+    if latency:
+        time.sleep(latency)
+    rows = conn.execute(
+        "SELECT id, product_id, price FROM item WHERE pricelist_id = ?", (pricelist,),
+    ).fetchall()
+    return {product: price for _id, product, price in rows}, [row[0] for row in rows]
+
+
+def worker(args: tuple[str, str, str | None, int, int, float, int, float, int]) -> dict:
+    """Run the workload of one process and return its figures."""
+    mode, db_path, socket_path, pricelists, reads, write_ratio, local_size, latency, seed = args
+    rng = random.Random(seed)  # noqa: S311
+    conn = sqlite3.connect(db_path, timeout=30)
+    cache = None
+    if mode != "uncached":
+        shared = SharedCacheClient(socket_path) if mode == "local+shared" else None
+        cache = TieredCache(LocalCache(local_size, ttl=600), shared, sync_interval=0.05)
+    weights = list(itertools.accumulate(1 / (rank + 1) ** ZIPF_EXPONENT for rank in range(pricelists)))
+
+    latencies = []
+    writes = 0
+    started = time.perf_counter()
+    for _index in range(reads):
+        if rng.random() < write_ratio:
+            item = rng.randrange(pricelists * ITEMS_PER_LIST)
+            conn.execute("UPDATE item SET price = price + 1 WHERE id = ?", (item,))
+            conn.commit()
+            writes += 1
+            if cache is not None:
+                cache.invalidate("item", [item])
+            continue
+        pricelist = rng.choices(range(pricelists), cum_weights=weights)[0]
+        start = time.perf_counter()
+        if cache is None:
+            price_table(conn, pricelist, latency)
+        else:
+            key = ("price_table", pricelist)
+            if cache.get(key) is MISSING:
+                # SQLite reads outside a transaction: the data is the one of now
+                snapshot = cache.snapshot(["pricelist", "item"], time.time())
+                table, item_ids = price_table(conn, pricelist, latency)
+                cache.set(key, table, [("pricelist", [pricelist]), ("item", item_ids)], None, snapshot)
+        latencies.append(time.perf_counter() - start)
+    elapsed = time.perf_counter() - started
+    conn.close()
+    local = cache.local.stats if cache is not None else None
+    return {
+        "latencies": latencies,
+        "elapsed": elapsed,
+        "writes": writes,
+        "local_hits": local.hits if local else 0,
+        "shared_hits": cache.shared_hits if cache is not None else 0,
+    }
+
+
+def run_mode(mode: str, args: argparse.Namespace, db_path: Path, socket_path: Path) -> dict:
+    """Run every worker of ``mode`` and aggregate their figures."""
+    jobs = [
+        (
+            mode, str(db_path), str(socket_path), args.pricelists, args.reads,
+            args.write_ratio, args.local_size, args.db_latency_us / 1e6, seed,
+        )
+        for seed in range(args.workers)
+    ]
+    with multiprocessing.get_context("spawn").Pool(args.workers) as pool:
+        results = pool.map(worker, jobs)
+    elapsed = max(result["elapsed"] for result in results)
+    latencies = sorted(itertools.chain.from_iterable(result["latencies"] for result in results))
+    local_hits = sum(result["local_hits"] for result in results)
+    shared_hits = sum(result["shared_hits"] for result in results)
+    return {
+        "reads": len(latencies),
+        "rate": len(latencies) / elapsed,
+        "p50": statistics.median(latencies),
+        "p99": latencies[int(len(latencies) * 0.99)],
+        "local": local_hits / len(latencies),
+        "shared": shared_hits / len(latencies),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Read cache benchmark")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--reads", type=int, default=20000, help="operations per worker")
+    parser.add_argument("--pricelists", type=int, default=5000)
+    parser.add_argument("--local-size", type=int, default=500, help="entries of the local tier")
+    parser.add_argument("--write-ratio", type=float, default=0.005)
+    parser.add_argument("--db-latency-us", type=float, default=0.0, help="added to every read query")
+    args = parser.parse_args(argv)
+
+    out = sys.stdout
+    with tempfile.TemporaryDirectory(prefix="bench_read_cache_") as tmp:
+        db_path, socket_path = Path(tmp, "standin.sqlite"), Path(tmp, "cache.sock")
+        build_database(db_path, args.pricelists)
+        server = SharedCacheServer(socket_path, max_entries=args.pricelists * 2, ttl=600)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        out.write(
+            f"{args.workers} workers x {args.reads} operations, {args.pricelists} price lists, "
+            f"local tier {args.local_size} entries, {args.write_ratio:.1%} writes, "
+            f"{args.db_latency_us:.0f} us added per query\n",
+        )
+        out.write(
+            f"{'mode':>14} {'reads/s':>10} {'p50 us':>9} {'p99 us':>9} {'local hit':>10} {'shared hit':>11}\n",
+        )
+        for mode in ("uncached", "local", "local+shared"):
+            result = run_mode(mode, args, db_path, socket_path)
+            out.write(
+                f"{mode:>14} {result['rate']:>10.0f} {result['p50'] * 1e6:>9.1f} {result['p99'] * 1e6:>9.1f} "
+                f"{result['local']:>10.1%} {result['shared']:>11.1%}\n",
+            )
+        stats = SharedCacheClient(socket_path).stats()
+        out.write(
+            f"shared tier: {stats['entries']} entries, {stats['seq']} invalidations logged, "
+            f"hit ratio {stats['hits'] / max(stats['hits'] + stats['misses'], 1):.1%}\n",
+        )
+        server.shutdown()
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
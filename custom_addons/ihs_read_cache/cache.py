@@ -0,0 +1,110 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+from __future__ import annotations
+
+import datetime as dt
+import logging
+import threading
+from typing import TYPE_CHECKING
+
+from odoo.tools import config
+
+from .tools import DEFAULT_MAX_ENTRIES, DEFAULT_TTL, LocalCache, SharedCacheClient, TieredCache
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from odoo.api import Environment
+
+_logger = logging.getLogger(__name__)
+
+# postcommit data key of the invalidations of the current transaction
+PENDING_KEY = "ihs_read_cache.pending"
+# seconds the clocks of PostgreSQL and of this host may differ by
+CLOCK_MARGIN = 1.0
+
+_lock = threading.Lock()
+_cache = None
+# {dbname: models that cached methods depend on}, filled when registries load
+_watched: dict[str, set[str]] = {}
+
+
+def shared_cache() -> TieredCache:
+    """Return the process-wide :class:`TieredCache` configured from ``odoo.conf``.
+
+    Options: ``ihs_read_cache_size`` (entries per process),
+    ``ihs_read_cache_ttl`` (seconds), ``ihs_read_cache_socket`` (Unix socket
+    of ``scripts/cache_server.py``, no shared tier when unset) and
+    ``ihs_read_cache_sync_ms`` (how often invalidations from other processes
+    are fetched).
+    """
+    global _cache  # noqa: PLW0603
+    with _lock:
+        if _cache is None:
+            size = int(config.get("ihs_read_cache_size") or DEFAULT_MAX_ENTRIES)
+            ttl = float(config.get("ihs_read_cache_ttl") or DEFAULT_TTL)
+            socket_path = config.get("ihs_read_cache_socket")
+            sync_ms = float(config.get("ihs_read_cache_sync_ms") or 500)
+            _cache = TieredCache(
+                LocalCache(size, ttl),
+                SharedCacheClient(socket_path) if socket_path else None,
+                sync_ms / 1000,
+            )
+            if not socket_path:
+                _logger.info("Read cache without shared tier: other workers' writes are seen after %ss", ttl)
+        return _cache
+
+
+def scoped(env: Environment, model: str) -> str:
+    """Return the name of ``model`` in the cache, which is shared by all databases."""
+    return f"{env.cr.dbname}/{model}"
+
+
+def transaction_start(env: Environment) -> float:
+    """Return a wall-clock time before the current transaction's snapshot.
+
+    Odoo transactions run under REPEATABLE READ: their reads see the data
+    committed before their first query, which follows ``now()``. A value they
+    compute is stale if a model it depends on was invalidated after that,
+    however recent the call computing it. ``cr.now()`` is queried once per
+    transaction, by the first cache miss.
+    """
+    return env.cr.now().replace(tzinfo=dt.UTC).timestamp() - CLOCK_MARGIN
+
+
+def watch(dbname: str, models: Iterable[str]) -> None:
+    """Fire invalidations for writes on ``models`` of ``dbname``."""
+    _watched.setdefault(dbname, set()).update(models)
+
+
+def is_watched(env: Environment, model: str) -> bool:
+    """Tell whether cached methods of ``env``'s database depend on ``model``."""
+    watched = _watched.get(env.cr.dbname)
+    return watched is not None and model in watched
+
+
+def pending_models(env: Environment) -> dict[str, set[int] | None]:
+    """Return the invalidations queued by the current transaction."""
+    return env.cr.postcommit.data.get(PENDING_KEY) or {}
+
+
+def invalidate_on_commit(env: Environment, model: str, ids: Iterable[int] | None) -> None:
+    """Invalidate records ``ids`` of ``model`` in every process once the transaction commits.
+
+    Until then, cached methods depending on ``model`` bypass the cache in this
+    transaction, which sees data the other transactions do not.
+    """
+    pending = env.cr.postcommit.data.setdefault(PENDING_KEY, {})
+    if not pending:
+        cache = shared_cache()
+
+        def flush() -> None:
+            for name, res_ids in pending.items():
+                cache.invalidate(name, res_ids)
+
+        env.cr.postcommit.add(flush)
+    name = scoped(env, model)
+    if ids is None or (name in pending and pending[name] is None):
+        pending[name] = None
+    else:
+        pending.setdefault(name, set()).update(ids)
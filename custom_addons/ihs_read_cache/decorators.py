@@ -0,0 +1,81 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, Any
+
+from odoo import models
+
+from .cache import pending_models, scoped, shared_cache, transaction_start
+from .tools import MISSING, freeze
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+# context keys changing what most reads return
+DEFAULT_CONTEXT_KEYS = ("lang", "tz", "allowed_company_ids")
+# attribute of the decorated methods, read when registries load
+DEPENDS_ATTR = "_ihs_cache_depends"
+
+
+def cached_read(
+    *depends: str,
+    records: bool = True,
+    ttl: float | None = None,
+    context_keys: Iterable[str] = DEFAULT_CONTEXT_KEYS,
+) -> Callable[[Callable], Callable]:
+    """Cache the result of a model method until the data it reads changes.
+
+    The result depends on the records the method is called on (or on the whole
+    model with ``records=False``) and on every record of the models named in
+    ``depends``: creating, writing or deleting one of them invalidates it in
+    every process once committed. The key also holds the arguments, the user,
+    and the ``context_keys`` of the context.
+
+    Results are shared between callers and must not be mutated; they cannot
+    be records, return IDs or plain values instead::
+
+        @cached_read("product.pricelist.item", records=False, ttl=600)
+        def _ihs_price_table(self, pricelist_id):
+            ...
+    """
+    context_keys = tuple(context_keys)
+
+    def decorate(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self: models.BaseModel, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            env = self.env
+            deps = [(scoped(env, self._name), tuple(self._ids) if records else None)]
+            deps += [(scoped(env, model), None) for model in depends]
+            pending = pending_models(env)
+            if pending and any(model in pending for model, _ids in deps):
+                # the transaction changed the data and has not committed yet
+                return method(self, *args, **kwargs)
+
+            cache = shared_cache()
+            key = (
+                deps[0][0],
+                method.__qualname__,
+                deps[0][1],
+                env.uid,
+                env.su,
+                tuple(freeze(env.context.get(name)) for name in context_keys),
+                freeze(args),
+                freeze(kwargs),
+            )
+            value = cache.get(key, MISSING)
+            if value is not MISSING:
+                return value
+            snapshot = cache.snapshot((model for model, _ids in deps), transaction_start(env))
+            value = method(self, *args, **kwargs)
+            if isinstance(value, models.BaseModel):
+                msg = f"{method.__qualname__} is cached and cannot return records"
+                raise TypeError(msg)
+            cache.set(key, value, deps, ttl, snapshot)
+            return value
+
+        setattr(wrapper, DEPENDS_ATTR, depends)
+        return wrapper
+
+    return decorate
@@ -0,0 +1,43 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+from __future__ import annotations
+
+from odoo import api, models
+from odoo.addons.ihs_read_cache.cache import invalidate_on_commit, is_watched, watch
+from odoo.addons.ihs_read_cache.decorators import DEPENDS_ATTR
+
+
+class Base(models.AbstractModel):
+    _inherit = "base"
+
+    def _register_hook(self) -> None:
+        """Watch the models the cached methods of this model depend on."""
+        super()._register_hook()
+        depends = set()
+        for cls in type(self).__mro__:
+            for attr in vars(cls).values():
+                if callable(attr) and hasattr(attr, DEPENDS_ATTR):
+                    depends.add(self._name)
+                    depends.update(getattr(attr, DEPENDS_ATTR))
+        if depends:
+            watch(self.env.cr.dbname, depends)
+
+    @api.model_create_multi
+    def create(self, vals_list: list[dict]):
+        """Invalidate the cached reads depending on the model."""
+        records = super().create(vals_list)
+        if is_watched(self.env, self._name):
+            invalidate_on_commit(self.env, self._name, records.ids)
+        return records
+
+    def write(self, vals: dict):
+        """Invalidate the cached reads depending on the written records."""
+        if is_watched(self.env, self._name):
+            invalidate_on_commit(self.env, self._name, self.ids)
+        return super().write(vals)
+
+    def unlink(self):
+        """Invalidate the cached reads depending on the deleted records."""
+        if is_watched(self.env, self._name):
+            invalidate_on_commit(self.env, self._name, self.ids)
+        return super().unlink()
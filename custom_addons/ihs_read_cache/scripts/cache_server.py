@@ -0,0 +1,66 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Run the read cache shared by the Odoo workers of this host.
+
+Usage::
+
+    python custom_addons/ihs_read_cache/scripts/cache_server.py -c odoo.conf
+
+The socket, size and TTL come from ``ihs_read_cache_socket``,
+``ihs_read_cache_shared_size`` and ``ihs_read_cache_ttl`` in the config file,
+command line options take precedence.
+"""
+
+from __future__ import annotations
+
+import argparse
+import configparser
+import logging
+import signal
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tools import DEFAULT_MAX_ENTRIES, DEFAULT_TTL, SharedCacheServer
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+_logger = logging.getLogger("ihs_read_cache.server")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Serve until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-c", "--config", type=Path, default=REPO_ROOT / "odoo.conf")
+    parser.add_argument("--socket", help="path of the Unix socket")
+    parser.add_argument("--size", type=int, help="maximum number of entries")
+    parser.add_argument("--ttl", type=float, help="seconds an entry is kept")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    options = configparser.ConfigParser()
+    options.read(args.config)
+    socket_path = args.socket or options.get("options", "ihs_read_cache_socket", fallback=None)
+    if not socket_path:
+        parser.error("no socket: pass --socket or set ihs_read_cache_socket")
+    size = args.size or options.getint("options", "ihs_read_cache_shared_size", fallback=DEFAULT_MAX_ENTRIES * 10)
+    ttl = args.ttl or options.getfloat("options", "ihs_read_cache_ttl", fallback=DEFAULT_TTL)
+
+    server = SharedCacheServer(socket_path, size, ttl)
+    # serve_forever blocks, shutdown() must come from another thread
+    signal.signal(signal.SIGTERM, lambda *_args: threading.Thread(target=server.shutdown).start())
+    _logger.info("Serving %d entries (TTL %ss) on %s", size, ttl, socket_path)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.path.unlink(missing_ok=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
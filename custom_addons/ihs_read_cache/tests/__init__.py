@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+from . import test_cached_read
+from . import test_local_cache
+from . import test_shared_cache
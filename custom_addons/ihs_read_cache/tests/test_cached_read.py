@@ -0,0 +1,82 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+from odoo.addons.ihs_read_cache import cache as cache_module
+from odoo.addons.ihs_read_cache import decorators
+from odoo.addons.ihs_read_cache.cache import pending_models, scoped, watch
+from odoo.addons.ihs_read_cache.decorators import cached_read
+from odoo.addons.ihs_read_cache.tools import LocalCache, TieredCache
+from odoo.tests.common import TransactionCase
+
+
+class TestCachedRead(TransactionCase):
+    def setUp(self):
+        super().setUp()
+        self.partner = self.env["res.partner"].create({"name": "Cached"})
+        self.cache = TieredCache(LocalCache())
+        self.patch(decorators, "shared_cache", lambda: self.cache)
+        self.patch(cache_module, "shared_cache", lambda: self.cache)
+        self.patch(cache_module, "_watched", {})
+        watch(self.env.cr.dbname, {"res.partner", "res.country"})
+        self.calls = 0
+
+        def partner_names(records, suffix="", _country=None):
+            self.calls += 1
+            return [name + suffix for name in records.mapped("name")]
+
+        self.partner_names = cached_read("res.country")(partner_names)
+
+    def pending(self, model):
+        return pending_models(self.env).get(scoped(self.env, model), ())
+
+    def test_hits(self):
+        self.assertEqual(self.partner_names(self.partner), ["Cached"])
+        self.assertEqual(self.partner_names(self.partner), ["Cached"])
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(self.partner_names(self.partner, suffix="!"), ["Cached!"])
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(self.cache.local.stats.hits, 1)
+
+    def test_record_arguments(self):
+        country = self.env.ref("base.be")
+        self.partner_names(self.partner, _country=country)
+        self.partner_names(self.partner, _country=self.env["res.country"].browse(country.id))
+        self.assertEqual(self.calls, 1)
+
+    def test_write_invalidates_on_commit(self):
+        self.partner_names(self.partner)
+        self.partner.name = "Changed"
+        self.assertEqual(set(self.pending("res.partner")), {self.partner.id})
+        # the transaction sees its own write, the cache does not yet
+        self.assertEqual(self.partner_names(self.partner), ["Changed"])
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(len(self.cache.local), 1)
+        self.env.cr.postcommit.run()
+        self.assertEqual(len(self.cache.local), 0)
+        self.assertFalse(pending_models(self.env))
+
+    def test_refuses_fill_after_invalidation(self):
+        # another worker committed after this transaction started
+        self.cache.invalidate(scoped(self.env, "res.country"))
+        self.partner_names(self.partner)
+        self.partner_names(self.partner)
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(len(self.cache.local), 0)
+
+    def test_create_and_unlink(self):
+        partner = self.env["res.partner"].create({"name": "New"})
+        self.assertIn(partner.id, self.pending("res.partner"))
+        self.env.cr.postcommit.run()
+        self.partner.unlink()
+        self.assertEqual(set(self.pending("res.partner")), {self.partner.id})
+
+    def test_pending_dependency_bypasses_cache(self):
+        self.env.ref("base.be").name = "Belgium"
+        self.assertIn(self.env.ref("base.be").id, self.pending("res.country"))
+        self.partner_names(self.partner)
+        self.partner_names(self.partner)
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(len(self.cache.local), 0)
+
+    def test_unwatched_model(self):
+        self.env["res.partner.category"].create({"name": "Not watched"})
+        self.assertFalse(pending_models(self.env))
@@ -0,0 +1,89 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+import time
+
+from odoo.addons.ihs_read_cache.tools import MISSING, LocalCache, TieredCache
+from odoo.tests.common import BaseCase
+
+
+class TestLocalCache(BaseCase):
+    def test_evicts_least_recently_used(self):
+        cache = LocalCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.set("c", 3)
+        self.assertIs(cache.get("b"), MISSING)
+        self.assertEqual((cache.get("a"), cache.get("c")), (1, 3))
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats.evictions, 1)
+
+    def test_expires_after_ttl(self):
+        cache = LocalCache(ttl=60)
+        cache.set("kept", 1)
+        cache.set("expired", 2, ttl=0)
+        self.assertEqual(cache.get("kept"), 1)
+        self.assertIsNone(cache.get("expired", None))
+        self.assertEqual(cache.stats.expirations, 1)
+        self.assertEqual(len(cache), 1)
+
+    def test_hit_ratio(self):
+        cache = LocalCache()
+        cache.set("a", 1)
+        for _index in range(3):
+            cache.get("a")
+        cache.get("b")
+        self.assertEqual((cache.stats.hits, cache.stats.misses), (3, 1))
+        self.assertAlmostEqual(cache.stats.hit_ratio, 0.75)
+
+    def test_invalidate_records(self):
+        cache = LocalCache()
+        cache.set("one", 1, [("product", [1])])
+        cache.set("two", 2, [("product", [2])])
+        cache.set("search", 3, [("product", None)])
+        cache.set("other", 4, [("partner", [1])])
+        # a changed record also changes what a search over the model returns
+        self.assertEqual(cache.invalidate("product", [1]), 2)
+        self.assertIs(cache.get("one"), MISSING)
+        self.assertIs(cache.get("search"), MISSING)
+        self.assertEqual((cache.get("two"), cache.get("other")), (2, 4))
+
+    def test_invalidate_model(self):
+        cache = LocalCache()
+        cache.set("one", 1, [("product", [1])])
+        cache.set("two", 2, [("product", [2]), ("partner", [1])])
+        cache.set("other", 3, [("partner", [1])])
+        self.assertEqual(cache.invalidate("product"), 2)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get("other"), 3)
+
+    def test_refuses_fill_after_invalidation(self):
+        cache = LocalCache()
+        epochs = cache.epochs(["product"])
+        cache.invalidate("product", [7])
+        self.assertFalse(cache.set("a", 1, [("product", [1])], epochs=epochs))
+        # the invalidation of another model does not matter
+        epochs = cache.epochs(["product"])
+        cache.invalidate("partner", [7])
+        self.assertTrue(cache.set("a", 1, [("product", [1])], epochs=epochs))
+
+    def test_refuses_fill_read_before_invalidation(self):
+        cache = LocalCache()
+        started = time.time() - 1
+        cache.invalidate("product", [7])
+        self.assertFalse(cache.set("a", 1, [("product", [1])], since=started))
+        self.assertTrue(cache.set("a", 1, [("partner", [1])], since=started))
+        cache.clear()
+        self.assertFalse(cache.set("a", 1, [("partner", [1])], since=started))
+        self.assertTrue(cache.set("a", 1, [("product", [1])], since=time.time() + 1))
+
+    def test_tiered_snapshot(self):
+        cache = TieredCache(LocalCache())
+        # a transaction started before another one committed and invalidated
+        snapshot = cache.snapshot(["product"], started=time.time() - 1)
+        cache.invalidate("product", [1])
+        self.assertFalse(cache.set("a", 1, [("product", [2])], snapshot=snapshot))
+        self.assertIs(cache.get("a"), MISSING)
+        snapshot = cache.snapshot(["product"], started=time.time() + 1)
+        self.assertTrue(cache.set("a", 1, [("product", [2])], snapshot=snapshot))
+        self.assertEqual(cache.get("a"), 1)
@@ -0,0 +1,107 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+import tempfile
+import threading
+from pathlib import Path
+
+from odoo.addons.ihs_read_cache.tools import (
+    MISSING,
+    LocalCache,
+    SharedCacheClient,
+    SharedCacheServer,
+    TieredCache,
+)
+from odoo.tests.common import BaseCase
+
+
+class TestSharedCache(BaseCase):
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "cache.sock"
+        self.server = self.start_server()
+
+    def start_server(self, log_size=100):
+        server = SharedCacheServer(self.path, log_size=log_size)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        def stop():
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+        self.addCleanup(stop)
+        return server
+
+    def worker(self):
+        """Return the cache of another worker process."""
+        client = SharedCacheClient(self.path)
+        self.addCleanup(client.close)
+        return TieredCache(LocalCache(), client, sync_interval=0)
+
+    def test_shared_hit(self):
+        first, second = self.worker(), self.worker()
+        self.assertTrue(first.set("table", {1: 2.5}, [("product", [1])]))
+        self.assertEqual(second.get("table"), {1: 2.5})
+        self.assertEqual(second.shared_hits, 1)
+        # filled locally by the shared hit
+        self.assertEqual(second.get("table"), {1: 2.5})
+        self.assertEqual((second.shared_hits, second.local.stats.hits), (1, 1))
+
+    def test_catches_up_with_invalidations(self):
+        first, second = self.worker(), self.worker()
+        first.set("one", 1, [("product", [1])])
+        first.set("two", 2, [("product", [2])])
+        self.assertEqual((second.get("one"), second.get("two")), (1, 2))
+        first.invalidate("product", [1])
+        second.sync(force=True)
+        self.assertEqual(len(second.local), 1)
+        self.assertIs(second.get("one"), MISSING)
+        self.assertEqual(second.get("two"), 2)
+        self.assertEqual(second.sync(force=True), None)
+        self.assertEqual(len(second.local), 1)
+
+    def test_resets_when_behind_the_log(self):
+        self.server.log = type(self.server.log)(maxlen=2)
+        first, second = self.worker(), self.worker()
+        second.sync(force=True)
+        second.local.set("local", 1, [("partner", [1])])
+        for res_id in range(3):
+            first.invalidate("product", [res_id])
+        # the log no longer goes back to what the second worker saw
+        second.sync(force=True)
+        self.assertEqual(len(second.local), 0)
+
+    def test_resets_on_server_restart(self):
+        first = self.worker()
+        first.sync(force=True)
+        first.local.set("local", 1, [("partner", [1])])
+        self.server.shutdown()
+        self.server.server_close()
+        self.server = self.start_server()
+        first.shared.close()
+        first.sync(force=True)
+        self.assertEqual(len(first.local), 0)
+
+    def test_refuses_stale_fill(self):
+        first, second = self.worker(), self.worker()
+        second.sync(force=True)
+        snapshot = second.snapshot(["product"])
+        first.invalidate("product", [1])
+        # the second worker has not synced yet: its local tier takes the value, the shared one refuses it
+        self.assertTrue(second.set("table", 1, [("product", [1])], snapshot=snapshot))
+        self.assertIs(first.get("table"), MISSING)
+        second.sync(force=True)
+        self.assertIs(second.get("table"), MISSING)
+
+    def test_unpicklable_key_is_a_miss(self):
+        cache = self.worker()
+        key = ("table", threading.Lock())
+        self.assertIs(cache.get(key), MISSING)
+        self.assertTrue(cache.set(key, 1))
+        # the server is not marked down for it
+        cache.set("table", 2)
+        cache.local.clear()
+        self.assertEqual(cache.get("table"), 2)
@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+from .lru import DEFAULT_MAX_ENTRIES, DEFAULT_TTL, MISSING, CacheStats, LocalCache, dependencies
+from .shared import SharedCacheClient, SharedCacheServer, SharedCacheUnavailable
+from .tiered import DEFAULT_SYNC_INTERVAL, Snapshot, TieredCache, freeze
@@ -0,0 +1,214 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Bounded LRU cache with expiry and invalidation by model and record IDs.
+
+Every entry declares its dependencies as ``(model, ids)`` pairs, ``ids``
+being ``None`` when the entry depends on the whole model (a search, a table
+of all the records). Invalidating ``(model, ids)`` drops the entries that
+depend on one of those records and every entry depending on the whole model,
+since a created, changed or deleted record may change what a search returns.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable
+
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_TTL = 300.0
+MISSING = object()
+
+Dependency = tuple[str, "frozenset[int] | None"]
+# (clears, {model: invalidations}) of a cache at some point, or (clears,
+# invalidations of any model)
+Epochs = tuple[int, "dict[str, int] | int"]
+
+
+def dependencies(deps: Iterable[tuple[str, Iterable[int] | None]]) -> tuple[Dependency, ...]:
+    """Normalize ``(model, ids or None)`` pairs."""
+    return tuple((model, None if ids is None else frozenset(ids)) for model, ids in deps)
+
+
+@dataclass
+class CacheStats:
+    """Counters of a cache tier."""
+
+    hits: int = 0
+    misses: int = 0
+    expirations: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of the lookups that were hits."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires: float
+    deps: tuple[Dependency, ...]
+
+
+class LocalCache:
+    """Per-process cache of at most ``max_entries`` values, each kept ``ttl`` seconds."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: float = DEFAULT_TTL) -> None:
+        """Create an empty cache."""
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        # all keys depending on a model, on the whole model, on one record
+        self._by_model: defaultdict[str, set[Hashable]] = defaultdict(set)
+        self._by_whole_model: defaultdict[str, set[Hashable]] = defaultdict(set)
+        self._by_record: defaultdict[tuple[str, int], set[Hashable]] = defaultdict(set)
+        # bumped on every invalidation of a model and every clear, see :meth:`epochs`
+        self._epochs: defaultdict[str, int] = defaultdict(int)
+        self._clears = 0
+        self._invalidations = 0
+        # wall-clock time of the last invalidation of each model and of the last clear
+        self._invalidated_at: dict[str, float] = {}
+        self._cleared_at = 0.0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of entries, expired ones included."""
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:  # noqa: ANN401
+        """Return the value of ``key``, or ``default`` when absent or expired."""
+        found = self.lookup(key)
+        return default if found is None else found[0]
+
+    def lookup(self, key: Hashable) -> tuple[Any, tuple[Dependency, ...], float] | None:
+        """Return ``(value, deps, seconds left)`` of ``key``, or None when absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            left = entry.expires - time.monotonic()
+            if left <= 0:
+                self._remove(key)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry.value, entry.deps, left
+
+    def set(  # noqa: PLR0913
+        self,
+        key: Hashable,
+        value: Any,  # noqa: ANN401
+        deps: Iterable[tuple[str, Iterable[int] | None]] = (),
+        ttl: float | None = None,
+        epochs: Epochs | None = None,
+        *,
+        since: float | None = None,
+    ) -> bool:
+        """Store ``value`` under ``key``, depending on ``deps``.
+
+        With ``epochs`` (taken by :meth:`epochs` before computing the value),
+        nothing is stored if one of the models was invalidated meanwhile: the
+        value may have been computed from data changed since. ``since`` is the
+        same check against a wall-clock time, when the data was read from a
+        snapshot older than the call (a database transaction).
+        """
+        deps = dependencies(deps)
+        with self._lock:
+            if epochs is not None and epochs != self._current_epochs(
+                None if isinstance(epochs[1], int) else epochs[1],
+            ):
+                return False
+            if since is not None and self._changed_since(deps, since):
+                return False
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(value, time.monotonic() + (self.ttl if ttl is None else ttl), deps)
+            for model, ids in deps:
+                self._by_model[model].add(key)
+                if ids is None:
+                    self._by_whole_model[model].add(key)
+                else:
+                    for res_id in ids:
+                        self._by_record[model, res_id].add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.stats.evictions += 1
+            return True
+
+    def epochs(self, models: Iterable[str] | None) -> Epochs:
+        """Return the invalidation counters of ``models`` (any model when None), for :meth:`set`."""
+        with self._lock:
+            return self._current_epochs(models)
+
+    def _changed_since(self, deps: Iterable[Dependency], since: float) -> bool:
+        """Tell whether the cache was cleared or a model of ``deps`` invalidated after ``since``; lock held."""
+        return self._cleared_at > since or any(
+            self._invalidated_at.get(model, 0.0) > since for model, _ids in deps
+        )
+
+    def _current_epochs(self, models: Iterable[str] | None) -> Epochs:
+        if models is None:
+            return self._clears, self._invalidations
+        return self._clears, {model: self._epochs.get(model, 0) for model in models}
+
+    def invalidate(self, model: str, ids: Iterable[int] | None = None) -> int:
+        """Drop the entries depending on records ``ids`` of ``model`` (all when None).
+
+        Returns the number of entries dropped.
+        """
+        with self._lock:
+            self._epochs[model] += 1
+            self._invalidations += 1
+            self._invalidated_at[model] = time.time()
+            if ids is None:
+                keys = set(self._by_model.get(model, ()))
+            else:
+                keys = set(self._by_whole_model.get(model, ()))
+                for res_id in ids:
+                    keys.update(self._by_record.get((model, res_id), ()))
+            for key in keys:
+                self._remove(key)
+            self.stats.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._clears += 1
+            self._cleared_at = time.time()
+            self._entries.clear()
+            self._by_model.clear()
+            self._by_whole_model.clear()
+            self._by_record.clear()
+
+    def _remove(self, key: Hashable) -> None:
+        """Drop ``key`` and its index entries; lock held."""
+        entry = self._entries.pop(key)
+        for model, ids in entry.deps:
+            self._discard(self._by_model, model, key)
+            if ids is None:
+                self._discard(self._by_whole_model, model, key)
+            else:
+                for res_id in ids:
+                    self._discard(self._by_record, (model, res_id), key)
+
+    @staticmethod
+    def _discard(index: defaultdict, item: Hashable, key: Hashable) -> None:
+        keys = index.get(item)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del index[item]
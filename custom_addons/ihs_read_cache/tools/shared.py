@@ -0,0 +1,288 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Cache tier shared by the processes of a host, over a Unix socket.
+
+The server keeps a :class:`LocalCache` and a log of the invalidations it
+received, numbered by a sequence. Clients read and fill the shared entries,
+send their invalidations, and poll the log to drop the matching entries of
+their own local tier, which is how a write in one worker reaches the others.
+
+Frames are a 4-byte length followed by a pickle. Pickles are only exchanged
+with the socket's owner: the socket is created with mode 0600, keep it in a
+directory that only the Odoo user can write to.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import secrets
+import socket
+import socketserver
+import struct
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .lru import DEFAULT_MAX_ENTRIES, DEFAULT_TTL, LocalCache, dependencies
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable
+
+    from .lru import Dependency
+
+DEFAULT_LOG_SIZE = 100000
+DEFAULT_TIMEOUT = 1.0
+DEFAULT_RETRY_INTERVAL = 5.0
+_HEADER = struct.Struct("!I")
+
+
+class SharedCacheUnavailable(OSError):  # noqa: N818
+    """Raised when the shared cache server cannot be reached."""
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            msg = "Connection closed"
+            raise ConnectionError(msg)
+        data += chunk
+    return bytes(data)
+
+
+# raised by pickle for objects it cannot dump or load, besides its own errors
+PICKLE_ERRORS = (pickle.PickleError, TypeError, AttributeError, ImportError)
+
+
+def encode_frame(obj: Any) -> bytes:  # noqa: ANN401
+    """Return ``obj`` as one frame."""
+    payload = pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+    return _HEADER.pack(len(payload)) + payload
+
+
+def send_frame(sock: socket.socket, obj: Any) -> None:  # noqa: ANN401
+    """Send ``obj`` as one frame."""
+    sock.sendall(encode_frame(obj))
+
+
+def recv_payload(sock: socket.socket) -> bytes:
+    """Receive the pickle of one frame."""
+    (size,) = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    return _recv_exact(sock, size)
+
+
+def recv_frame(sock: socket.socket) -> Any:  # noqa: ANN401
+    """Receive one frame."""
+    return pickle.loads(recv_payload(sock))  # noqa: S301
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    server: SharedCacheServer
+
+    def handle(self) -> None:
+        while True:
+            try:
+                payload = recv_payload(self.request)
+            except (ConnectionError, OSError, EOFError):
+                return
+            try:
+                op, *args = pickle.loads(payload)  # noqa: S301
+                result = self.server.dispatch(op, args)
+            except PICKLE_ERRORS:
+                # a value of a class this process cannot import: answered as a miss
+                result = None
+            send_frame(self.request, result)
+
+
+class SharedCacheServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Serve a shared cache on the Unix socket ``path``."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: float = DEFAULT_TTL,
+        log_size: int = DEFAULT_LOG_SIZE,
+    ) -> None:
+        """Bind ``path``, replacing a socket left by a previous server."""
+        self.path = Path(path)
+        self.cache = LocalCache(max_entries, ttl)
+        # identifies this run: sequences restart with the server
+        self.token = secrets.token_hex(8)
+        self.seq = 0
+        self.log: deque[tuple[int, str, frozenset[int] | None]] = deque(maxlen=log_size)
+        self._invalidated: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.path.unlink(missing_ok=True)
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(str(self.path), _Handler)
+        finally:
+            os.umask(old_umask)
+
+    def dispatch(self, op: str, args: list) -> Any:  # noqa: ANN401
+        """Run one client request."""
+        if op == "get":
+            return self.cache.lookup(args[0])
+        if op == "set":
+            return self.store(*args)
+        if op == "invalidate":
+            return self.invalidate(*args)
+        if op == "events":
+            return self.events(*args)
+        if op == "stats":
+            return {"entries": len(self.cache), "seq": self.seq, **vars(self.cache.stats)}
+        msg = f"Unknown operation {op!r}"
+        raise ValueError(msg)
+
+    def store(  # noqa: PLR0913, PLR0917
+        self,
+        key: Hashable,
+        value: Any,  # noqa: ANN401
+        deps: tuple[Dependency, ...],
+        ttl: float | None,
+        seq: int,
+        since: float | None = None,
+    ) -> bool:
+        """Store an entry computed by a client that had seen the log up to ``seq``.
+
+        Refused when one of its models was invalidated after ``seq``, or after
+        the wall-clock time ``since`` its data was read at.
+        """
+        with self._lock:
+            if any(self._invalidated.get(model, 0) > seq for model, _ids in deps):
+                return False
+            return self.cache.set(key, value, deps, ttl, since=since)
+
+    def invalidate(self, model: str, ids: Iterable[int] | None) -> int:
+        """Drop the matching entries and log the invalidation; return its sequence."""
+        ids = None if ids is None else frozenset(ids)
+        with self._lock:
+            self.seq += 1
+            self.log.append((self.seq, model, ids))
+            self._invalidated[model] = self.seq
+            self.cache.invalidate(model, ids)
+            return self.seq
+
+    def events(
+        self, since: int, token: str | None,
+    ) -> tuple[str, int, list[tuple[int, str, frozenset[int] | None]] | None]:
+        """Return ``(token, seq, invalidations after since)``.
+
+        The invalidations are None when the client cannot catch up (another
+        server run, or the log no longer goes back to ``since``) and must drop
+        its whole local tier.
+        """
+        with self._lock:
+            if token != self.token or (self.log and self.log[0][0] > since + 1):
+                return self.token, self.seq, None
+            if since >= self.seq:
+                return self.token, self.seq, []
+            start = len(self.log) - (self.seq - since)
+            return self.token, self.seq, [self.log[index] for index in range(max(start, 0), len(self.log))]
+
+
+class SharedCacheClient:
+    """Connection to a :class:`SharedCacheServer`, one socket per thread.
+
+    After a failure the server is considered down for ``retry_interval``
+    seconds, during which calls fail immediately.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        timeout: float = DEFAULT_TIMEOUT,
+        retry_interval: float = DEFAULT_RETRY_INTERVAL,
+    ) -> None:
+        """Connect lazily to the socket ``path``."""
+        self.path = str(path)
+        self.timeout = timeout
+        self.retry_interval = retry_interval
+        self._local = threading.local()
+        self._down_until = 0.0
+
+    def _socket(self) -> socket.socket:
+        sock = getattr(self._local, "sock", None)
+        # a socket inherited through fork is shared with the parent
+        if sock is not None and self._local.pid == os.getpid():
+            return sock
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.path)
+        except OSError:
+            sock.close()
+            raise
+        self._local.sock, self._local.pid = sock, os.getpid()
+        return sock
+
+    def call(self, op: str, *args: Any) -> Any:  # noqa: ANN401
+        """Run ``op`` on the server and return its result."""
+        if time.monotonic() < self._down_until:
+            msg = "Shared cache server marked down"
+            raise SharedCacheUnavailable(msg)
+        try:
+            frame = encode_frame((op, *args))
+        except PICKLE_ERRORS as exc:
+            # a key or value that cannot be pickled is a miss, the server is fine
+            msg = f"Cannot send {op!r} to the shared cache: {exc}"
+            raise SharedCacheUnavailable(msg) from exc
+        try:
+            sock = self._socket()
+            sock.sendall(frame)
+            payload = recv_payload(sock)
+        except (OSError, EOFError) as exc:
+            self.close()
+            self._down_until = time.monotonic() + self.retry_interval
+            msg = f"Shared cache server unavailable: {exc}"
+            raise SharedCacheUnavailable(msg) from exc
+        try:
+            return pickle.loads(payload)  # noqa: S301
+        except PICKLE_ERRORS as exc:
+            msg = f"Cannot read the answer of the shared cache to {op!r}: {exc}"
+            raise SharedCacheUnavailable(msg) from exc
+
+    def close(self) -> None:
+        """Close the socket of the current thread."""
+        sock = getattr(self._local, "sock", None)
+        if sock is not None:
+            if self._local.pid == os.getpid():
+                sock.close()
+            self._local.sock = None
+
+    def lookup(self, key: Hashable) -> tuple[Any, tuple[Dependency, ...], float] | None:
+        """Return ``(value, deps, seconds left)`` of ``key``, or None."""
+        return self.call("get", key)
+
+    def set(  # noqa: PLR0913, PLR0917
+        self,
+        key: Hashable,
+        value: Any,  # noqa: ANN401
+        deps: Iterable[tuple[str, Iterable[int] | None]],
+        ttl: float | None,
+        seq: int,
+        since: float | None = None,
+    ) -> bool:
+        """Store an entry computed after seeing the log up to ``seq``, from data read at ``since``."""
+        return self.call("set", key, value, dependencies(deps), ttl, seq, since)
+
+    def invalidate(self, model: str, ids: Iterable[int] | None = None) -> int:
+        """Invalidate for every process; return the sequence of the invalidation."""
+        return self.call("invalidate", model, None if ids is None else frozenset(ids))
+
+    def events(
+        self, since: int, token: str | None,
+    ) -> tuple[str, int, list[tuple[int, str, frozenset[int] | None]] | None]:
+        """Return the invalidations after ``since``, see :meth:`SharedCacheServer.events`."""
+        return self.call("events", since, token)
+
+    def stats(self) -> dict[str, int]:
+        """Return the counters of the server."""
+        return self.call("stats")
@@ -0,0 +1,166 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Local tier in front of an optional shared tier, kept coherent by invalidations.
+
+Lookups go to the local tier, then to the shared one, filling the local tier
+on a shared hit. Invalidations are applied locally and sent to the shared
+tier, and every ``sync_interval`` seconds the invalidations sent by the other
+processes are fetched and applied locally: entries another process has
+invalidated stay visible here for at most that long.
+
+Without a shared tier each process only sees its own invalidations, and the
+TTL bounds how long another process' writes are missed.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .lru import MISSING, LocalCache, dependencies
+from .shared import SharedCacheClient, SharedCacheUnavailable
+
+try:
+    from odoo.models import BaseModel
+except ImportError:
+    # used without Odoo by the benchmarks, where no argument is a record
+    BaseModel = None
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable
+
+    from .lru import Epochs
+
+DEFAULT_SYNC_INTERVAL = 0.5
+
+
+def freeze(value: Any) -> Hashable:  # noqa: ANN401
+    """Return a hashable equivalent of ``value`` for cache keys.
+
+    Records become ``(model, ids)``: a recordset would keep its environment
+    and cursor alive in the cache, and cannot be sent to the shared tier.
+    """
+    if BaseModel is not None and isinstance(value, BaseModel):
+        return value._name, value._ids  # noqa: SLF001
+    if isinstance(value, dict):
+        return tuple(sorted((key, freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(item) for item in value)
+    return value
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Invalidation state taken before computing a value, see :meth:`TieredCache.snapshot`."""
+
+    epochs: Epochs | None
+    seq: int
+    started: float | None = None
+
+
+class TieredCache:
+    """Read-through cache over a :class:`LocalCache` and a :class:`SharedCacheClient`."""
+
+    def __init__(
+        self,
+        local: LocalCache,
+        shared: SharedCacheClient | None = None,
+        sync_interval: float = DEFAULT_SYNC_INTERVAL,
+    ) -> None:
+        """Cache in ``local``, and in ``shared`` when given."""
+        self.local = local
+        self.shared = shared
+        self.sync_interval = sync_interval
+        self.shared_hits = 0
+        self.shared_errors = 0
+        self._token: str | None = None
+        self._seq = 0
+        self._synced = 0.0
+        self._sync_lock = threading.Lock()
+
+    def _shared_call(self, method: str, *args: Any) -> Any:  # noqa: ANN401
+        try:
+            return getattr(self.shared, method)(*args)
+        except SharedCacheUnavailable:
+            self.shared_errors += 1
+            return None
+
+    def sync(self, *, force: bool = False) -> None:
+        """Apply the invalidations the other processes sent to the shared tier."""
+        if self.shared is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._synced < self.sync_interval:
+            return
+        if not self._sync_lock.acquire(blocking=force):
+            # another thread is syncing
+            return
+        try:
+            self._synced = now
+            result = self._shared_call("events", self._seq, self._token)
+            if result is None:
+                return
+            token, seq, events = result
+            if events is None:
+                self.local.clear()
+            else:
+                for _seq, model, ids in events:
+                    self.local.invalidate(model, ids)
+            self._token, self._seq = token, seq
+        finally:
+            self._sync_lock.release()
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:  # noqa: ANN401
+        """Return the value of ``key`` from the first tier holding it, or ``default``."""
+        self.sync()
+        value = self.local.get(key, MISSING)
+        if value is not MISSING or self.shared is None:
+            return default if value is MISSING else value
+        # the deps are only known after the lookup: watch every model meanwhile
+        epochs = self.local.epochs(None)
+        found = self._shared_call("lookup", key)
+        if found is None:
+            return default
+        value, deps, left = found
+        self.shared_hits += 1
+        self.local.set(key, value, deps, left, epochs)
+        return value
+
+    def snapshot(self, models: Iterable[str], started: float | None = None) -> Snapshot:
+        """Return the invalidation state of ``models``, taken before computing a value.
+
+        ``started`` is the wall-clock time the data will be read at, when it
+        comes from an older snapshot than now: a transaction under REPEATABLE
+        READ sees the data of its start, and invalidations received since
+        then must refuse the value as well.
+        """
+        return Snapshot(self.local.epochs(models), self._seq, started)
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,  # noqa: ANN401
+        deps: Iterable[tuple[str, Iterable[int] | None]] = (),
+        ttl: float | None = None,
+        snapshot: Snapshot | None = None,
+    ) -> bool:
+        """Store ``value`` in every tier, unless its models were invalidated since ``snapshot``."""
+        deps = dependencies(deps)
+        if snapshot is None:
+            snapshot = Snapshot(None, self._seq)
+        if not self.local.set(key, value, deps, ttl, snapshot.epochs, since=snapshot.started):
+            return False
+        if self.shared is not None:
+            self._shared_call("set", key, value, deps, ttl, snapshot.seq, snapshot.started)
+        return True
+
+    def invalidate(self, model: str, ids: Iterable[int] | None = None) -> None:
+        """Drop the entries depending on records ``ids`` of ``model`` in every tier."""
+        ids = None if ids is None else frozenset(ids)
+        self.local.invalidate(model, ids)
+        if self.shared is not None:
+            self._shared_call("invalidate", model, ids)
@@ -0,0 +1,29 @@
+{
+    "name": "IHS Recompute",
+    "version": "18.0.1.0.0",
+    "summary": "Batched, resumable recompute of stored computed fields over millions of rows.",
+    "description": """
+Recomputes stored computed fields outside of the upgrade transaction. The
+records are split into ID ranges of about equal counts, each with a
+checkpoint row; a range is processed in batches read after its checkpoint,
+and every batch is committed together with the checkpoint, so an interrupted
+recompute resumes where it stopped and memory stays flat. Ranges are shared
+by the cron and the processes of ``scripts/recompute.py`` through advisory
+locks. A dry run times one sampled batch and extrapolates the total time.
+
+A model listing new fields in ``_ihs_recompute_deferred`` gets a queued task
+instead of recomputing them during the upgrade; migration scripts can call
+``env["ihs.recompute.task"]._schedule(model, fields)`` for changed ones.
+""",
+    "author": "ihs-odoo",
+    "category": "Tools",
+    "license": "LGPL-3",
+    "depends": ["base"],
+    "data": [
+        "security/ir.model.access.csv",
+        "data/ir_cron.xml",
+        "views/ihs_recompute_task_views.xml",
+    ],
+    "installable": True,
+    "application": False,
+}
@@ -0,0 +1,336 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Compare a one-transaction recompute with batched, checkpointed ones.
+
+Usage::
+
+    python custom_addons/ihs_recompute/benchmarks/bench_recompute.py -c odoo.conf --rows 500000 --processes 1,2,4
+
+Fills a scratch table of order lines in the database of ``db_name``, then
+recomputes their ``total`` column: first in one transaction reading every
+row, as an upgrade does, then range by range with the engine, committing
+each batch with its checkpoint, in 1, 2, 4... processes. ``--compute-us``
+adds the per-record cost of an ORM compute method. For each run: wall time,
+longest transaction (how long rows stay locked) and peak RSS of the busiest
+process. The dry-run estimate, timed on one sampled batch, is printed first;
+the batched run is interrupted halfway once to check it resumes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import configparser
+import functools
+import multiprocessing
+import random
+import resource
+import sys
+import time
+from decimal import ROUND_HALF_UP, Decimal
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import psycopg2
+from psycopg2 import extras
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tools import RANGE_LOCK_NS, Checkpoint, estimate, run_range, split_ranges
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+TABLE = "ihs_recompute_bench"
+CHECKPOINTS = "ihs_recompute_bench_checkpoint"
+CENT = Decimal("0.01")
+
+
+def connection_params(config: Path) -> dict[str, str]:
+    """Return the psycopg2 connection parameters of an Odoo config file."""
+    options = configparser.ConfigParser()
+    options.read(config)
+    params = {
+        "dbname": options.get("options", "db_name", fallback="postgres"),
+        "host": options.get("options", "db_host", fallback=""),
+        "port": options.get("options", "db_port", fallback=""),
+        "user": options.get("options", "db_user", fallback=""),
+        "password": options.get("options", "db_password", fallback=""),
+    }
+    return {key: value for key, value in params.items() if value and value != "False"}
+
+
+def line_total(qty: int, price: Decimal, discount: Decimal, compute_us: float) -> Decimal:
+    """Compute a line total, spinning ``compute_us`` as an ORM compute method would."""
+    deadline = time.perf_counter() + compute_us / 1e6
+    while time.perf_counter() < deadline:
+        pass
+    # rounded like PostgreSQL's round(), half away from zero
+    return (qty * price * (1 - discount / 100)).quantize(CENT, ROUND_HALF_UP)
+
+
+def setup(conn: psycopg2.extensions.connection, rows: int) -> None:
+    """Create the scratch tables with ``rows`` lines, totals not computed yet."""
+    with conn.cursor() as cr:
+        cr.execute(f"DROP TABLE IF EXISTS {TABLE}, {CHECKPOINTS}")
+        cr.execute(
+            f"""
+            CREATE TABLE {TABLE} (id serial PRIMARY KEY, qty integer, price numeric, discount numeric, total numeric);
+            CREATE TABLE {CHECKPOINTS} (id serial PRIMARY KEY, data jsonb NOT NULL);
+            INSERT INTO {TABLE} (qty, price, discount)
+                SELECT 1 + n %% 17, (n %% 1000) / 10.0 + 0.99, n %% 4 * 5 FROM generate_series(1, %s) n;
+            ANALYZE {TABLE};
+        """,  # noqa: S608
+            (rows,),
+        )
+    conn.commit()
+
+
+def reset(conn: psycopg2.extensions.connection, processes: int) -> int:
+    """Clear the totals and plan ranges of equal counts; return the number of rows."""
+    parts = processes * 4
+    with conn.cursor() as cr:
+        cr.execute(f"UPDATE {TABLE} SET total = NULL")  # noqa: S608
+        cr.execute(f"TRUNCATE {CHECKPOINTS}")
+        cr.execute(
+            f"SELECT count(*), min(id) - 1, percentile_disc(%s::float8[]) WITHIN GROUP (ORDER BY id) FROM {TABLE}",  # noqa: S608
+            ([(index + 1) / parts for index in range(parts)],),
+        )
+        count, start, bounds = cr.fetchone()
+        for range_start, range_end in split_ranges([start, *bounds]):
+            cr.execute(
+                f"INSERT INTO {CHECKPOINTS} (data) VALUES (%s)",  # noqa: S608
+                (extras.Json(Checkpoint(range_start, range_end).to_dict()),),
+            )
+    conn.commit()
+    return count
+
+
+class SqlTarget:
+    """Recompute line totals with one read and one write statement per batch."""
+
+    def __init__(
+        self, conn: psycopg2.extensions.connection, checkpoint_id: int | None, compute_us: float,
+    ) -> None:
+        """Write through ``conn``, saving progress in the row ``checkpoint_id``."""
+        self.conn = conn
+        self.checkpoint_id = checkpoint_id
+        self.compute_us = compute_us
+        self.longest = 0.0
+        self._started = time.perf_counter()
+
+    def ids(self, after: int, end: int, limit: int) -> list[int]:
+        """Return the next IDs of the range."""
+        with self.conn.cursor() as cr:
+            cr.execute(
+                f"SELECT id FROM {TABLE} WHERE id > %s AND id <= %s ORDER BY id LIMIT %s",  # noqa: S608
+                (after, end, limit),
+            )
+            return [row[0] for row in cr.fetchall()]
+
+    def compute(self, ids: Sequence[int]) -> None:
+        """Recompute and write the totals of ``ids``."""
+        with self.conn.cursor() as cr:
+            cr.execute(
+                f"SELECT id, qty, price, discount FROM {TABLE} WHERE id = ANY(%s)", (list(ids),),  # noqa: S608
+            )
+            values = [
+                (id_, line_total(qty, price, discount, self.compute_us))
+                for id_, qty, price, discount in cr
+            ]
+            extras.execute_values(
+                cr,
+                f"UPDATE {TABLE} SET total = v.total FROM (VALUES %s) v (id, total) WHERE {TABLE}.id = v.id",  # noqa: S608
+                values,
+                page_size=len(values),
+            )
+
+    def save(self, checkpoint: Checkpoint) -> None:
+        """Commit the batch with ``checkpoint``."""
+        with self.conn.cursor() as cr:
+            cr.execute(
+                f"UPDATE {CHECKPOINTS} SET data = %s WHERE id = %s",  # noqa: S608
+                (extras.Json(checkpoint.to_dict()), self.checkpoint_id),
+            )
+        self.conn.commit()
+        now = time.perf_counter()
+        self.longest = max(self.longest, now - self._started)
+        self._started = now
+
+    def rollback(self) -> None:
+        """Abandon the batch."""
+        self.conn.rollback()
+        self._started = time.perf_counter()
+
+
+def max_rss_mb() -> float:
+    """Return the peak resident memory of this process, in MiB."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_single(params: dict[str, str], compute_us: float) -> tuple[float, float, int]:
+    """Recompute every row in one transaction, as an upgrade does."""
+    conn = psycopg2.connect(**params)
+    start = time.perf_counter()
+    with conn.cursor() as cr:
+        cr.execute(f"SELECT id, qty, price, discount FROM {TABLE} ORDER BY id")  # noqa: S608
+        values = [
+            (id_, line_total(qty, price, discount, compute_us))
+            for id_, qty, price, discount in cr.fetchall()
+        ]
+        extras.execute_values(
+            cr,
+            f"UPDATE {TABLE} SET total = v.total FROM (VALUES %s) v (id, total) WHERE {TABLE}.id = v.id",  # noqa: S608
+            values,
+        )
+    conn.commit()
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return elapsed, max_rss_mb(), len(values)
+
+
+def run_worker(
+    params: dict[str, str],
+    batch_size: int,
+    prefetch: int,
+    compute_us: float,
+    stop_after: int | None,
+    _index: int,
+) -> tuple[float, float, int]:
+    """Run the ranges no other process holds; return (longest transaction, peak RSS, records)."""
+    conn = psycopg2.connect(**params)
+    records = 0
+    longest = 0.0
+    with conn.cursor() as cr:
+        cr.execute(f"SELECT id FROM {CHECKPOINTS} WHERE NOT (data->>'done')::boolean ORDER BY id")  # noqa: S608
+        pending = [row[0] for row in cr.fetchall()]
+    conn.commit()
+    for checkpoint_id in pending:
+        with conn.cursor() as cr:
+            cr.execute("SELECT pg_try_advisory_lock(%s, %s)", (RANGE_LOCK_NS, checkpoint_id))
+            locked = cr.fetchone()[0]
+            cr.execute(f"SELECT data FROM {CHECKPOINTS} WHERE id = %s", (checkpoint_id,))  # noqa: S608
+            checkpoint = Checkpoint.from_dict(cr.fetchone()[0])
+        conn.commit()
+        if not locked:
+            continue
+        try:
+            if checkpoint.done:
+                continue
+            target = SqlTarget(conn, checkpoint_id, compute_us)
+            before = checkpoint.records
+            for progress in run_range(target, checkpoint, batch_size, prefetch):
+                if stop_after is not None and progress.records - before >= stop_after:
+                    break
+            records += checkpoint.records - before
+            longest = max(longest, target.longest)
+        finally:
+            with conn.cursor() as cr:
+                cr.execute("SELECT pg_advisory_unlock(%s, %s)", (RANGE_LOCK_NS, checkpoint_id))
+            conn.commit()
+    conn.close()
+    return longest, max_rss_mb(), records
+
+
+def _noop(_index: int) -> None:
+    pass
+
+
+def run_batched(
+    params: dict[str, str], args: argparse.Namespace, processes: int, stop_after: int | None = None,
+) -> tuple[float, float, float, int]:
+    """Recompute the pending ranges in ``processes`` processes."""
+    worker = functools.partial(
+        run_worker, params, args.batch_size, args.prefetch, args.compute_us, stop_after,
+    )
+    with multiprocessing.get_context("spawn").Pool(processes) as pool:
+        # start the processes first, their start-up is not timed
+        pool.map(_noop, range(processes))
+        start = time.perf_counter()
+        results = pool.map(worker, range(processes))
+        elapsed = time.perf_counter() - start
+    return (
+        elapsed,
+        max(result[0] for result in results),
+        max(result[1] for result in results),
+        sum(result[2] for result in results),
+    )
+
+
+def wrong_totals(conn: psycopg2.extensions.connection) -> int:
+    """Return the number of rows whose total is missing or wrong."""
+    with conn.cursor() as cr:
+        cr.execute(
+            f"SELECT count(*) FROM {TABLE} WHERE total IS DISTINCT FROM round(qty * price * (1 - discount / 100), 2)",  # noqa: S608
+        )
+        count = cr.fetchone()[0]
+    conn.commit()
+    return count
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark and print one line per run."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-c", "--config", type=Path, default=REPO_ROOT / "odoo.conf")
+    parser.add_argument("--rows", type=int, default=500000)
+    parser.add_argument("--processes", default="1,2,4", help="comma-separated process counts")
+    parser.add_argument("--batch-size", type=int, default=2000)
+    parser.add_argument("--prefetch", type=int, default=4)
+    parser.add_argument(
+        "--compute-us", type=float, default=20.0, help="CPU cost of computing one record",
+    )
+    args = parser.parse_args(argv)
+    params = connection_params(args.config)
+    counts = [int(value) for value in args.processes.split(",")]
+
+    conn = psycopg2.connect(**params)
+    setup(conn, args.rows)
+    out = sys.stdout
+    out.write(
+        f"{args.rows} rows, batches of {args.batch_size}, {args.compute_us:g} us per record\n",
+    )
+
+    # dry run: one batch at a random position, rolled back
+    target = SqlTarget(conn, None, args.compute_us)
+    sample = target.ids(random.randint(0, args.rows - args.batch_size), args.rows, args.batch_size)  # noqa: S311
+    guess = estimate(target, args.rows, sample, counts[0])
+    out.write(
+        f"dry run: {guess.seconds_per_record * 1e6:.0f} us/record, estimated {guess.total_seconds:.1f}s\n",
+    )
+
+    out.write(f"{'mode':<14} {'seconds':>8} {'rows/s':>9} {'longest tx':>11} {'peak RSS':>9}\n")
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        elapsed, rss, rows = pool.apply(run_single, (params, args.compute_us))
+    out.write(
+        f"{'1 transaction':<14} {elapsed:>8.2f} {rows / elapsed:>9.0f} {elapsed:>10.2f}s {rss:>7.0f}MB\n",
+    )
+    if wrong_totals(conn):
+        out.write("  wrong totals!\n")
+
+    for processes in counts:
+        reset(conn, processes)
+        elapsed, longest, rss, rows = run_batched(params, args, processes)
+        out.write(
+            f"{f'{processes} process(es)':<14} {elapsed:>8.2f} {rows / elapsed:>9.0f} {longest:>10.2f}s {rss:>7.0f}MB\n",
+        )
+        if wrong_totals(conn):
+            out.write("  wrong totals!\n")
+
+    # interrupted after part of every range, then resumed from the checkpoints
+    reset(conn, counts[0])
+    _elapsed, _longest, _rss, first = run_batched(
+        params, args, counts[0], stop_after=args.batch_size * 2,
+    )
+    _elapsed, _longest, _rss, rest = run_batched(params, args, counts[0])
+    out.write(
+        f"resume: {first} rows before the interruption, {rest} after, {wrong_totals(conn)} wrong\n",
+    )
+    with conn.cursor() as cr:
+        cr.execute(f"DROP TABLE {TABLE}, {CHECKPOINTS}")
+    conn.commit()
+    conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
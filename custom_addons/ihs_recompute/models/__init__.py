@@ -0,0 +1,3 @@
+# -*- coding: utf-8 -*-
+from . import base
+from . import ihs_recompute_task
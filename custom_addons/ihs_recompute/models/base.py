@@ -0,0 +1,38 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+from __future__ import annotations
+
+import logging
+
+from odoo import models
+
+_logger = logging.getLogger(__name__)
+
+
+class Base(models.AbstractModel):
+    _inherit = "base"
+
+    def _auto_init(self) -> None:
+        """Leave the recompute of the new fields of ``_ihs_recompute_deferred`` to a batched task.
+
+        Adding a stored computed field marks every record of the model for
+        recompute in the upgrade's transaction. A model listing the field in
+        ``_ihs_recompute_deferred`` gets a queued recompute task instead, and
+        the column stays empty until it runs. Required fields are recomputed
+        at once, their NOT NULL constraint needs the values.
+        """
+        super()._auto_init()
+        deferred = []
+        for name in getattr(self, "_ihs_recompute_deferred", ()):
+            field = self._fields[name]
+            ids = self.env.transaction.tocompute.get(field)
+            if not ids:
+                continue
+            if field.required:
+                _logger.warning("%s.%s is required, recomputing it during the upgrade", self._name, name)
+                continue
+            self.env.remove_to_compute(field, self.browse(ids))
+            deferred.append(name)
+        if deferred:
+            task = self.env["ihs.recompute.task"]._schedule(self._name, deferred)  # noqa: SLF001
+            _logger.info("Recompute of %s deferred to task %s", task.name, task.id)
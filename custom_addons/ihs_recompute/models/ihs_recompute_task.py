@@ -0,0 +1,293 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+from __future__ import annotations
+
+import logging
+import random
+from typing import TYPE_CHECKING
+
+from odoo import _, api, fields, models
+from odoo.addons.ihs_recompute.tools import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_PREFETCH,
+    RANGE_LOCK_NS,
+    Checkpoint,
+    Estimate,
+    estimate,
+    run_range,
+    split_ranges,
+)
+from odoo.exceptions import UserError, ValidationError
+from odoo.tools import SQL
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+_logger = logging.getLogger(__name__)
+
+# ranges planned per process, so processes finishing early take over the slack
+RANGES_PER_PROCESS = 4
+
+
+class OrmTarget:
+    """Recompute fields of ``model`` through the ORM, committing each batch with its checkpoint."""
+
+    def __init__(self, checkpoint: IhsRecomputeCheckpoint) -> None:
+        """Recompute the fields of the task of ``checkpoint``."""
+        task = checkpoint.task_id
+        self.env = checkpoint.env
+        self.record = checkpoint
+        self.model = self.env[task.model_name].with_context(
+            active_test=False, tracking_disable=True, mail_notrack=True,
+        )
+        self.fields = [self.model._fields[name] for name in task._field_list()]  # noqa: SLF001
+
+    def ids(self, after: int, end: int, limit: int) -> list[int]:
+        """Return the next IDs of the range, straight from the table."""
+        self.env.cr.execute(SQL(
+            "SELECT id FROM %s WHERE id > %s AND id <= %s ORDER BY id LIMIT %s",
+            SQL.identifier(self.model._table), after, end, limit,  # noqa: SLF001
+        ))
+        return [row[0] for row in self.env.cr.fetchall()]
+
+    def compute(self, ids: Sequence[int]) -> None:
+        """Recompute the batch and write it, with the fields depending on it."""
+        # browsed alone, the batch is its own prefetch set: the ORM loads no more
+        records = self.model.browse(ids)
+        for field in self.fields:
+            self.env.add_to_compute(field, records)
+        self.env.flush_all()
+
+    def save(self, checkpoint: Checkpoint) -> None:
+        """Store ``checkpoint`` and commit the batch with it."""
+        self.record.write({
+            "last_id": checkpoint.last_id,
+            "records_done": checkpoint.records,
+            "batches": checkpoint.batches,
+            "elapsed": checkpoint.elapsed,
+            "state": "done" if checkpoint.done else "pending",
+        })
+        self.env.cr.commit()
+        # drop the records of the batch from the cache, memory stays flat
+        self.env.invalidate_all()
+
+    def rollback(self) -> None:
+        """Abandon the batch."""
+        self.env.cr.rollback()
+
+
+class IhsRecomputeTask(models.Model):
+    _name = "ihs.recompute.task"
+    _description = "Stored Field Recompute"
+    _order = "id desc"
+
+    name = fields.Char(required=True)
+    model_name = fields.Char(string="Model", required=True, help="Technical name of the model")
+    field_names = fields.Char(string="Fields", required=True, help="Comma-separated stored computed fields")
+    state = fields.Selection(
+        [
+            ("draft", "Draft"),
+            ("queued", "Queued"),
+            ("running", "Running"),
+            ("done", "Done"),
+            ("failed", "Failed"),
+        ],
+        default="draft",
+        required=True,
+        copy=False,
+    )
+    batch_size = fields.Integer(default=DEFAULT_BATCH_SIZE, required=True, help="Records per committed batch")
+    prefetch = fields.Integer(
+        default=DEFAULT_PREFETCH, required=True, help="Batches of IDs read ahead in one query",
+    )
+    processes = fields.Integer(default=1, required=True, help="Processes the ID ranges are planned for")
+    checkpoint_ids = fields.One2many("ihs.recompute.checkpoint", "task_id", string="Ranges", readonly=True)
+    records_total = fields.Integer(readonly=True, copy=False)
+    records_done = fields.Integer(compute="_compute_progress")
+    duration = fields.Float(compute="_compute_progress", help="Processing time in seconds, over all processes")
+    estimate_seconds = fields.Float(
+        string="Estimated Time", readonly=True, copy=False, help="Seconds for one process, from a sampled batch",
+    )
+    estimate_wall_seconds = fields.Float(
+        string="Estimated Wall Time", readonly=True, copy=False, help="Seconds with the planned processes",
+    )
+    error_log = fields.Text(readonly=True, copy=False)
+
+    @api.depends("checkpoint_ids.records_done", "checkpoint_ids.elapsed")
+    def _compute_progress(self) -> None:
+        for task in self:
+            task.records_done = sum(task.checkpoint_ids.mapped("records_done"))
+            task.duration = sum(task.checkpoint_ids.mapped("elapsed"))
+
+    @api.constrains("batch_size", "prefetch", "processes")
+    def _check_sizes(self) -> None:
+        if any(min(task.batch_size, task.prefetch, task.processes) < 1 for task in self):
+            raise ValidationError(_("The batch size, prefetch and processes must be positive."))
+
+    @api.constrains("model_name", "field_names")
+    def _check_fields(self) -> None:
+        for task in self:
+            if task.model_name not in self.env:
+                raise ValidationError(_("Unknown model %s", task.model_name))
+            model_fields = self.env[task.model_name]._fields
+            for name in task._field_list():  # noqa: SLF001
+                field = model_fields.get(name)
+                if field is None or not (field.store and field.compute):
+                    raise ValidationError(_("%(field)s is not a stored computed field of %(model)s",
+                                            field=name, model=task.model_name))
+
+    def _field_list(self) -> list[str]:
+        return [name.strip() for name in (self.field_names or "").split(",") if name.strip()]
+
+    @api.model
+    def _schedule(self, model_name: str, field_names: Sequence[str], **values: object) -> IhsRecomputeTask:
+        """Queue the recompute of ``field_names`` on every record of ``model_name``.
+
+        Meant for migration scripts of modules changing how a stored field is
+        computed: the upgrade finishes at once and the cron, or
+        ``scripts/recompute.py``, recomputes the records in batches afterwards.
+        """
+        task = self.create({
+            "name": f"{model_name}: {', '.join(field_names)}",
+            "model_name": model_name,
+            "field_names": ",".join(field_names),
+            **values,
+        })
+        task.action_start()
+        return task
+
+    def action_plan(self):
+        """Split the records into ID ranges of about equal counts, one checkpoint each."""
+        for task in self:
+            if task.state not in ("draft", "failed", "done"):
+                raise UserError(_("Only draft, failed or finished recomputes can be planned again."))
+            table = SQL.identifier(self.env[task.model_name]._table)  # noqa: SLF001
+            parts = task.processes * RANGES_PER_PROCESS
+            self.env.cr.execute(SQL(
+                "SELECT count(*), min(id) - 1, percentile_disc(%s::float8[]) WITHIN GROUP (ORDER BY id) FROM %s",
+                [(index + 1) / parts for index in range(parts)], table,
+            ))
+            count, start, bounds = self.env.cr.fetchone()
+            task.checkpoint_ids.unlink()
+            ranges = split_ranges([start, *bounds]) if count else []
+            task.write({
+                "records_total": count,
+                "error_log": False,
+                "checkpoint_ids": [
+                    fields.Command.create({"start_id": start_id, "end_id": end_id})
+                    for start_id, end_id in ranges
+                ],
+            })
+
+    def action_start(self):
+        """Queue the recompute; the cron processes it in the background."""
+        for task in self:
+            if task.state in ("draft", "done") or not task.checkpoint_ids:
+                task.action_plan()
+            elif task.state != "failed":
+                raise UserError(_("%s is already queued.", task.name))
+        self.write({"state": "queued"})
+        self.env.ref("ihs_recompute.ir_cron_recompute")._trigger()  # noqa: SLF001
+
+    def action_estimate(self):
+        """Dry run: time the recompute of a sampled batch and extrapolate."""
+        for task in self:
+            result = task._estimate()  # noqa: SLF001
+            task.write({"estimate_seconds": result.total_seconds, "estimate_wall_seconds": result.wall_seconds})
+
+    def _estimate(self) -> Estimate:
+        """Time one batch starting at a random ID, rolled back on a cursor of its own."""
+        self.ensure_one()
+        # the rollback of the sample must not touch the caller's transaction
+        with self.env.registry.cursor() as cr:
+            env = self.env(cr=cr)
+            table = SQL.identifier(env[self.model_name]._table)  # noqa: SLF001
+            cr.execute(SQL("SELECT count(*), min(id), max(id) FROM %s", table))
+            count, low, high = cr.fetchone()
+            if not count:
+                return Estimate(0, 0, 0.0, self.processes)
+            # the task may not be committed yet, the other cursor gets a copy
+            task = env["ihs.recompute.task"].new({
+                "name": self.name,
+                "model_name": self.model_name,
+                "field_names": self.field_names,
+            })
+            target = OrmTarget(env["ihs.recompute.checkpoint"].new({"task_id": task}))
+            after = random.randint(low, high) - 1  # noqa: S311
+            sample = target.ids(after, high, self.batch_size) or target.ids(low - 1, high, self.batch_size)
+            return estimate(target, count, sample, self.processes)
+
+    @api.model
+    def _cron_process_tasks(self) -> None:
+        # running tasks were interrupted by a crash or a timeout, resume them first
+        for task in self.search([("state", "in", ("running", "queued"))], order="state desc, id"):
+            task._run()  # noqa: SLF001
+
+    def _run(self) -> None:
+        """Recompute the ranges no other process is working on, committing each batch."""
+        self.ensure_one()
+        if self.state not in ("queued", "running"):
+            return
+        self.state = "running"
+        self.env.cr.commit()
+        for checkpoint_id in self.checkpoint_ids.filtered(lambda cp: cp.state == "pending").ids:
+            self.env.cr.execute(SQL("SELECT pg_try_advisory_lock(%s, %s)", RANGE_LOCK_NS, checkpoint_id))
+            if not self.env.cr.fetchone()[0]:
+                continue
+            try:
+                checkpoint = self.env["ihs.recompute.checkpoint"].browse(checkpoint_id)
+                # read again, another process may have finished it in the meantime
+                checkpoint.invalidate_recordset()
+                self.invalidate_recordset(["state"])
+                if self.state == "failed":
+                    return
+                if checkpoint.state == "pending" and not checkpoint._run():  # noqa: SLF001
+                    return
+            finally:
+                self.env.cr.execute(SQL("SELECT pg_advisory_unlock(%s, %s)", RANGE_LOCK_NS, checkpoint_id))
+        self.invalidate_recordset()
+        if self.state == "running" and all(cp.state == "done" for cp in self.checkpoint_ids):
+            self.state = "done"
+            self.env.cr.commit()
+            _logger.info("Recompute %s done: %d records", self.name, self.records_done)
+
+
+class IhsRecomputeCheckpoint(models.Model):
+    _name = "ihs.recompute.checkpoint"
+    _description = "Stored Field Recompute Range"
+    _order = "task_id, start_id"
+
+    task_id = fields.Many2one("ihs.recompute.task", required=True, ondelete="cascade", index=True)
+    start_id = fields.Integer(required=True, readonly=True, help="Range starts after this ID")
+    end_id = fields.Integer(required=True, readonly=True, help="Range ends with this ID")
+    last_id = fields.Integer(readonly=True, help="Last ID recomputed and committed")
+    records_done = fields.Integer(readonly=True)
+    batches = fields.Integer(readonly=True)
+    elapsed = fields.Float(readonly=True, help="Processing time in seconds")
+    state = fields.Selection([("pending", "Pending"), ("done", "Done")], default="pending", required=True)
+
+    def _checkpoint(self) -> Checkpoint:
+        return Checkpoint(
+            start=self.start_id,
+            end=self.end_id,
+            last_id=self.last_id or None,
+            records=self.records_done,
+            batches=self.batches,
+            elapsed=self.elapsed,
+            done=self.state == "done",
+        )
+
+    def _run(self) -> bool:
+        """Recompute the rest of the range; return False when a batch failed."""
+        self.ensure_one()
+        task = self.task_id
+        try:
+            for progress in run_range(OrmTarget(self), self._checkpoint(), task.batch_size, task.prefetch):
+                _logger.debug("Recompute %s: %d records up to ID %s", task.name, progress.records, progress.last_id)
+        except Exception as exc:
+            _logger.exception("Recompute %s failed in range (%d, %d]", task.name, self.start_id, self.end_id)
+            task.write({"state": "failed", "error_log": f"({self.start_id}, {self.end_id}]: {exc}"})
+            self.env.cr.commit()
+            return False
+        _logger.info("Recompute %s: range (%d, %d] done", task.name, self.start_id, self.end_id)
+        return True
@@ -0,0 +1,112 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Recompute stored fields of an Odoo database in batches, over several processes.
+
+Usage::
+
+    python custom_addons/ihs_recompute/scripts/recompute.py -c odoo.conf -d mydb --model sale.order.line --fields price_total --processes 4
+
+Creates a recompute task (or resumes ``--task``), splits the records into
+ID ranges and runs them in ``--processes`` processes, each committing every
+batch with its range's checkpoint. Interrupted, it resumes where it stopped
+when run again with ``--task``. ``--dry-run`` only prints the estimate
+timed on a sampled batch.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import multiprocessing
+import sys
+from pathlib import Path
+
+import odoo
+from odoo import SUPERUSER_ID, api
+from odoo.modules.registry import Registry
+from odoo.tools import config
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+_logger = logging.getLogger("ihs_recompute.script")
+
+
+def run_task(config_path: str, dbname: str, task_id: int) -> None:
+    """Load the Odoo configuration in a worker process and recompute ranges of the task."""
+    config.parse_config(["-c", config_path])
+    odoo.netsvc.init_logger()
+    with Registry(dbname).cursor() as cr:
+        api.Environment(cr, SUPERUSER_ID, {})["ihs.recompute.task"].browse(task_id)._run()  # noqa: SLF001
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Recompute, or estimate with ``--dry-run``."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-c", "--config", type=Path, default=REPO_ROOT / "odoo.conf")
+    parser.add_argument("-d", "--database", required=True)
+    parser.add_argument("--task", type=int, help="resume this task")
+    parser.add_argument("--model", help="model of the fields")
+    parser.add_argument("--fields", help="comma-separated stored computed fields")
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--batch-size", type=int)
+    parser.add_argument("--prefetch", type=int, help="batches of IDs read ahead in one query")
+    parser.add_argument("--dry-run", action="store_true", help="estimate the time from a sampled batch")
+    args = parser.parse_args(argv)
+    if not args.task and not (args.model and args.fields):
+        parser.error("pass --task, or --model and --fields")
+    config.parse_config(["-c", str(args.config)])
+    odoo.netsvc.init_logger()
+
+    options = {"processes": args.processes}
+    if args.batch_size:
+        options["batch_size"] = args.batch_size
+    if args.prefetch:
+        options["prefetch"] = args.prefetch
+    with Registry(args.database).cursor() as cr:
+        tasks = api.Environment(cr, SUPERUSER_ID, {})["ihs.recompute.task"]
+        if args.task:
+            task = tasks.browse(args.task)
+            task.write(options)
+        else:
+            fields = args.fields.split(",")
+            task = tasks.create({
+                "name": f"{args.model}: {', '.join(fields)}",
+                "model_name": args.model,
+                "field_names": ",".join(fields),
+                **options,
+            })
+        if args.dry_run:
+            result = task._estimate()  # noqa: SLF001
+            if not args.task:
+                task.unlink()
+            out = sys.stdout
+            out.write(f"{result.records} records, sampled {result.sample_size} in {result.sample_seconds:.2f}s\n")
+            out.write(f"{result.seconds_per_record * 1000:.3f} ms per record\n")
+            out.write(f"estimated {result.total_seconds:.0f}s in 1 process, ")
+            out.write(f"{result.wall_seconds:.0f}s in {result.processes}\n")
+            return 0
+        if task.state in ("queued", "running"):
+            _logger.info("Resuming %s: %d of %d records done", task.name, task.records_done, task.records_total)
+        else:
+            task.action_start()
+        task_id = task.id
+
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=run_task, args=(str(args.config), args.database, task_id), name=f"ihs-recompute-{index}")
+        for index in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    with Registry(args.database).cursor() as cr:
+        task = api.Environment(cr, SUPERUSER_ID, {})["ihs.recompute.task"].browse(task_id)
+        _logger.info("%s: %s, %d of %d records in %.0fs", task.name, task.state, task.records_done,
+                     task.records_total, task.duration)
+        return 0 if task.state == "done" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
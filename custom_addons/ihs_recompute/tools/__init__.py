@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+from .engine import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_PREFETCH,
+    RANGE_LOCK_NS,
+    Checkpoint,
+    Estimate,
+    Target,
+    batches,
+    estimate,
+    run_range,
+    split_ranges,
+)
@@ -0,0 +1,169 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Recompute stored fields range by range, one committed batch at a time.
+
+The records to recompute are split into ID ranges, each with a checkpoint:
+the last ID done in the range. A range is processed in batches of
+``batch_size`` IDs read in ID order after the checkpoint, and each batch is
+committed together with the checkpoint, so an interrupted run resumes after
+the last committed batch and memory never holds more than the IDs of
+``prefetch`` batches. Ranges are independent and can be spread over
+processes.
+"""
+
+from __future__ import annotations
+
+import itertools
+import time
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping, Sequence
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_PREFETCH = 4
+# advisory lock namespace of the ranges being processed (first key of the two-key form)
+RANGE_LOCK_NS = 0x1A53
+
+
+class Target(Protocol):
+    """The records to recompute and where their progress is kept."""
+
+    def ids(self, after: int, end: int, limit: int) -> list[int]:
+        """Return up to ``limit`` IDs in ``(after, end]``, in ascending order."""
+
+    def compute(self, ids: Sequence[int]) -> None:
+        """Recompute and write the fields of the records ``ids``."""
+
+    def save(self, checkpoint: Checkpoint) -> None:
+        """Persist ``checkpoint`` and commit it with the batch written before."""
+
+    def rollback(self) -> None:
+        """Abandon the batch being written."""
+
+
+@dataclass
+class Checkpoint:
+    """Progress in the range of IDs ``(start, end]``."""
+
+    start: int
+    end: int
+    last_id: int | None = None
+    records: int = 0
+    batches: int = 0
+    elapsed: float = 0.0
+    done: bool = False
+
+    @property
+    def position(self) -> int:
+        """Return the ID after which the next batch starts."""
+        return self.start if self.last_id is None else self.last_id
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable copy."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> Checkpoint:
+        """Rebuild a checkpoint saved with :meth:`to_dict`."""
+        return cls(**data)
+
+
+@dataclass
+class Estimate:
+    """Time a recompute should take, extrapolated from a sample batch."""
+
+    records: int
+    sample_size: int
+    sample_seconds: float
+    processes: int = 1
+
+    @property
+    def seconds_per_record(self) -> float:
+        """Return the time to recompute one record."""
+        return self.sample_seconds / self.sample_size if self.sample_size else 0.0
+
+    @property
+    def total_seconds(self) -> float:
+        """Return the time to recompute every record in one process."""
+        return self.seconds_per_record * self.records
+
+    @property
+    def wall_seconds(self) -> float:
+        """Return the time to recompute every record with ``processes`` processes.
+
+        Assumes the database is not the bottleneck, a lower bound.
+        """
+        return self.total_seconds / max(self.processes, 1)
+
+
+def split_ranges(bounds: Sequence[int]) -> list[tuple[int, int]]:
+    """Turn increasing boundary IDs into consecutive ``(start, end]`` ranges.
+
+    ``bounds`` starts below the smallest ID and ends with the largest, e.g.
+    ``[0, 2500, 5100, 7400, 10000]`` for four ranges of about equal counts;
+    duplicates (from a skewed ID distribution) are dropped.
+    """
+    points = sorted(set(bounds))
+    return list(itertools.pairwise(points))
+
+
+def batches(target: Target, checkpoint: Checkpoint, batch_size: int, prefetch: int) -> Iterator[list[int]]:
+    """Yield the IDs left in the range of ``checkpoint``, ``batch_size`` at a time.
+
+    IDs are read ``prefetch`` batches at a time, after the checkpoint's
+    position when the generator is resumed: the caller updates it between
+    batches.
+    """
+    while True:
+        window = target.ids(checkpoint.position, checkpoint.end, batch_size * prefetch)
+        for index in range(0, len(window), batch_size):
+            yield window[index : index + batch_size]
+        if len(window) < batch_size * prefetch:
+            return
+
+
+def run_range(
+    target: Target,
+    checkpoint: Checkpoint,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    prefetch: int = DEFAULT_PREFETCH,
+) -> Iterator[Checkpoint]:
+    """Recompute the rest of ``checkpoint``'s range, yielding it after each committed batch.
+
+    The last checkpoint yielded is marked done. A failing batch is rolled back
+    and the error raised, the checkpoint still pointing before it.
+    """
+    for ids in batches(target, checkpoint, batch_size, prefetch):
+        start = time.perf_counter()
+        try:
+            target.compute(ids)
+            checkpoint.last_id = ids[-1]
+            checkpoint.records += len(ids)
+            checkpoint.batches += 1
+            checkpoint.elapsed += time.perf_counter() - start
+            target.save(checkpoint)
+        except BaseException:
+            target.rollback()
+            raise
+        yield checkpoint
+    checkpoint.done = True
+    target.save(checkpoint)
+    yield checkpoint
+
+
+def estimate(target: Target, records: int, sample: Sequence[int], processes: int = 1) -> Estimate:
+    """Time the recompute of the ``sample`` IDs, then roll it back.
+
+    The sample should be a batch as the real run would process it: contiguous
+    IDs, so the records share their pages and related records as they would.
+    """
+    start = time.perf_counter()
+    try:
+        if sample:
+            target.compute(sample)
+        elapsed = time.perf_counter() - start
+    finally:
+        target.rollback()
+    return Estimate(records, len(sample), elapsed, processes)
@@ -0,0 +1,492 @@
+# Copyright 2026 ihs-odoo
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl).
+"""Run the tests of the custom addons in parallel, each in a database cloned from a template.
+
+Usage::
+
+    python scripts/run_tests.py -c odoo.conf --jobs 4 --baseline tests_baseline.json
+
+Addons are discovered on the ``addons_path`` of the config file, outside of
+the Odoo source tree, with the manifest index of ``ihs_manifest_index``.
+Their dependencies (minus the tested addons themselves, whose tests would
+not run if they were already installed) are installed once in a template
+database, named after a digest of the modules, their manifests, the files
+of the ones outside the Odoo source tree, the Odoo release and the extra
+options, and reused while those do not change. Each
+addon then gets a database cloned with ``CREATE DATABASE ... TEMPLATE``, in
+which ``odoo-bin`` installs it with its tests enabled and tagged, ``--jobs``
+addons at a time.
+
+Per-test durations come from the ``Starting ...`` lines Odoo logs for each
+test. The results are written as ``report.json`` and ``junit.xml`` in
+``--report-dir``. With ``--baseline``, tests failing now but not in the
+baseline, and tests slower than the baseline by more than ``--threshold``
+(and ``--min-delta`` seconds) are reported as regressions. Only the local
+PostgreSQL server is used, nothing goes over the network.
+"""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import configparser
+import contextlib
+import datetime as dt
+import hashlib
+import json
+import os
+import re
+import shutil
+import socket
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from xml.etree import ElementTree as ET
+
+import psycopg2
+from psycopg2 import sql
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "custom_addons" / "ihs_manifest_index"))
+
+from scripts.build_index import config_addons_paths
+from tools import DependencyError, ManifestIndex
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_THRESHOLD = 0.5
+DEFAULT_MIN_DELTA = 0.25
+# 2026-10-18 09:12:01,345 4242 INFO dbname odoo.addons.x.tests.test_y: message
+LOG_LINE = re.compile(r"^(\d{4}-\d\d-\d\d \d\d:\d\d:\d\d,\d{3}) \d+ (\w+) \S+ (\S+): (.*)$")
+TEST_START = re.compile(r"^Starting (\S+)(?: \(.*\))? \.\.\.$")
+TEST_FAILURE = re.compile(r"^(FAIL|ERROR): (\S+)")
+LOG_TIME_FORMAT = "%Y-%m-%d %H:%M:%S,%f"
+
+
+@dataclass
+class TestResult:
+    """Outcome of one test method."""
+
+    name: str
+    duration: float = 0.0
+    status: str = "passed"
+    message: str = ""
+
+
+@dataclass
+class AddonResult:
+    """Outcome of the test run of one addon."""
+
+    name: str
+    status: str
+    duration: float
+    returncode: int | None = None
+    tests: list[TestResult] = field(default_factory=list)
+    log: str = ""
+    message: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable copy."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> AddonResult:
+        """Rebuild a result saved with :meth:`to_dict`."""
+        return cls(**{**data, "tests": [TestResult(**test) for test in data.get("tests", ())]})
+
+
+def read_options(config_file: Path) -> dict[str, str]:
+    """Return the ``[options]`` of an Odoo config file."""
+    parser = configparser.ConfigParser()
+    parser.read(config_file)
+    return dict(parser["options"]) if parser.has_section("options") else {}
+
+
+def discover(
+    index: ManifestIndex, odoo_dir: Path, selected: Sequence[str] | None,
+) -> tuple[list[str], list[str]]:
+    """Return the addons to test and the modules to install in the template.
+
+    The addons to test default to the installable ones outside ``odoo_dir``.
+    """
+    manifests = index.manifests()
+    if selected:
+        addons = list(selected)
+    else:
+        addons = [
+            name
+            for name, entry in index.entries.items()
+            if not Path(entry.path).is_relative_to(odoo_dir) and manifests[name].get("installable", True)
+        ]
+    order = index.load_order(addons)
+    tested = set(addons)
+    template = [name for name in order if name not in tested]
+    return [name for name in order if name in tested], template or ["base"]
+
+
+def connect(options: Mapping[str, str], dbname: str = "postgres") -> psycopg2.extensions.connection:
+    """Connect to ``dbname`` with the credentials of the config, in autocommit mode."""
+    params = {
+        "dbname": dbname,
+        "host": options.get("db_host"),
+        "port": options.get("db_port"),
+        "user": options.get("db_user"),
+        "password": options.get("db_password"),
+    }
+    conn = psycopg2.connect(**{key: value for key, value in params.items() if value and value != "False"})
+    conn.autocommit = True
+    return conn
+
+
+def database_exists(conn: psycopg2.extensions.connection, name: str) -> bool:
+    """Return whether the database ``name`` exists."""
+    with conn.cursor() as cr:
+        cr.execute("SELECT 1 FROM pg_database WHERE datname = %s", (name,))
+        return cr.fetchone() is not None
+
+
+def drop_database(conn: psycopg2.extensions.connection, name: str, data_dir: Path) -> None:
+    """Drop the database ``name`` and its filestore, if they exist."""
+    with conn.cursor() as cr:
+        cr.execute("SELECT pg_terminate_backend(pid) FROM pg_stat_activity WHERE datname = %s", (name,))
+        cr.execute(sql.SQL("DROP DATABASE IF EXISTS {}").format(sql.Identifier(name)))
+    shutil.rmtree(data_dir / "filestore" / name, ignore_errors=True)
+
+
+def clone_database(conn: psycopg2.extensions.connection, template: str, name: str, data_dir: Path) -> None:
+    """Create ``name`` as a copy of ``template``, filestore included."""
+    drop_database(conn, name, data_dir)
+    with conn.cursor() as cr:
+        cr.execute(sql.SQL("CREATE DATABASE {} TEMPLATE {}").format(sql.Identifier(name), sql.Identifier(template)))
+    filestore = data_dir / "filestore" / template
+    if filestore.is_dir():
+        shutil.copytree(filestore, data_dir / "filestore" / name)
+
+
+def hash_tree(digest: hashlib._Hash, directory: Path) -> None:
+    """Feed the relative path and content of every file under ``directory`` to ``digest``."""
+    for path in sorted(directory.rglob("*")):
+        relative = path.relative_to(directory)
+        if not path.is_file() or path.suffix == ".pyc" or any(part.startswith((".", "__pycache__")) for part in relative.parts):
+            continue
+        digest.update(f"{relative.as_posix()}\0".encode())
+        with path.open("rb") as handle:
+            digest.update(hashlib.file_digest(handle, "sha256").digest())
+
+
+def template_name(
+    prefix: str, index: ManifestIndex, modules: Iterable[str], odoo_dir: Path, extra: Sequence[str],
+) -> str:
+    """Name the template after everything that changes its content.
+
+    Modules outside ``odoo_dir`` are custom ones being worked on: their files
+    are hashed too, so editing their code or data builds a new template. The
+    Odoo ones only change with the release.
+    """
+    digest = hashlib.sha256()
+    release = odoo_dir / "odoo" / "release.py"
+    digest.update(release.read_bytes() if release.is_file() else b"")
+    for name in sorted(modules):
+        entry = index.entries.get(name)
+        digest.update(f"{name}:{entry.sha256 if entry else ''}\n".encode())
+        if entry and not Path(entry.path).is_relative_to(odoo_dir):
+            hash_tree(digest, Path(entry.path).parent)
+    digest.update("\0".join(extra).encode())
+    return f"{prefix}_tpl_{digest.hexdigest()[:12]}"
+
+
+def free_port() -> int:
+    """Return a TCP port free at the time of the call."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def odoo_command(args: argparse.Namespace, dbname: str, logfile: Path, *options: str) -> list[str]:
+    """Return the ``odoo-bin`` command line running on ``dbname``."""
+    return [
+        sys.executable,
+        str(args.odoo_dir / "odoo-bin"),
+        "-c", str(args.config),
+        "-d", dbname,
+        "--data-dir", str(args.data_dir),
+        "--db-filter", f"^{re.escape(dbname)}$",
+        "--http-port", str(free_port()),
+        "--logfile", str(logfile),
+        "--log-level", "test",
+        "--max-cron-threads", "0",
+        "--stop-after-init",
+        *options,
+        *args.odoo_args,
+    ]
+
+
+def build_template(conn: psycopg2.extensions.connection, args: argparse.Namespace, name: str, modules: Sequence[str]) -> float:
+    """Install ``modules`` in a new template database; return the seconds it took.
+
+    The database is built under a temporary name and renamed once complete, so
+    an interrupted build is never mistaken for a template.
+    """
+    building = f"{name}_building"
+    drop_database(conn, building, args.data_dir)
+    logfile = args.report_dir / "logs" / f"{name}.log"
+    logfile.unlink(missing_ok=True)
+    start = time.perf_counter()
+    process = subprocess.run(  # noqa: S603
+        odoo_command(args, building, logfile, "-i", ",".join(modules)),
+        cwd=args.config.resolve().parent, check=False,
+    )
+    if process.returncode:
+        drop_database(conn, building, args.data_dir)
+        msg = f"Building template {name} failed, see {logfile}"
+        raise RuntimeError(msg)
+    with conn.cursor() as cr:
+        cr.execute(sql.SQL("ALTER DATABASE {} RENAME TO {}").format(sql.Identifier(building), sql.Identifier(name)))
+        # a template cannot be copied while someone is connected to it
+        cr.execute(sql.SQL("ALTER DATABASE {} WITH ALLOW_CONNECTIONS false").format(sql.Identifier(name)))
+    filestore = args.data_dir / "filestore" / building
+    if filestore.is_dir():
+        filestore.rename(args.data_dir / "filestore" / name)
+    # templates of previous module sets or Odoo releases are obsolete
+    with conn.cursor() as cr:
+        cr.execute(
+            "SELECT datname FROM pg_database WHERE datname LIKE %s AND datname != %s",
+            (f"{args.prefix}\\_tpl\\_%", name),
+        )
+        for (obsolete,) in cr.fetchall():
+            drop_database(conn, obsolete, args.data_dir)
+    return time.perf_counter() - start
+
+
+def parse_timestamp(value: str) -> float:
+    """Return the POSIX time of an Odoo log timestamp."""
+    return dt.datetime.strptime(value, LOG_TIME_FORMAT).timestamp()  # noqa: DTZ007
+
+
+def parse_log(addon: str, lines: Iterable[str]) -> list[TestResult]:
+    """Return the tests of ``addon`` found in an Odoo log, with their durations.
+
+    A test lasts from its ``Starting`` line to the next one, or to the end of
+    the tests of the module. Errors logged while it runs fail it, as they fail
+    Odoo's own test run.
+    """
+    prefix = f"odoo.addons.{addon}."
+    tests: dict[str, TestResult] = {}
+    current: TestResult | None = None
+    started = last = 0.0
+    for line in lines:
+        match = LOG_LINE.match(line)
+        if match is None:
+            continue
+        stamp, level, logger, message = match.groups()
+        last = parse_timestamp(stamp)
+        start = TEST_START.match(message) if logger.startswith(prefix) else None
+        if start is not None or logger == "odoo.modules.loading":
+            if current is not None:
+                current.duration += last - started
+                current = None
+            if start is not None:
+                name = f"{logger.removeprefix('odoo.addons.')}.{start.group(1)}"
+                current = tests.setdefault(name, TestResult(name))
+                started = last
+            continue
+        if level in ("ERROR", "CRITICAL"):
+            failure = TEST_FAILURE.match(message)
+            test = current
+            if failure is not None:
+                suffix = f".{failure.group(2)}"
+                test = next((test for test in tests.values() if test.name.endswith(suffix)), current)
+            if test is not None:
+                test.status = "failed" if failure is not None and failure.group(1) == "FAIL" else "error"
+                test.message = test.message or message
+    if current is not None:
+        current.duration += last - started
+    return list(tests.values())
+
+
+def run_addon(conn_lock: threading.Lock, options: Mapping[str, str], args: argparse.Namespace, template: str, addon: str) -> AddonResult:
+    """Test ``addon`` in a fresh clone of ``template``."""
+    dbname = f"{args.prefix}_{addon}"
+    logfile = args.report_dir / "logs" / f"{addon}.log"
+    logfile.unlink(missing_ok=True)
+    start = time.perf_counter()
+    # clones of one template are created one at a time
+    with conn_lock, contextlib.closing(connect(options)) as conn:
+        clone_database(conn, template, dbname, args.data_dir)
+    try:
+        process = subprocess.run(  # noqa: S603
+            odoo_command(args, dbname, logfile, "-i", addon, "--test-enable", "--test-tags", f"/{addon}"),
+            cwd=args.config.resolve().parent, timeout=args.timeout, check=False,
+        )
+    except subprocess.TimeoutExpired:
+        returncode, message = None, f"timed out after {args.timeout}s"
+    else:
+        returncode, message = process.returncode, ""
+    duration = time.perf_counter() - start
+    lines = logfile.read_text(errors="replace").splitlines() if logfile.is_file() else []
+    tests = parse_log(addon, lines)
+    failed = returncode != 0 or any(test.status != "passed" for test in tests)
+    if failed and not message:
+        message = f"odoo-bin exited with {returncode}" if returncode else "tests failed"
+    if not args.keep:
+        with contextlib.closing(connect(options)) as conn:
+            drop_database(conn, dbname, args.data_dir)
+    return AddonResult(addon, "failed" if failed else "passed", duration, returncode, tests, str(logfile), message)
+
+
+def write_json(path: Path, results: Sequence[AddonResult], template_seconds: float) -> None:
+    """Write the results as JSON."""
+    payload = {
+        "date": dt.datetime.now(dt.UTC).isoformat(timespec="seconds"),
+        "template_seconds": round(template_seconds, 3),
+        "addons": {result.name: result.to_dict() for result in results},
+    }
+    path.write_text(json.dumps(payload, indent=2) + "\n")
+
+
+def write_junit(path: Path, results: Sequence[AddonResult]) -> None:
+    """Write the results as JUnit XML, one test suite per addon."""
+    root = ET.Element("testsuites")
+    for result in results:
+        failures = sum(test.status == "failed" for test in result.tests)
+        errors = sum(test.status == "error" for test in result.tests)
+        suite = ET.SubElement(root, "testsuite", {
+            "name": result.name,
+            "tests": str(len(result.tests)),
+            "failures": str(failures),
+            "errors": str(errors + (result.status == "failed" and not failures and not errors)),
+            "time": f"{result.duration:.3f}",
+        })
+        for test in result.tests:
+            classname, _sep, name = test.name.rpartition(".")
+            case = ET.SubElement(suite, "testcase", {
+                "classname": classname, "name": name, "time": f"{test.duration:.3f}",
+            })
+            if test.status != "passed":
+                ET.SubElement(case, "failure" if test.status == "failed" else "error", {"message": test.message})
+        if result.status == "failed" and not failures and not errors:
+            # the run itself failed: install error, crash or timeout
+            case = ET.SubElement(suite, "testcase", {"classname": result.name, "name": "install", "time": "0"})
+            ET.SubElement(case, "error", {"message": result.message}).text = f"See {result.log}"
+    ET.indent(root)
+    ET.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
+
+
+def load_baseline(path: Path) -> dict[str, AddonResult]:
+    """Return the results of a previous ``report.json``."""
+    data = json.loads(path.read_text())
+    return {name: AddonResult.from_dict(result) for name, result in data["addons"].items()}
+
+
+def regressions(
+    results: Iterable[AddonResult], baseline: Mapping[str, AddonResult], threshold: float, min_delta: float,
+) -> list[str]:
+    """Describe the failures and slowdowns that the baseline did not have."""
+    found = []
+    for result in results:
+        before = baseline.get(result.name)
+        if before is None:
+            continue
+        if result.status == "failed" and before.status == "passed" and not result.tests:
+            found.append(f"{result.name}: {result.message}")
+        previous = {test.name: test for test in before.tests}
+        for test in result.tests:
+            old = previous.get(test.name)
+            if old is None:
+                continue
+            if test.status != "passed" and old.status == "passed":
+                found.append(f"{test.name}: now {test.status}")
+            elif test.duration > old.duration * (1 + threshold) and test.duration - old.duration > min_delta:
+                found.append(f"{test.name}: {old.duration:.2f}s -> {test.duration:.2f}s")
+    return found
+
+
+def main(argv: list[str] | None = None) -> int:  # noqa: C901, PLR0915
+    """Run the tests; return 1 on failures or regressions."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-c", "--config", type=Path, default=REPO_ROOT / "odoo.conf")
+    parser.add_argument("addons", nargs="*", help="addons to test (default: every custom addon)")
+    parser.add_argument("--odoo-dir", type=Path, default=REPO_ROOT / "odoo", help="Odoo source tree")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="addons tested at once")
+    parser.add_argument("--prefix", default="ihs_test", help="prefix of the test database names")
+    parser.add_argument("--report-dir", type=Path, default=REPO_ROOT / ".test_runs")
+    parser.add_argument("--data-dir", type=Path, help="Odoo data dir of the test databases (default: in the report dir)")
+    parser.add_argument("--baseline", type=Path, help="report.json of a previous run to compare with")
+    parser.add_argument("--update-baseline", action="store_true", help="write the results to --baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="slowdown ratio of a regression")
+    parser.add_argument("--min-delta", type=float, default=DEFAULT_MIN_DELTA, help="slowdown in seconds of a regression")
+    parser.add_argument("--timeout", type=float, default=3600, help="seconds an addon's tests may take")
+    parser.add_argument("--rebuild", action="store_true", help="build the template again")
+    parser.add_argument("--keep", action="store_true", help="keep the test databases")
+    parser.add_argument("--odoo-args", nargs=argparse.REMAINDER, default=[], help="more odoo-bin options, last")
+    args = parser.parse_args(argv)
+    if args.update_baseline and not args.baseline:
+        parser.error("--update-baseline needs --baseline")
+    if not (args.odoo_dir / "odoo-bin").is_file():
+        parser.error(f"no odoo-bin in {args.odoo_dir}, clone Odoo there or pass --odoo-dir")
+    args.odoo_dir = args.odoo_dir.resolve()
+    args.report_dir = args.report_dir.resolve()
+    args.data_dir = (args.data_dir or args.report_dir / "data").resolve()
+    (args.report_dir / "logs").mkdir(parents=True, exist_ok=True)
+    options = read_options(args.config)
+    out = sys.stdout
+
+    index = ManifestIndex(REPO_ROOT / ".manifest_index.json")
+    index.load()
+    index.scan(config_addons_paths(args.config, args.odoo_dir))
+    index.save()
+    try:
+        addons, modules = discover(index, args.odoo_dir, args.addons)
+    except DependencyError as exc:
+        out.write(f"error: {exc}\n")
+        return 1
+    template = template_name(args.prefix, index, modules, args.odoo_dir, args.odoo_args)
+
+    template_seconds = 0.0
+    with contextlib.closing(connect(options)) as conn:
+        if args.rebuild:
+            drop_database(conn, template, args.data_dir)
+        if not database_exists(conn, template):
+            out.write(f"Building template {template} with {len(modules)} modules\n")
+            try:
+                template_seconds = build_template(conn, args, template, modules)
+            except RuntimeError as exc:
+                out.write(f"error: {exc}\n")
+                return 1
+            out.write(f"Template built in {template_seconds:.1f}s\n")
+
+    out.write(f"Testing {len(addons)} addons, {args.jobs} at a time\n")
+    lock = threading.Lock()
+    results = []
+    with concurrent.futures.ThreadPoolExecutor(args.jobs) as pool:
+        futures = [pool.submit(run_addon, lock, options, args, template, addon) for addon in addons]
+        for future in concurrent.futures.as_completed(futures):
+            result = future.result()
+            results.append(result)
+            out.write(f"{result.status:>6} {result.name} ({len(result.tests)} tests, {result.duration:.1f}s)\n")
+    results.sort(key=lambda result: result.name)
+    write_json(args.report_dir / "report.json", results, template_seconds)
+    write_junit(args.report_dir / "junit.xml", results)
+    out.write(f"Reports in {args.report_dir}\n")
+
+    found = []
+    if args.baseline and args.update_baseline:
+        shutil.copyfile(args.report_dir / "report.json", args.baseline)
+        out.write(f"Baseline {args.baseline} updated\n")
+    elif args.baseline and args.baseline.is_file():
+        found = regressions(results, load_baseline(args.baseline), args.threshold, args.min_delta)
+        for line in found:
+            out.write(f"regression: {line}\n")
+    failed = [result.name for result in results if result.status != "passed"]
+    if failed:
+        out.write(f"Failed: {', '.join(failed)}\n")
+    return 1 if failed or found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())